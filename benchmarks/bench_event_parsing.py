@@ -0,0 +1,74 @@
+"""
+Mede o custo por evento de montar o ``BaseEvent`` a partir de um payload
+REST do API Gateway e de validar o corpo em uma entidade, comparando o
+caminho completo do pydantic com ``from_api_gateway``/``parse_body``.
+
+Uso: ``python -m benchmarks.bench_event_parsing [eventos]`` (padrão: 20000).
+"""
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.interface_adapters.dtos.base_event import BaseEvent
+
+
+class Student(BaseEntity):
+    name: str
+    belt: str
+    age: int
+
+
+_BODY = json.dumps({"id": "1", "name": "Ana", "belt": "preta", "age": 30})
+_EVENT = {
+    "resource": "/alunos/{id}",
+    "path": "/alunos/1",
+    "httpMethod": "PUT",
+    "headers": {f"X-Header-{i}": "valor" for i in range(30)},
+    "multiValueHeaders": {f"X-Header-{i}": ["valor"] for i in range(30)},
+    "queryStringParameters": None,
+    "multiValueQueryStringParameters": None,
+    "pathParameters": {"id": "1"},
+    "requestContext": {
+        "requestId": "abc",
+        "identity": {"sourceIp": "127.0.0.1", "userAgent": "bench"},
+        "authorizer": {"claims": {f"claim{i}": "x" for i in range(20)}},
+    },
+    "body": _BODY,
+    "isBase64Encoded": False,
+}
+
+
+def _per_call(func: Callable[[], Any], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def _validate_twice() -> Student:
+    event = BaseEvent.model_validate(_EVENT)
+    return Student.model_validate(json.loads(event.body or ""))
+
+
+def _fast_path() -> Student:
+    return BaseEvent.from_api_gateway(_EVENT).parse_body(Student)
+
+
+def main(calls: int) -> None:
+    cases: dict[str, Callable[[], Any]] = {
+        "model_validate": lambda: BaseEvent.model_validate(_EVENT),
+        "from_api_gateway": lambda: BaseEvent.from_api_gateway(_EVENT),
+        "evento + json.loads": _validate_twice,
+        "evento + parse_body": _fast_path,
+    }
+    print(f"{'caminho':<22} {'µs/evento':>10}")  # noqa: T201
+    for name, func in cases.items():
+        print(f"{name:<22} {_per_call(func, calls):>10.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,95 @@
+"""
+Compara ``find_all`` (linhas + pydantic) com ``find_all_columnar`` (Arrow)
+e com a leitura em lotes de ``iter_all`` em latência e pico de memória.
+
+Uso: ``python -m benchmarks.bench_find_all [linhas ...]``
+(padrão: 10000 100000 1000000). Requer o extra ``arrow``.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import pyarrow as pa
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.infrastructure.config.app_configuration import (
+    AppConfiguration,
+)
+from dojocommons.infrastructure.persistence.duckdb_service import DuckDbService
+from dojocommons.infrastructure.repositories.duckdb_repository import (
+    DuckDBRepository,
+)
+
+_DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+class Student(BaseEntity):
+    name: str
+    belt: str
+    age: int
+
+
+def _measure(func: Callable[[], Any]) -> tuple[float, float]:
+    gc.collect()
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    arrow_bytes = pa.total_allocated_bytes() - arrow_before
+    del result
+    return elapsed, (peak + arrow_bytes) / 1024**2
+
+
+def _repository(rows: int) -> DuckDBRepository[Student]:
+    db = DuckDbService(AppConfiguration(duckdb_lazy_httpfs=True))
+    repository = DuckDBRepository(db, Student, "students", "/nonexistent")
+    db.execute(
+        "INSERT INTO students SELECT range::VARCHAR AS id, "
+        "'Aluno ' || range AS name, 'faixa ' || (range % 7) AS belt, "
+        "(range % 60)::INTEGER AS age FROM range(?)",
+        (rows,),
+    )
+    return repository
+
+
+def _columnar_to_pylist(
+    repository: DuckDBRepository[Student],
+) -> list[dict[str, Any]]:
+    return repository.find_all_columnar().to_pylist()
+
+
+def _consume_iter_all(repository: DuckDBRepository[Student]) -> int:
+    return sum(1 for _ in repository.iter_all(batch_size=1000))
+
+
+def main(sizes: list[int]) -> None:
+    header = f"{'linhas':>10} {'caminho':<28} {'tempo (s)':>10} {'MB':>8}"
+    print(header)  # noqa: T201
+    for rows in sizes:
+        repository = _repository(rows)
+        cases = {
+            "find_all": repository.find_all,
+            "find_all_columnar": repository.find_all_columnar,
+            "find_all_columnar+to_pylist": partial(
+                _columnar_to_pylist, repository
+            ),
+            "iter_all(batch_size=1000)": partial(
+                _consume_iter_all, repository
+            ),
+        }
+        for name, func in cases.items():
+            elapsed, peak = _measure(func)
+            line = f"{rows:>10} {name:<28} {elapsed:>10.3f} {peak:>8.1f}"
+            print(line)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or list(_DEFAULT_SIZES))
@@ -0,0 +1,77 @@
+"""
+Mede o custo por chamada de montar o SQL das operações do repositório,
+com e sem o cache de statements. O banco é um dublê que não executa nada,
+então o tempo medido é só o do lado Python.
+
+Uso: ``python -m benchmarks.bench_statements [chamadas]`` (padrão: 100000).
+"""
+
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.infrastructure.repositories.duckdb_repository import (
+    DuckDBRepository,
+)
+
+
+class Student(BaseEntity):
+    name: str
+    belt: str
+    age: int
+
+
+class _NullCursor:
+    description = (("id",), ("name",), ("belt",), ("age",))
+
+    @staticmethod
+    def fetchone() -> tuple[Any, ...]:
+        return ("1", "Ana", "preta", 30)
+
+    @staticmethod
+    def fetchall() -> list[tuple[Any, ...]]:
+        return []
+
+
+class _NullDb:
+    def ensure_path_support(self, _path: str) -> None:
+        pass
+
+    def execute(self, _query: str, _params: Any = None) -> _NullCursor:
+        return _NullCursor()
+
+
+def _per_call(func: Callable[[], Any], calls: int, before: Callable) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        before()
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main(calls: int) -> None:
+    repository = DuckDBRepository(_NullDb(), Student, "students", "/none")
+    cases: dict[str, Callable[[], Any]] = {
+        "find_by_id": lambda: repository.find_by_id("1"),
+        "find_all(2 filtros)": lambda: repository.find_all(
+            name="Ana", belt="preta"
+        ),
+        "exists_by_id": lambda: repository.exists_by_id("1"),
+        "update(2 colunas)": lambda: repository.update(
+            "1", {"name": "Ana", "age": 30}
+        ),
+        "delete": lambda: repository.delete("1"),
+    }
+    header = f"{'operação':<22} {'sem cache (µs)':>15} {'com cache (µs)':>15}"
+    print(header)  # noqa: T201
+    for name, func in cases.items():
+        uncached = _per_call(func, calls, repository._statements.clear)  # noqa: SLF001
+        cached = _per_call(func, calls, lambda: None)
+        line = f"{name:<22} {uncached:>15.2f} {cached:>15.2f}"
+        print(line)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, Literal
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    """
+    Operação de um lote: ``POST`` (cria a entidade de ``body``), ``PUT``
+    (aplica ``body`` à entidade ``id``) ou ``DELETE`` (remove ``id``).
+    """
+
+    method: Literal["POST", "PUT", "DELETE"]
+    id: str | None = None
+    body: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    status: int
+    data: Any | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Resultado de um lote, um item por operação e na mesma ordem.
+
+    :param committed: Se as operações foram aplicadas. Quando uma falha,
+        nenhuma é aplicada.
+    :param failed_index: Posição da operação que falhou, se houver.
+    """
+
+    committed: bool
+    items: list[BatchItemResult]
+    failed_index: int | None = None
+
+    @property
+    def status_code(self) -> int:
+        if self.failed_index is None:
+            return HTTPStatus.OK
+        return self.items[self.failed_index].status
@@ -0,0 +1,13 @@
+from collections.abc import Sequence
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.domain.ports.repository import Repository
+
+
+class BulkCreateEntitiesUseCase[T: BaseEntity]:
+    def __init__(self, repository: Repository[T]):
+        self._repository = repository
+
+    def execute(self, entities: Sequence[T]) -> list[T]:
+        """Cria um lote de entidades do tipo T"""
+        return self._repository.create_many(entities)
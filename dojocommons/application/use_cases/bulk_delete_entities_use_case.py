@@ -0,0 +1,13 @@
+from collections.abc import Sequence
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.domain.ports.repository import Repository
+
+
+class BulkDeleteEntitiesUseCase[T: BaseEntity]:
+    def __init__(self, repository: Repository[T]):
+        self._repository = repository
+
+    def execute(self, entity_ids: Sequence[str]) -> None:
+        """Deleta um lote de entidades do tipo T pelos seus IDs"""
+        self._repository.delete_many(entity_ids)
@@ -0,0 +1,14 @@
+from collections.abc import Mapping
+from typing import Any
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.domain.ports.repository import Repository
+
+
+class BulkUpdateEntitiesUseCase[T: BaseEntity]:
+    def __init__(self, repository: Repository[T]):
+        self._repository = repository
+
+    def execute(self, updates: Mapping[str, Mapping[str, Any]]) -> list[T]:
+        """Atualiza um lote de entidades do tipo T, indexado pelo ID"""
+        return self._repository.update_many(updates)
@@ -0,0 +1,159 @@
+from collections.abc import Mapping, Sequence
+from http import HTTPStatus
+from typing import Any
+
+from dojocommons.application.dtos.batch_operation import (
+    BatchItemResult,
+    BatchOperation,
+    BatchResult,
+)
+from dojocommons.application.use_cases.create_entity_use_case import (
+    CreateEntityUseCase,
+)
+from dojocommons.application.use_cases.delete_entity_use_case import (
+    DeleteEntityUseCase,
+)
+from dojocommons.application.use_cases.update_entity_use_case import (
+    UpdateEntityUseCase,
+)
+from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.domain.exceptions.business_exception import BusinessError
+from dojocommons.domain.ports.repository import Repository
+
+
+class _RollbackError(Exception):
+    pass
+
+
+class ExecuteBatchUseCase[T: BaseEntity]:
+    """
+    Executa um lote de criações, atualizações e remoções pelos casos de uso
+    de cada operação, em uma única transação e com uma única gravação dos
+    arquivos ao final.
+    """
+
+    def __init__(
+        self,
+        repository: Repository[T],
+        model_class: type[T],
+        create_use_case: CreateEntityUseCase[T],
+        update_use_case: UpdateEntityUseCase[T],
+        delete_use_case: DeleteEntityUseCase[T],
+    ):
+        self._repository = repository
+        self._model_class = model_class
+        self._create_use_case = create_use_case
+        self._update_use_case = update_use_case
+        self._delete_use_case = delete_use_case
+
+    def execute(
+        self,
+        operations: Sequence[BatchOperation],
+        scope: Mapping[str, Any] | None = None,
+    ) -> BatchResult:
+        """
+        Aplica as operações em ordem. Se uma falhar, a transação é desfeita
+        e as demais são reportadas como não aplicadas (424).
+
+        :param scope: Campos que fixam o pai do lote (por exemplo
+            ``{"dojo_id": "A"}`` em ``/dojos/{dojo_id}/alunos/batch``).
+            Corpos com outro valor nesses campos falham com 400, e ids de
+            entidades de outro pai, com 404.
+        """
+        items: list[BatchItemResult] = []
+        try:
+            with self._repository.transaction():
+                self._apply_all(operations, items, scope or {})
+        except _RollbackError:
+            return self._rolled_back(items, len(operations))
+
+        self._repository.save_to_parquet()
+        return BatchResult(committed=True, items=items)
+
+    def _apply_all(
+        self,
+        operations: Sequence[BatchOperation],
+        items: list[BatchItemResult],
+        scope: Mapping[str, Any],
+    ) -> None:
+        for operation in operations:
+            item = self._apply(operation, scope)
+            items.append(item)
+            if item.error is not None:
+                raise _RollbackError
+
+    def _apply(
+        self, operation: BatchOperation, scope: Mapping[str, Any]
+    ) -> BatchItemResult:
+        try:
+            self._check_scope(operation, scope)
+            return self._dispatch(operation)
+        except BusinessError as e:
+            return BatchItemResult(status=e.status_code, error=e.message)
+        except ValueError as e:
+            return BatchItemResult(status=HTTPStatus.BAD_REQUEST, error=str(e))
+
+    def _check_scope(
+        self, operation: BatchOperation, scope: Mapping[str, Any]
+    ) -> None:
+        body = operation.body or {}
+        for name, value in scope.items():
+            if name in body and str(body[name]) != str(value):
+                msg = f"O campo {name} não corresponde ao caminho."
+                raise BusinessError(msg)
+        if not scope or operation.method == "POST" or operation.id is None:
+            return
+
+        entity = self._repository.find_by_id(operation.id)
+        if entity is None or not all(
+            name in type(entity).model_fields
+            and str(getattr(entity, name)) == str(value)
+            for name, value in scope.items()
+        ):
+            msg = f"ID {operation.id} não encontrado."
+            raise BusinessError(msg, status_code=HTTPStatus.NOT_FOUND)
+
+    def _dispatch(self, operation: BatchOperation) -> BatchItemResult:
+        if operation.method == "POST":
+            if operation.body is None:
+                msg = "Operação POST requer body."
+                raise BusinessError(msg)
+            entity = self._model_class.model_validate(operation.body)
+            created = self._create_use_case.execute(entity)
+            return BatchItemResult(status=HTTPStatus.CREATED, data=created)
+
+        if operation.id is None:
+            msg = f"Operação {operation.method} requer id."
+            raise BusinessError(msg)
+        if operation.method == "PUT":
+            if operation.body is None:
+                msg = "Operação PUT requer body."
+                raise BusinessError(msg)
+            updated = self._update_use_case.execute(
+                operation.id, operation.body
+            )
+            return BatchItemResult(status=HTTPStatus.OK, data=updated)
+
+        self._delete_use_case.execute(operation.id)
+        return BatchItemResult(status=HTTPStatus.NO_CONTENT)
+
+    @staticmethod
+    def _rolled_back(items: list[BatchItemResult], total: int) -> BatchResult:
+        failed_index = len(items) - 1
+        undone = BatchItemResult(
+            status=HTTPStatus.FAILED_DEPENDENCY,
+            error=f"Desfeita: a operação {failed_index} falhou.",
+        )
+        skipped = BatchItemResult(
+            status=HTTPStatus.FAILED_DEPENDENCY,
+            error=f"Não executada: a operação {failed_index} falhou.",
+        )
+        return BatchResult(
+            committed=False,
+            items=[
+                *([undone] * failed_index),
+                items[failed_index],
+                *([skipped] * (total - failed_index - 1)),
+            ],
+            failed_index=failed_index,
+        )
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from dojocommons.domain.entities.base_entity import BaseEntity
 from dojocommons.domain.ports.repository import Repository
 
@@ -6,5 +8,7 @@ class GetEntityUseCase[T: BaseEntity]:
     def __init__(self, repository: Repository[T]):
         self.repository = repository
 
-    def execute(self, entity_id: str) -> T | None:
-        return self.repository.find_by_id(entity_id)
+    def execute(
+        self, entity_id: str, fields: Sequence[str] | None = None
+    ) -> T | None:
+        return self.repository.find_by_id(entity_id, fields=fields)
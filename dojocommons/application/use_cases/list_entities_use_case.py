@@ -1,15 +1,54 @@
+from collections.abc import Sequence
 from typing import Any
 
 from dojocommons.domain.entities.base_entity import BaseEntity
 from dojocommons.domain.ports.repository import Repository
+from dojocommons.domain.value_objects.page import Page
 
 
 class ListEntitiesUseCase[T: BaseEntity]:
     def __init__(self, repository: Repository[T]):
         self._repository = repository
 
-    def execute(self, filters: dict[str, Any] | None = None) -> list[T]:
+    def execute(
+        self,
+        filters: dict[str, Any] | None = None,
+        fields: Sequence[str] | None = None,
+        order_by: str | None = None,
+    ) -> list[T]:
         """Lista todas as entidades do tipo T"""
         if filters is None:
             filters = {}
-        return self._repository.find_all(**filters)
+        return self._repository.find_all(
+            order_by=order_by, fields=fields, **filters
+        )
+
+    def execute_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: str | None = None,
+        filters: dict[str, Any] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Page[T]:
+        """Lista uma página de entidades do tipo T"""
+        if filters is None:
+            filters = {}
+        return self._repository.find_page(
+            limit, cursor=cursor, order_by=order_by, fields=fields, **filters
+        )
+
+    def execute_count(
+        self,
+        filters: dict[str, Any] | None = None,
+        group_by: Sequence[str] | None = None,
+    ) -> int | list[dict[str, Any]]:
+        """
+        Conta as entidades do tipo T; com ``group_by``, retorna a contagem
+        de cada grupo
+        """
+        if filters is None:
+            filters = {}
+        if group_by:
+            return self._repository.aggregate(group_by=group_by, **filters)
+        return self._repository.count(**filters)
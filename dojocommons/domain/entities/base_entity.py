@@ -3,6 +3,15 @@ from pydantic import BaseModel, Field
 from dojocommons.domain.value_objects.id_generator import IdGenerator
 
 
+class Indexed:
+    """
+    Marca um campo da entidade para receber um índice secundário, usado
+    nos filtros de igualdade sobre ele::
+
+        dojo_id: Annotated[str, Indexed()]
+    """
+
+
 class BaseEntity(BaseModel):
     """Modelo completo com ID"""
 
@@ -1,13 +1,54 @@
-from typing import Protocol
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager
+from typing import Any, Protocol
 
 from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.domain.value_objects.page import Page
+from dojocommons.domain.value_objects.upsert_result import UpsertResult
 
 
 class Repository[T: BaseEntity](Protocol):
     def create(self, entity: T) -> T: ...
-    def find_by_id(self, entity_id: str) -> T | None: ...
-    def find_all(self, **filters) -> list[T]: ...
+    def find_by_id(
+        self, entity_id: str, fields: Sequence[str] | None = None
+    ) -> T | None: ...
+    def find_all(
+        self,
+        order_by: str | None = None,
+        fields: Sequence[str] | None = None,
+        **filters,
+    ) -> list[T]: ...
+    def iter_all(
+        self,
+        batch_size: int = 1000,
+        order_by: str | None = None,
+        fields: Sequence[str] | None = None,
+        **filters,
+    ) -> Iterator[T]: ...
+    def find_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: str | None = None,
+        fields: Sequence[str] | None = None,
+        **filters,
+    ) -> Page[T]: ...
+    def count(self, **filters) -> int: ...
+    def aggregate(
+        self,
+        group_by: Sequence[str] = (),
+        metrics: Sequence[str] = ("count",),
+        **filters,
+    ) -> list[dict[str, Any]]: ...
     def update(self, entity_id: str, updates: dict) -> T | None: ...
     def delete(self, entity_id: str) -> None: ...
     def exists_by_id(self, entity_id: str) -> bool: ...
+    def create_many(self, entities: Sequence[T]) -> list[T]: ...
+    def upsert(self, entity: T) -> UpsertResult[T]: ...
+    def upsert_many(self, entities: Sequence[T]) -> UpsertResult[T]: ...
+    def update_many(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> list[T]: ...
+    def delete_many(self, entity_ids: Sequence[str]) -> None: ...
+    def transaction(self) -> AbstractContextManager[None]: ...
     def save_to_parquet(self) -> None: ...
@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Self
+
+from pydantic_core import to_jsonable_python
+
+from dojocommons.domain.exceptions.business_exception import BusinessError
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    """
+    Página de resultados de uma listagem paginada.
+
+    :param items: Entidades da página, na ordem da listagem.
+    :param next_cursor: Cursor opaco da próxima página, ou ``None`` quando
+        esta é a última.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Posição de uma listagem por keyset: a coluna de ordenação e os
+    valores (``order_value``, ``id``) do último item entregue.
+
+    É trafegado como JSON codificado em base64url, opaco para o cliente.
+    """
+
+    order_by: str
+    order_value: Any
+    last_id: str
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            {"o": self.order_by, "v": self.order_value, "id": self.last_id},
+            default=to_jsonable_python,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> Self:
+        """
+        Decodifica um cursor produzido por ``encode``.
+
+        :raises BusinessError: Se o cursor estiver malformado (400).
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(
+                order_by=data["o"], order_value=data["v"], last_id=data["id"]
+            )
+        except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+            msg = "Cursor de paginação inválido."
+            raise BusinessError(msg) from exc
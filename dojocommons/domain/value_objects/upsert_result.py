@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class UpsertResult[T]:
+    """
+    Resultado de um upsert, separando as entidades inseridas das que já
+    existiam e foram sobrescritas.
+    """
+
+    created: list[T] = field(default_factory=list)
+    updated: list[T] = field(default_factory=list)
@@ -10,6 +10,8 @@ class AppConfiguration(BaseSettings):
     aws_access_key_id: str | None = None
     aws_secret_access_key: str | None = None
     aws_endpoint: str | None = None
+    duckdb_extension_directory: str | None = None
+    duckdb_lazy_httpfs: bool = False
 
     @property
     def s3_file_path(self) -> str:
@@ -0,0 +1,123 @@
+import threading
+from typing import Any, ClassVar
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.infrastructure.config.app_configuration import (
+    AppConfiguration,
+)
+from dojocommons.infrastructure.logging.logger import logger
+from dojocommons.infrastructure.persistence.duckdb_service import DuckDbService
+from dojocommons.infrastructure.repositories.duckdb_repository import (
+    DuckDBRepository,
+)
+
+
+class DuckDbRegistry:
+    """
+    Registro por processo de serviços DuckDB e repositórios hidratados.
+
+    Em containers Lambda "quentes" o mesmo processo atende várias
+    invocações. O registro entrega um único ``DuckDbService`` por
+    ``AppConfiguration`` e mantém os repositórios já criados, de forma que
+    a conexão, a configuração do S3 e as tabelas carregadas dos arquivos
+    parquet sejam reaproveitadas entre invocações.
+    """
+
+    _services: ClassVar[dict[str, DuckDbService]] = {}
+    _repositories: ClassVar[dict[tuple[str, str], DuckDBRepository[Any]]] = {}
+    _arguments: ClassVar[
+        dict[tuple[str, str], tuple[str, dict[str, Any]]]
+    ] = {}
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+
+    @classmethod
+    def get_service(cls, cfg: AppConfiguration) -> DuckDbService:
+        """
+        Retorna o serviço DuckDB associado à configuração, criando-o na
+        primeira chamada (ou após ``reset``).
+        """
+        key = cls._key(cfg)
+        with cls._lock:
+            service = cls._services.get(key)
+            if service is None or service.closed:
+                cls._discard_repositories(key)
+                service = DuckDbService(cfg)
+                cls._services[key] = service
+                logger.debug("DuckDB service registered", app=cfg.app_name)
+            return service
+
+    @classmethod
+    def get_repository[T: BaseEntity](
+        cls,
+        cfg: AppConfiguration,
+        model_class: type[T],
+        table_name: str,
+        parquet_path: str,
+        **options: Any,
+    ) -> DuckDBRepository[T]:
+        """
+        Retorna o repositório da tabela, reaproveitando a instância (e a
+        tabela já hidratada) criada em invocações anteriores.
+
+        As ``options`` são repassadas ao construtor do repositório na
+        primeira criação; as chamadas seguintes precisam repetir o mesmo
+        modelo, ``parquet_path`` e ``options``.
+
+        :raises ValueError: Se a tabela já estiver registrada com outro
+            modelo, caminho ou opções.
+        """
+        key = cls._key(cfg)
+        with cls._lock:
+            service = cls.get_service(cfg)
+            repository = cls._repositories.get((key, table_name))
+            if repository is not None:
+                if repository.model_class is not model_class:
+                    msg = (
+                        f"Tabela {table_name} já registrada para o modelo "
+                        f"{repository.model_class.__name__}."
+                    )
+                    raise ValueError(msg)
+                if cls._arguments[key, table_name] != (parquet_path, options):
+                    msg = (
+                        f"Tabela {table_name} já registrada com outro "
+                        "parquet_path ou outras opções."
+                    )
+                    raise ValueError(msg)
+                return repository
+
+            repository = DuckDBRepository(
+                db=service,
+                model_class=model_class,
+                table_name=table_name,
+                parquet_path=parquet_path,
+                **options,
+            )
+            cls._repositories[key, table_name] = repository
+            cls._arguments[key, table_name] = (parquet_path, options)
+            return repository
+
+    @classmethod
+    def reset(cls, cfg: AppConfiguration | None = None) -> None:
+        """
+        Fecha o serviço da configuração informada (ou de todas, quando
+        ``cfg`` é ``None``) e descarta os repositórios associados.
+
+        Alterações não persistidas com ``save_to_parquet`` são perdidas.
+        """
+        with cls._lock:
+            keys = list(cls._services) if cfg is None else [cls._key(cfg)]
+            for key in keys:
+                cls._discard_repositories(key)
+                service = cls._services.pop(key, None)
+                if service is not None and not service.closed:
+                    service.close()
+
+    @classmethod
+    def _discard_repositories(cls, key: str) -> None:
+        for repository_key in [k for k in cls._repositories if k[0] == key]:
+            del cls._repositories[repository_key]
+            del cls._arguments[repository_key]
+
+    @staticmethod
+    def _key(cfg: AppConfiguration) -> str:
+        return cfg.model_dump_json()
@@ -1,3 +1,5 @@
+import contextlib
+from collections.abc import Iterator
 from typing import Any
 
 import duckdb
@@ -6,24 +8,49 @@ from dojocommons.infrastructure.config.app_configuration import (
     AppConfiguration,
 )
 from dojocommons.infrastructure.logging.logger import logger
+from dojocommons.infrastructure.persistence.object_storage import (
+    ObjectStorage,
+)
+
+_REMOTE_PREFIXES = ("s3://", "s3a://", "s3n://", "http://", "https://")
 
 
 class DuckDbService:
     def __init__(self, cfg: AppConfiguration):
         self._cfg = cfg
         self._conn = duckdb.connect()
-        self._configure_s3()
+        self._closed = False
+        self._httpfs_loaded = False
+        self._storage: ObjectStorage | None = None
+        self._configure_extensions()
+        if not self._cfg.duckdb_lazy_httpfs:
+            self._configure_s3(install=True)
         logger.debug("DuckDB initialized", endpoint=self._cfg.aws_endpoint)
 
-    def _configure_s3(self):
+    def _configure_extensions(self):
         self._conn.execute("SET home_directory='/tmp'")
-        self._conn.execute("INSTALL httpfs; LOAD httpfs;")
+
+        if self._cfg.duckdb_extension_directory:
+            # Extensões pré-empacotadas: nunca baixar da rede
+            self._conn.execute(
+                "SET extension_directory=?",
+                (self._cfg.duckdb_extension_directory,),
+            )
+            self._conn.execute("SET autoinstall_known_extensions=false")
+
+    def _configure_s3(self, *, install: bool):
+        if install and not self._cfg.duckdb_extension_directory:
+            self._conn.execute("INSTALL httpfs; LOAD httpfs;")
+        else:
+            self._conn.execute("LOAD httpfs;")
 
         if self._cfg.aws_endpoint:
             self._configure_localstack()
         else:
             self._configure_aws()
 
+        self._httpfs_loaded = True
+
     def _configure_localstack(self):
         logger.debug("Configuring DuckDB for LocalStack")
         self._conn.execute("SET s3_access_key_id='test'")
@@ -45,10 +72,63 @@ class DuckDbService:
         self._conn.execute("SET s3_use_ssl=true")
         self._conn.execute("SET s3_url_compatibility_mode=true")
 
+    @property
+    def storage(self) -> ObjectStorage:
+        if self._storage is None:
+            self._storage = ObjectStorage(self._cfg)
+        return self._storage
+
+    @property
+    def httpfs_loaded(self) -> bool:
+        return self._httpfs_loaded
+
+    def ensure_path_support(self, path: str) -> None:
+        """
+        Garante que o DuckDB consiga acessar o caminho informado,
+        carregando e configurando o httpfs no primeiro acesso remoto
+        (``s3://``) quando o carregamento preguiçoso estiver ativo.
+
+        O caminho preguiçoso nunca executa ``INSTALL``: o httpfs deve
+        estar pré-instalado (``duckdb_extension_directory``), para que
+        nenhuma requisição dependa de um download da rede.
+        """
+        if self._httpfs_loaded or not path.startswith(_REMOTE_PREFIXES):
+            return
+
+        logger.debug("Loading httpfs on first remote access", path=path)
+        self._configure_s3(install=False)
+
     def execute(self, query: str, params: tuple | None = None) -> Any:
         if params:
             return self._conn.execute(query, params)
         return self._conn.execute(query)
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Executa o bloco em uma transação: ``COMMIT`` ao final ou
+        ``ROLLBACK`` se ele levantar uma exceção, que é propagada.
+        """
+        self._conn.execute("BEGIN TRANSACTION")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Abre um cursor próprio sobre o mesmo banco. Resultados lidos aos
+        poucos não são invalidados por outras consultas feitas com
+        ``execute`` enquanto estão sendo consumidos.
+        """
+        return self._conn.cursor()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
     def close(self) -> None:
         self._conn.close()
+        self._closed = True
@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from dojocommons.infrastructure.config.app_configuration import (
+    AppConfiguration,
+)
+from dojocommons.infrastructure.logging.logger import logger
+
+
+class ObjectStorage:
+    """
+    Operações sobre os arquivos de persistência que o DuckDB não expõe,
+    tanto em caminhos locais quanto em ``s3://``.
+    """
+
+    def __init__(self, cfg: AppConfiguration):
+        self._cfg = cfg
+        self._client: Any = None
+
+    def list_versions(self, prefix: str) -> dict[str, str]:
+        """
+        Lista os arquivos cujo caminho começa com ``prefix`` e a versão de
+        cada um: o ETag no S3 ou ``mtime_ns-tamanho`` em caminhos locais.
+        Uma única listagem cobre arquivo base, deltas e partições.
+        """
+        if not self._is_s3(prefix):
+            return self._list_local_versions(Path(prefix))
+
+        bucket, key = self._split_s3(prefix)
+        paginator = self._s3().get_paginator("list_objects_v2")
+        return {
+            f"s3://{bucket}/{item['Key']}": item["ETag"]
+            for page in paginator.paginate(Bucket=bucket, Prefix=key)
+            for item in page.get("Contents", [])
+        }
+
+    @staticmethod
+    def _list_local_versions(prefix: Path) -> dict[str, str]:
+        if not prefix.parent.is_dir():
+            return {}
+
+        versions = {}
+        for entry in prefix.parent.iterdir():
+            if not entry.name.startswith(prefix.name):
+                continue
+            files = entry.rglob("*") if entry.is_dir() else [entry]
+            for file in files:
+                if file.is_file():
+                    stat = file.stat()
+                    versions[str(file)] = f"{stat.st_mtime_ns}-{stat.st_size}"
+        return versions
+
+    def delete(self, path: str) -> None:
+        """Remove o arquivo, ignorando-o se já não existir."""
+        if not self._is_s3(path):
+            Path(path).unlink(missing_ok=True)
+            return
+
+        bucket, key = self._split_s3(path)
+        logger.debug("Deleting S3 object", bucket=bucket, key=key)
+        self._s3().delete_object(Bucket=bucket, Key=key)
+
+    def _s3(self) -> Any:
+        if self._client is None:
+            # Importado sob demanda: o boto3 pesa no cold start e só é
+            # necessário quando há arquivos no S3.
+            import boto3  # noqa: PLC0415
+
+            if self._cfg.aws_endpoint:
+                self._client = boto3.client(
+                    "s3",
+                    endpoint_url=self._cfg.aws_endpoint,
+                    region_name="us-east-1",
+                    aws_access_key_id="test",
+                    aws_secret_access_key="test",  # noqa: S106
+                )
+            else:
+                self._client = boto3.client(
+                    "s3",
+                    region_name=self._cfg.aws_region,
+                    aws_access_key_id=self._cfg.aws_access_key_id,
+                    aws_secret_access_key=self._cfg.aws_secret_access_key,
+                )
+        return self._client
+
+    @staticmethod
+    def _is_s3(path: str) -> bool:
+        return path.startswith("s3://")
+
+    @staticmethod
+    def _split_s3(path: str) -> tuple[str, str]:
+        parsed = urlparse(path)
+        return parsed.netloc, parsed.path.lstrip("/")
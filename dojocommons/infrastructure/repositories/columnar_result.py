@@ -0,0 +1,72 @@
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+class ColumnarResult[T: BaseEntity](Sequence[T]):
+    """
+    Resultado de consulta mantido em formato colunar (tabela Arrow).
+
+    As entidades só são construídas (e validadas pelo pydantic) quando
+    acessadas, e ficam em cache. Quem apenas serializa pode consumir as
+    colunas diretamente com ``to_arrow``, ``to_pylist`` ou ``column``.
+    """
+
+    def __init__(self, table: "pa.Table", model_class: type[T]):
+        self._table = table
+        self._model_class = model_class
+        self._entities: list[T | None] = [None] * table.num_rows
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "Índice fora do intervalo do resultado."
+            raise IndexError(msg)
+
+        entity = self._entities[index]
+        if entity is None:
+            row = self._table.slice(index, 1).to_pylist()[0]
+            entity = self._materialize(index, row)
+        return entity
+
+    def __iter__(self) -> Iterator[T]:
+        offset = 0
+        for batch in self._table.to_batches():
+            for row in batch.to_pylist():
+                entity = self._entities[offset]
+                yield entity or self._materialize(offset, row)
+                offset += 1
+
+    @property
+    def column_names(self) -> list[str]:
+        return self._table.column_names
+
+    def column(self, name: str) -> list[Any]:
+        return self._table.column(name).to_pylist()
+
+    def to_arrow(self) -> "pa.Table":
+        return self._table
+
+    def to_pylist(self) -> list[dict[str, Any]]:
+        """Linhas como dicionários, sem passar pelo modelo pydantic."""
+        return self._table.to_pylist()
+
+    def _materialize(self, index: int, row: dict[str, Any]) -> T:
+        entity = self._model_class.model_validate(row)
+        self._entities[index] = entity
+        return entity
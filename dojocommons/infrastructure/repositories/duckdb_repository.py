@@ -1,85 +1,627 @@
+import contextlib
+import itertools
 import re
-from collections.abc import Iterable
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
 import duckdb
+from pydantic import TypeAdapter, ValidationError
 
 from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.domain.exceptions.business_exception import BusinessError
 from dojocommons.domain.ports.repository import Repository
+from dojocommons.domain.value_objects.page import Page, PageCursor
+from dojocommons.domain.value_objects.upsert_result import UpsertResult
+from dojocommons.infrastructure.logging.logger import logger
 from dojocommons.infrastructure.persistence.duckdb_service import DuckDbService
+from dojocommons.infrastructure.repositories.columnar_result import (
+    ColumnarResult,
+)
+from dojocommons.infrastructure.repositories.entity_cache import (
+    MISSING,
+    CacheStats,
+    EntityCache,
+)
+from dojocommons.infrastructure.repositories.sql_filters import SqlFilters
 from dojocommons.interface_adapters.mappers.model_util import ModelUtil
 
-_COLUMN_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 _TABLE_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+_STATEMENT_CACHE_SIZE = 256
+_AGGREGATE_FUNCTIONS = {
+    "count": "COUNT",
+    "sum": "SUM",
+    "avg": "AVG",
+    "min": "MIN",
+    "max": "MAX",
+}
 
 
 class DuckDBRepository[T: BaseEntity](Repository[T]):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         db: DuckDbService,
         model_class: type[T],
         table_name: str,
         parquet_path: str,
+        *,
+        lazy_load: bool = False,
+        incremental: bool = False,
+        compaction_threshold: int = 10,
+        partition_by: str | None = None,
+        freshness_interval: float | None = None,
+        identity_cache_size: int | None = None,
     ):
+        """
+        :param lazy_load: Modo para cargas de leitura predominante. A tabela
+            começa como uma view sobre ``read_parquet`` (filtros e projeções
+            são empurrados para o arquivo) e só é materializada na primeira
+            escrita.
+        :param incremental: Persiste apenas as linhas alteradas desde o
+            último ``save_to_parquet`` em arquivos delta, em vez de
+            reescrever a tabela inteira.
+        :param compaction_threshold: Quantidade de deltas a partir da qual
+            ``save_to_parquet`` os incorpora a um novo arquivo base.
+        :param partition_by: Coluna usada para particionar os arquivos no
+            layout Hive (``{tabela}/{coluna}=valor/``). Filtros sobre ela
+            leem apenas as partições correspondentes (com ``lazy_load``).
+        :param freshness_interval: Intervalo mínimo, em segundos, entre
+            verificações da versão dos arquivos de origem (ETag no S3,
+            mtime/tamanho em disco). Se mudaram, a tabela é recarregada
+            antes de atender a operação. ``None`` desativa a verificação.
+        :param identity_cache_size: Ativa um identity map LRU com até esse
+            número de ids para ``find_by_id`` e ``exists_by_id``, incluindo
+            ausências. Escritas feitas pelo repositório o mantêm coerente;
+            a recarga dos arquivos o esvazia.
+        """
+        if compaction_threshold < 1:
+            msg = "compaction_threshold deve ser maior que zero."
+            raise ValueError(msg)
+        if partition_by is not None:
+            if partition_by not in model_class.model_fields:
+                msg = f"Coluna de partição inválida: {partition_by}"
+                raise ValueError(msg)
+            if incremental:
+                msg = "Persistência incremental não suporta particionamento."
+                raise ValueError(msg)
+
         self._db = db
         self._model_class = model_class
+        self._columns = frozenset(model_class.model_fields)
+        self._statements: dict[tuple[Any, ...], str] = {}
+        self._adapters: dict[str, TypeAdapter[Any]] = {}
+        self._cache: EntityCache[T] | None = (
+            EntityCache(identity_cache_size) if identity_cache_size else None
+        )
         self._table_name = table_name
         self._parquet_path = parquet_path
+        self._lazy_load = lazy_load
+        self._incremental = incremental
+        self._compaction_threshold = compaction_threshold
+        self._partition_by = partition_by
+        self._freshness_interval = freshness_interval
+        self._source_signature: frozenset[tuple[str, str]] | None = None
+        self._checked_at = 0.0
+        self._materialized = True
+        self._touched_ids: set[str] = set()
+        self._version = 0
+        self._flushed_version = 0
+        self._reloads = 0
+        self._in_transaction = False
+        self._instance_id = uuid.uuid4().hex[:12]
+        self._keyed = True
 
         self._validate_table_name()
         self._ensure_table_exists()
 
+    @property
+    def model_class(self) -> type[T]:
+        return self._model_class
+
+    @property
+    def table_name(self) -> str:
+        return self._table_name
+
     def _validate_table_name(self) -> None:
         if not _TABLE_PATTERN.match(self._table_name):
             msg = f"Nome de tabela inválido: {self._table_name}"
             raise ValueError(msg)
 
+    @property
+    def materialized(self) -> bool:
+        return self._materialized
+
+    @property
+    def version(self) -> int:
+        """Contador de mutações feitas por este repositório."""
+        return self._version
+
+    @property
+    def flushed_version(self) -> int:
+        """Versão persistida pelo último ``save_to_parquet`` bem-sucedido."""
+        return self._flushed_version
+
+    @property
+    def dirty(self) -> bool:
+        return self._version != self._flushed_version
+
+    @property
+    def state_token(self) -> str:
+        """
+        Identifica o estado dos dados visto por este repositório: muda a
+        cada mutação e a cada recarga dos arquivos, e é único por instância.
+        Serve como validador barato (ETag) das respostas desde que escritas
+        de outros processos cheguem via ``freshness_interval``.
+        """
+        self._ensure_fresh()
+        return f"{self._instance_id}.{self._reloads}.{self._version}"
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Contadores do identity map, ou ``None`` se estiver desativado."""
+        return None if self._cache is None else self._cache.stats
+
     def _ensure_table_exists(self) -> None:
+        self._record_source_signature()
         try:
-            self._create_table_from_parquet()
+            if self._lazy_load:
+                self._create_view_from_parquet()
+            else:
+                self._create_table_from_parquet()
+                self._add_primary_key()
+                self._create_indexes()
         except (duckdb.IOException, duckdb.CatalogException):
             self._create_table_from_model()
 
+    def reload(self) -> None:
+        """
+        Descarta a tabela carregada e a hidrata novamente a partir dos
+        arquivos. Alterações ainda não persistidas são perdidas.
+        """
+        kind = "TABLE" if self._materialized else "VIEW"
+        self._db.execute(f"DROP {kind} IF EXISTS {self._table_name};")
+        self._touched_ids.clear()
+        self._flushed_version = self._version
+        self._reloads += 1
+        if self._cache is not None:
+            self._cache.clear()
+        self._ensure_table_exists()
+
+    def _ensure_fresh(self) -> None:
+        if self._freshness_interval is None or self._in_transaction:
+            return
+
+        now = time.monotonic()
+        if now - self._checked_at < self._freshness_interval:
+            return
+
+        self._checked_at = now
+        if self._read_source_signature() == self._source_signature:
+            return
+
+        if self.dirty:
+            logger.warning(
+                "Arquivos de origem alterados com mudanças locais pendentes; "
+                "recarga adiada",
+                table=self._table_name,
+            )
+            return
+
+        logger.debug("Arquivos de origem alterados", table=self._table_name)
+        self.reload()
+
+    def _record_source_signature(self) -> None:
+        if self._freshness_interval is None:
+            return
+
+        self._source_signature = self._read_source_signature()
+        self._checked_at = time.monotonic()
+
+    def _read_source_signature(self) -> frozenset[tuple[str, str]]:
+        prefix = f"{self._parquet_path}/{self._table_name}"
+        versions = self._db.storage.list_versions(prefix)
+        return frozenset(
+            (path, version)
+            for path, version in versions.items()
+            if self._is_source_file(path[len(prefix) :])
+        )
+
+    @staticmethod
+    def _is_source_file(suffix: str) -> bool:
+        # Arquivo base, deltas ou arquivos dentro do diretório de partições
+        return suffix == ".parquet" or suffix.startswith((".delta-", "/"))
+
+    @property
+    def _parquet_file(self) -> str:
+        return f"{self._parquet_path}/{self._table_name}.parquet"
+
+    @property
+    def _delta_pattern(self) -> str:
+        return f"{self._parquet_path}/{self._table_name}.delta-*.parquet"
+
+    @property
+    def _partition_dir(self) -> str:
+        return f"{self._parquet_path}/{self._table_name}"
+
+    @property
+    def _partition_pattern(self) -> str:
+        return f"{self._partition_dir}/**/*.parquet"
+
+    def _source_query(self) -> str:
+        """SELECT que reconstrói a tabela a partir dos arquivos parquet."""
+        if self._partition_by is not None:
+            return self._partitioned_source_query()
+
+        file_path = self._parquet_file
+        self._db.ensure_path_support(file_path)
+        if not self._incremental:
+            return f"SELECT * FROM read_parquet('{file_path}')"  # noqa: S608
+        return self._merged_source_query(self._list_delta_files())
+
+    def _partitioned_source_query(self) -> str:
+        self._db.ensure_path_support(self._partition_dir)
+        # O tipo da coluna vem do modelo, e não da inferência do Hive
+        field = self._model_class.model_fields[self._partition_by]
+        sql_type = ModelUtil.pydantic_type_to_sql(field.annotation)
+        return (
+            f"SELECT * FROM read_parquet('{self._partition_pattern}', "  # noqa: S608
+            "hive_partitioning=true, "
+            f"hive_types={{'{self._partition_by}': {sql_type}}})"
+        )
+
+    def _merged_source_query(self, delta_files: list[str]) -> str:
+        """Combina o arquivo base com os deltas (o mais recente vence)."""
+        base_query = f"SELECT * FROM read_parquet('{self._parquet_file}')"  # noqa: S608
+        base_exists = self._file_exists(self._parquet_file)
+        if not delta_files:
+            if not base_exists:
+                msg = f"Nenhum arquivo parquet para {self._table_name}"
+                raise duckdb.IOException(msg)
+            return base_query
+
+        file_list = ", ".join(f"'{file}'" for file in delta_files)
+        deltas = f"read_parquet([{file_list}], union_by_name=true)"
+        latest = (
+            "SELECT * EXCLUDE (_delta_op, _delta_seq) "  # noqa: S608
+            f"FROM {deltas} QUALIFY row_number() OVER "
+            "(PARTITION BY id ORDER BY _delta_seq DESC) = 1 "
+            "AND _delta_op = 'upsert'"
+        )
+        if not base_exists:
+            return latest
+
+        return (
+            f"{base_query} WHERE id NOT IN (SELECT id FROM {deltas}) "  # noqa: S608
+            f"UNION ALL BY NAME {latest}"
+        )
+
+    def _list_delta_files(self) -> list[str]:
+        query = "SELECT file FROM glob(?) ORDER BY file;"
+        cursor = self._db.execute(query, (self._delta_pattern,))
+        return [row[0] for row in cursor.fetchall()]
+
+    def _file_exists(self, file_path: str) -> bool:
+        query = "SELECT count(*) FROM glob(?);"
+        return bool(self._db.execute(query, (file_path,)).fetchone()[0])
+
     def _create_table_from_parquet(self) -> None:
-        file_path = f"{self._parquet_path}/{self._table_name}.parquet"
         query = (
-            "CREATE TABLE IF NOT EXISTS "  # noqa: S608
-            f"{self._table_name} AS SELECT * "
-            f"FROM read_parquet('{file_path}');"
+            "CREATE TABLE IF NOT EXISTS "
+            f"{self._table_name} AS {self._source_query()};"
         )
         self._db.execute(query)
 
+    def _create_view_from_parquet(self) -> None:
+        query = (
+            "CREATE VIEW IF NOT EXISTS "
+            f"{self._table_name} AS {self._source_query()};"
+        )
+        self._db.execute(query)
+        self._materialized = False
+
     def _create_table_from_model(self) -> None:
-        sql = ModelUtil.generate_create_table_sql(self._model_class)
+        sql = ModelUtil.generate_create_table_sql(
+            self._model_class, self._table_name
+        )
         self._db.execute(sql)
+        self._create_indexes()
+        self._materialized = True
+
+    def _add_primary_key(self) -> None:
+        """
+        Tabelas carregadas com ``CREATE TABLE AS`` não herdam a chave
+        primária do modelo; sem ela não há ``ON CONFLICT``.
+        """
+        try:
+            self._db.execute(
+                f"ALTER TABLE {self._table_name} ADD PRIMARY KEY (id);"
+            )
+        except duckdb.CatalogException:
+            # A tabela já tem chave primária
+            self._keyed = True
+        except duckdb.ConstraintException:
+            logger.warning(
+                "Ids duplicados ou nulos nos arquivos de origem; tabela "
+                "carregada sem chave primária",
+                table=self._table_name,
+            )
+            self._keyed = False
+        else:
+            self._keyed = True
+
+    def _create_indexes(self) -> None:
+        """Cria os índices dos campos do modelo marcados com ``Indexed``."""
+        for sql in ModelUtil.generate_create_index_sql(
+            self._model_class, self._table_name
+        ):
+            self._db.execute(sql)
+
+    def _ensure_materialized(self) -> None:
+        """Converte a view preguiçosa em tabela antes da primeira escrita."""
+        if self._materialized:
+            return
+
+        try:
+            self._db.execute(f"DROP VIEW IF EXISTS {self._table_name};")
+        except duckdb.CatalogException:
+            # Já existe uma tabela com esse nome nesta conexão
+            self._materialized = True
+            return
+
+        self._create_table_from_parquet()
+        self._add_primary_key()
+        self._create_indexes()
+        self._materialized = True
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Executa as operações do bloco em uma única transação do DuckDB:
+        todas são aplicadas, ou nenhuma se o bloco levantar uma exceção.
+        Nada é gravado nos arquivos; chame ``save_to_parquet`` depois.
+
+        A view preguiçosa é materializada antes do ``BEGIN`` e a recarga
+        por ``freshness_interval`` fica suspensa até o fim do bloco.
+        """
+        if self._in_transaction:
+            msg = "Já existe uma transação em andamento."
+            raise RuntimeError(msg)
+
+        self._ensure_fresh()
+        self._ensure_materialized()
+        version, touched_ids = self._version, set(self._touched_ids)
+        self._in_transaction = True
+        try:
+            with self._db.transaction():
+                yield
+        except BaseException:
+            self._version, self._touched_ids = version, touched_ids
+            if self._cache is not None:
+                self._cache.clear()
+            raise
+        finally:
+            self._in_transaction = False
 
     def save_to_parquet(self) -> None:
-        file_path = f"{self._parquet_path}/{self._table_name}.parquet"
+        if not self.dirty:
+            # Nada mudou desde o último flush (ou a view preguiçosa ainda
+            # reflete o próprio arquivo)
+            return
+
+        version = self._version
+        if self._incremental:
+            self._save_delta()
+        elif self._partition_by is not None:
+            self._save_partitioned()
+        else:
+            self._save_snapshot()
+        self._touched_ids.clear()
+        self._flushed_version = version
+        self._record_source_signature()
+
+    def _save_snapshot(self) -> None:
+        file_path = self._parquet_file
+        self._db.ensure_path_support(file_path)
         query = f"COPY {self._table_name} TO '{file_path}'"
         query += " (FORMAT PARQUET, COMPRESSION ZSTD)"
         self._db.execute(query)
 
+    def _save_partitioned(self) -> None:
+        """
+        Regrava as partições e remove os arquivos de partições que ficaram
+        vazias, para que linhas excluídas não voltem na próxima carga.
+        """
+        directory = self._partition_dir
+        self._db.ensure_path_support(directory)
+        query = (
+            f"COPY {self._table_name} TO '{directory}' "
+            "(FORMAT PARQUET, COMPRESSION ZSTD, "
+            f"PARTITION_BY ({self._partition_by}), OVERWRITE_OR_IGNORE, "
+            "FILENAME_PATTERN 'data_{i}', RETURN_FILES true)"
+        )
+        written = set(self._db.execute(query).fetchone()[1])
+
+        cursor = self._db.execute(
+            "SELECT file FROM glob(?);", (self._partition_pattern,)
+        )
+        for (file_path,) in cursor.fetchall():
+            if file_path not in written:
+                self._db.storage.delete(file_path)
+
+    def _save_delta(self) -> None:
+        """
+        Grava as linhas alteradas desde o último flush em um novo delta.
+        IDs que não existem mais na tabela viram tombstones.
+        """
+        if not self._touched_ids:
+            return
+
+        seq = time.time_ns()
+        file_path = (
+            f"{self._parquet_path}/{self._table_name}.delta-{seq:020d}.parquet"
+        )
+        self._db.ensure_path_support(file_path)
+        ids = sorted(self._touched_ids)
+        query = (
+            "COPY (SELECT *, 'upsert' AS _delta_op, "  # noqa: S608
+            f"?::BIGINT AS _delta_seq FROM {self._table_name} "
+            "WHERE list_contains(?::VARCHAR[], id) "
+            "UNION ALL BY NAME "
+            "SELECT id, 'delete' AS _delta_op, ?::BIGINT AS _delta_seq "
+            "FROM (SELECT unnest(?::VARCHAR[]) AS id) "
+            f"WHERE id NOT IN (SELECT id FROM {self._table_name})) "
+            f"TO '{file_path}' (FORMAT PARQUET, COMPRESSION ZSTD)"
+        )
+        self._db.execute(query, (seq, ids, seq, ids))
+
+        if len(self._list_delta_files()) >= self._compaction_threshold:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Incorpora os deltas existentes a um novo arquivo base e os remove.
+        Deltas gravados por outras instâncias durante a compactação são
+        preservados e aplicados na próxima carga.
+        """
+        delta_files = self._list_delta_files()
+        if not delta_files:
+            return
+
+        file_path = self._parquet_file
+        self._db.ensure_path_support(file_path)
+        query = (
+            f"COPY ({self._merged_source_query(delta_files)}) "
+            f"TO '{file_path}' (FORMAT PARQUET, COMPRESSION ZSTD)"
+        )
+        self._db.execute(query)
+
+        for delta_file in delta_files:
+            self._db.storage.delete(delta_file)
+        logger.debug(
+            "Deltas compactados",
+            table=self._table_name,
+            deltas=len(delta_files),
+        )
+
     def create(self, entity: T) -> T:
-        if self.exists_by_id(entity.id):
-            msg = f"Entidade com id {entity.id} já existe."
+        """
+        Insere a entidade. A unicidade do ``id`` é garantida pela chave
+        primária da tabela, sem consulta prévia.
+
+        :raises ValueError: Se já existir uma entidade com o mesmo ``id``.
+        """
+        return self.create_many([entity])[0]
+
+    def upsert(self, entity: T) -> UpsertResult[T]:
+        """Insere a entidade ou, se o ``id`` já existir, a sobrescreve."""
+        return self.upsert_many([entity])
+
+    def upsert_many(self, entities: Sequence[T]) -> UpsertResult[T]:
+        """
+        Insere as entidades novas e sobrescreve as já existentes com
+        ``INSERT ... ON CONFLICT``, informando quais foram criadas e quais
+        foram atualizadas.
+        """
+        if not entities:
+            return UpsertResult()
+        self._ensure_fresh()
+        self._ensure_materialized()
+        if not self._keyed:
+            msg = (
+                f"Upsert indisponível: a tabela {self._table_name} foi "
+                "carregada sem chave primária."
+            )
+            raise ValueError(msg)
+        duplicates = self._duplicate_ids(entities)
+        if duplicates:
+            msg = f"Ids repetidos no lote: {duplicates}"
             raise ValueError(msg)
 
-        data = entity.model_dump(exclude_none=True)
-        fields = ", ".join(data.keys())
-        placeholders = ", ".join(["?"] * len(data))
-        values = tuple(data.values())
+        created_ids = set(self._insert_rows(entities, "DO NOTHING"))
+        created = [e for e in entities if e.id in created_ids]
+        updated = [e for e in entities if e.id not in created_ids]
+        if updated:
+            assignments = ", ".join(
+                f"{column} = EXCLUDED.{column}"
+                for column in self._model_class.model_fields
+                if column != "id"
+            )
+            self._insert_rows(updated, f"(id) DO UPDATE SET {assignments}")
 
-        query = (
-            f"INSERT INTO {self._table_name} ({fields}) "  # noqa: S608
-            f"VALUES ({placeholders});"
+        self._mark_changed(*(e.id for e in entities))
+        self._cache_entities(entities)
+        return UpsertResult(created=created, updated=updated)
+
+    def _insert_rows(
+        self, entities: Sequence[T], on_conflict: str | None = None
+    ) -> list[str]:
+        """
+        Caminho comum de inserção (unitária, em lote e upsert): um único
+        INSERT com as colunas desaninhadas de listas. Retorna os ids das
+        linhas efetivamente escritas.
+        """
+        columns = tuple(self._model_class.model_fields)
+        query = self._statement(
+            ("insert", on_conflict),
+            lambda: self._build_insert(columns, on_conflict),
         )
-        self._db.execute(query, values)
-        return entity
+        rows = [entity.model_dump() for entity in entities]
+        values = tuple([row[column] for row in rows] for column in columns)
+        cursor = self._db.execute(query, values)
+        return [row[0] for row in cursor.fetchall()]
+
+    def _cache_entities(self, entities: Iterable[T]) -> None:
+        if self._cache is not None:
+            for entity in entities:
+                self._cache.put(entity.id, entity)
+
+    @staticmethod
+    def _duplicate_ids(entities: Sequence[T]) -> list[str]:
+        counts = Counter(entity.id for entity in entities)
+        return sorted(i for i, count in counts.items() if count > 1)
 
-    def find_by_id(self, entity_id: str) -> T | None:
+    def _build_insert(
+        self, columns: tuple[str, ...], on_conflict: str | None
+    ) -> str:
+        unnested = ", ".join(["UNNEST(?)"] * len(columns))
         query = (
-            f"SELECT * FROM {self._table_name} "  # noqa: S608
-            "WHERE id = ? LIMIT 1;"
+            f"INSERT INTO {self._table_name} "
+            f"({', '.join(columns)}) SELECT {unnested}"
+        )
+        if on_conflict is not None:
+            query += f" ON CONFLICT {on_conflict}"
+        return query + " RETURNING id;"
+
+    def find_by_id(
+        self, entity_id: str, fields: Sequence[str] | None = None
+    ) -> T | None:
+        """
+        :param fields: Campos a ler; ``None`` lê todos. Com projeção, a
+            entidade retornada contém (e serializa) apenas esses campos e
+            o ``id``.
+        """
+        projection = self._resolve_fields(fields)
+        self._ensure_fresh()
+        if self._cache is not None and projection is None:
+            cached = self._cache.get(entity_id)
+            if cached is not MISSING:
+                return cached  # type: ignore[return-value]
+            entity = self._fetch_by_id(entity_id, None)
+            self._cache.put(entity_id, entity)
+            return entity
+        return self._fetch_by_id(entity_id, projection)
+
+    def _fetch_by_id(
+        self, entity_id: str, projection: tuple[str, ...] | None
+    ) -> T | None:
+        query = self._statement(
+            ("find_by_id", projection),
+            lambda: (
+                f"SELECT {self._columns_sql(projection)} "  # noqa: S608
+                f"FROM {self._table_name} WHERE id = ? LIMIT 1;"
+            ),
         )
         cursor = self._db.execute(query, (entity_id,))
         row = cursor.fetchone()
@@ -89,68 +631,649 @@ class DuckDBRepository[T: BaseEntity](Repository[T]):
 
         column_names = [desc[0] for desc in cursor.description]
 
-        return self._build_model(column_names, row)
+        return self._build_model(
+            column_names, row, self._read_model(projection)
+        )
 
-    def find_all(self, order_by: str | None = None, **filters) -> list[T]:
-        query = f"SELECT * FROM {self._table_name}"  # noqa: S608
-        values = None
+    def find_all(
+        self,
+        order_by: str | None = None,
+        fields: Sequence[str] | None = None,
+        **filters,
+    ) -> list[T]:
+        """
+        :param order_by: Coluna de ordenação; precisa ser um campo do
+            modelo.
+        :param fields: Campos a ler; ``None`` lê todos (ver ``find_by_id``).
+        :param filters: Filtros ``coluna=valor`` ou ``coluna__operador=valor``
+            (ver ``SqlFilters``), avaliados pelo DuckDB. Os valores são
+            convertidos para o tipo da coluna, então textos da query string
+            também são aceitos.
+        """
+        projection = self._resolve_fields(fields)
+        self._ensure_fresh()
+        cursor = self._select(order_by, filters, projection)
+        rows = cursor.fetchall()
+        if cursor.description is None:
+            return []
 
-        if filters:
-            self._validate_column_names(filters.keys())
+        column_names = [desc[0] for desc in cursor.description]
+        model = self._read_model(projection)
+        return [self._build_model(column_names, row, model) for row in rows]
 
-            where = " AND ".join([f"{key} = ?" for key in filters])
-            query += " WHERE " + where
-            values = tuple(filters.values())
+    def find_all_columnar(
+        self, order_by: str | None = None, **filters
+    ) -> ColumnarResult[T]:
+        """
+        Variante colunar de ``find_all``: o resultado é buscado como uma
+        tabela Arrow e as entidades só são construídas quando acessadas.
+        Requer o extra opcional ``arrow`` (pyarrow).
 
-        if order_by:
-            query += " ORDER BY " + order_by
+        Não é usada pelo ``ListEntitiesUseCase`` nem pelo
+        ``EntityController``: serve a quem chama o repositório diretamente.
+        Na resposta, o resultado é serializado pelas linhas (``to_pylist``),
+        sem passar pelos serializadores do modelo.
+        """
+        self._ensure_fresh()
+        cursor = self._select(order_by, filters)
+        try:
+            table = cursor.arrow()
+        except ModuleNotFoundError as exc:
+            msg = (
+                "A leitura colunar requer o pyarrow "
+                "(instale dojocommons[arrow])."
+            )
+            raise ImportError(msg) from exc
+        return ColumnarResult(table, self._model_class)
 
-        if values is not None:
-            cursor = self._db.execute(query, values)
-        else:
-            cursor = self._db.execute(query)
+    def count(self, **filters) -> int:
+        """
+        Conta as entidades que atendem aos filtros (mesma gramática de
+        ``find_all``) com um ``COUNT(*)``, sem ler as linhas.
+        """
+        return self.aggregate(**filters)[0]["count"]
+
+    def aggregate(
+        self,
+        group_by: Sequence[str] = (),
+        metrics: Sequence[str] = ("count",),
+        **filters,
+    ) -> list[dict[str, Any]]:
+        """
+        Agrega as entidades no banco e retorna apenas os valores, uma linha
+        por grupo, ordenadas pelas colunas de ``group_by``.
 
+        :param group_by: Colunas de agrupamento; vazio agrega a tabela toda
+            em uma única linha.
+        :param metrics: ``count`` (quantidade de linhas) ou
+            ``coluna__funcao``, com função ``count``, ``sum``, ``avg``,
+            ``min`` ou ``max``. Cada métrica vira uma chave do resultado.
+        :param filters: Filtros, na mesma gramática de ``find_all``.
+        """
+        group_by, metrics = tuple(group_by), tuple(metrics)
+        if not metrics:
+            msg = "Informe ao menos uma métrica."
+            raise ValueError(msg)
+        keys = tuple(filters)
+        query = self._statement(
+            ("aggregate", group_by, metrics, keys),
+            lambda: self._build_aggregate(group_by, metrics, keys),
+        )
+        values = self._filter_values(filters)
+        self._ensure_fresh()
+        cursor = self._db.execute(query, values)
         rows = cursor.fetchall()
         if cursor.description is None:
             return []
 
         column_names = [desc[0] for desc in cursor.description]
-        return [self._build_model(column_names, row) for row in rows]
+        return [dict(zip(column_names, row, strict=False)) for row in rows]
+
+    def _build_aggregate(
+        self,
+        group_by: tuple[str, ...],
+        metrics: tuple[str, ...],
+        keys: tuple[str, ...],
+    ) -> str:
+        self._validate_column_names(group_by)
+        selected = [*group_by]
+        for metric in metrics:
+            column, _, function = metric.rpartition("__")
+            if metric == "count":
+                selected.append('COUNT(*) AS "count"')
+            elif column in self._columns and function in _AGGREGATE_FUNCTIONS:
+                expression = f"{_AGGREGATE_FUNCTIONS[function]}({column})"
+                selected.append(f'{expression} AS "{metric}"')
+            else:
+                msg = f"Métrica inválida: {metric}"
+                raise ValueError(msg)
 
-    def _build_model(self, column_names: list[str], row: Iterable[Any]) -> T:
-        return self._model_class.model_validate(
+        query = (
+            f"SELECT {', '.join(selected)} "  # noqa: S608
+            f"FROM {self._table_name}"
+        )
+        if keys:
+            conditions = SqlFilters.conditions(
+                keys, self._model_class.model_fields
+            )
+            query += " WHERE " + " AND ".join(conditions)
+        if group_by:
+            columns = ", ".join(group_by)
+            query += f" GROUP BY {columns} ORDER BY {columns}"
+        return query
+
+    def find_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: str | None = None,
+        fields: Sequence[str] | None = None,
+        **filters,
+    ) -> Page[T]:
+        """
+        Lista uma página de entidades por keyset em (``order_by``, ``id``),
+        sem OFFSET: cada página custa o mesmo independente da posição.
+
+        :param limit: Quantidade máxima de entidades na página.
+        :param cursor: ``next_cursor`` da página anterior; ``None`` para a
+            primeira página.
+        :param order_by: Coluna de ordenação (crescente, nulos ao final);
+            por padrão ``id``.
+        :param fields: Campos a ler; ``None`` lê todos (ver ``find_by_id``).
+        :raises BusinessError: Se o cursor for inválido ou tiver sido
+            gerado para outra ordenação.
+        """
+        if limit < 1:
+            msg = "O limite da página deve ser maior que zero."
+            raise ValueError(msg)
+        order_by = order_by or "id"
+        if order_by not in self._columns:
+            msg = f"Coluna de ordenação inválida: {order_by}"
+            raise ValueError(msg)
+        keys = tuple(filters)
+        projection = self._resolve_fields(fields)
+        columns = projection
+        if projection is not None and order_by not in projection:
+            # A coluna de ordenação é lida para montar o cursor, mas fica
+            # fora da serialização por não fazer parte da projeção.
+            columns = (*projection, order_by)
+        self._ensure_fresh()
+
+        condition, params = None, []
+        if cursor is not None:
+            condition, params = self._keyset_condition(
+                PageCursor.decode(cursor), order_by
+            )
+
+        query = self._statement(
+            ("find_page", columns, keys, order_by, condition),
+            lambda: self._build_page_select(
+                columns, keys, order_by, condition
+            ),
+        )
+        values = (*self._filter_values(filters), *params, limit + 1)
+
+        result = self._db.execute(query, values)
+        rows = result.fetchall()
+        if result.description is None:
+            return Page(items=[])
+
+        column_names = [desc[0] for desc in result.description]
+        model = self._read_model(projection)
+        items = [
+            self._build_model(column_names, row, model) for row in rows[:limit]
+        ]
+        if len(rows) <= limit:
+            return Page(items=items)
+
+        last = items[-1]
+        next_cursor = PageCursor(
+            order_by=order_by,
+            order_value=getattr(last, order_by),
+            last_id=last.id,
+        )
+        return Page(items=items, next_cursor=next_cursor.encode())
+
+    def _build_page_select(
+        self,
+        columns: tuple[str, ...] | None,
+        keys: tuple[str, ...],
+        order_by: str,
+        keyset: str | None,
+    ) -> str:
+        conditions = SqlFilters.conditions(
+            keys, self._model_class.model_fields
+        )
+        if keyset is not None:
+            conditions.append(keyset)
+
+        query = (
+            f"SELECT {self._columns_sql(columns)} "  # noqa: S608
+            f"FROM {self._table_name}"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if order_by == "id":
+            return query + " ORDER BY id LIMIT ?"
+        return query + f" ORDER BY {order_by} ASC NULLS LAST, id LIMIT ?"
+
+    def _keyset_condition(
+        self, position: PageCursor, order_by: str
+    ) -> tuple[str, list[Any]]:
+        if position.order_by != order_by:
+            msg = "O cursor não corresponde à ordenação solicitada."
+            raise BusinessError(msg)
+        if order_by == "id":
+            return "id > ?", [position.last_id]
+        if position.order_value is None:
+            return f"({order_by} IS NULL AND id > ?)", [position.last_id]
+
+        try:
+            value = self._type_adapter(order_by).validate_python(
+                position.order_value
+            )
+        except ValidationError as exc:
+            msg = "Cursor de paginação inválido."
+            raise BusinessError(msg) from exc
+        condition = (
+            f"({order_by} > ? OR {order_by} IS NULL "
+            f"OR ({order_by} = ? AND id > ?))"
+        )
+        return condition, [value, value, position.last_id]
+
+    def _type_adapter(self, column: str) -> TypeAdapter[Any]:
+        adapter = self._adapters.get(column)
+        if adapter is None:
+            annotation = self._model_class.model_fields[column].annotation
+            adapter = self._adapters[column] = TypeAdapter(annotation)
+        return adapter
+
+    def iter_all(
+        self,
+        batch_size: int = 1000,
+        order_by: str | None = None,
+        fields: Sequence[str] | None = None,
+        **filters,
+    ) -> Iterator[T]:
+        """
+        Variante de ``find_all`` que entrega as entidades sob demanda, uma
+        a uma, lendo no máximo ``batch_size`` linhas por vez.
+        """
+        return itertools.chain.from_iterable(
+            self.iter_batches(batch_size, order_by, fields, **filters)
+        )
+
+    def iter_batches(
+        self,
+        batch_size: int = 1000,
+        order_by: str | None = None,
+        fields: Sequence[str] | None = None,
+        **filters,
+    ) -> Iterator[list[T]]:
+        """
+        Percorre o resultado de ``find_all`` em lotes de até ``batch_size``
+        entidades, sem materializar a tabela inteira: o pico de memória
+        depende do tamanho do lote, não do da tabela.
+
+        A consulta roda em um cursor próprio, então o repositório pode ser
+        usado normalmente enquanto os lotes são consumidos.
+        """
+        if batch_size < 1:
+            msg = "batch_size deve ser maior que zero."
+            raise ValueError(msg)
+        projection = self._resolve_fields(fields)
+        query, values = self._select_query(order_by, filters, projection)
+        self._ensure_fresh()
+        return self._fetch_batches(
+            query, values, batch_size, self._read_model(projection)
+        )
+
+    def _fetch_batches(
+        self,
+        query: str,
+        values: tuple[Any, ...] | None,
+        batch_size: int,
+        model: type[T],
+    ) -> Iterator[list[T]]:
+        cursor = self._db.cursor()
+        try:
+            if values is None:
+                cursor.execute(query)
+            else:
+                cursor.execute(query, values)
+            if cursor.description is None:
+                return
+            column_names = [desc[0] for desc in cursor.description]
+            while rows := cursor.fetchmany(batch_size):
+                yield [
+                    self._build_model(column_names, row, model) for row in rows
+                ]
+        finally:
+            cursor.close()
+
+    def _select(
+        self,
+        order_by: str | None,
+        filters: dict[str, Any],
+        projection: tuple[str, ...] | None = None,
+    ) -> Any:
+        query, values = self._select_query(order_by, filters, projection)
+        if values is not None:
+            return self._db.execute(query, values)
+        return self._db.execute(query)
+
+    def _select_query(
+        self,
+        order_by: str | None,
+        filters: dict[str, Any],
+        projection: tuple[str, ...] | None,
+    ) -> tuple[str, tuple[Any, ...] | None]:
+        keys = tuple(filters)
+        query = self._statement(
+            ("select", projection, keys, order_by),
+            lambda: self._build_select(order_by, keys, projection),
+        )
+        return query, self._filter_values(filters) if filters else None
+
+    def _filter_values(self, filters: dict[str, Any]) -> tuple[Any, ...]:
+        return SqlFilters.values(filters, self._type_adapter)
+
+    def _build_select(
+        self,
+        order_by: str | None,
+        keys: tuple[str, ...],
+        projection: tuple[str, ...] | None,
+    ) -> str:
+        query = (
+            f"SELECT {self._columns_sql(projection)} "  # noqa: S608
+            f"FROM {self._table_name}"
+        )
+        if keys:
+            conditions = SqlFilters.conditions(
+                keys, self._model_class.model_fields
+            )
+            query += " WHERE " + " AND ".join(conditions)
+        if order_by:
+            self._validate_column_names((order_by,))
+            query += " ORDER BY " + order_by
+        return query
+
+    def _statement(
+        self, key: tuple[Any, ...], build: Callable[[], str]
+    ) -> str:
+        """
+        Retorna o SQL da operação ``key`` (operação + formato dos
+        argumentos), montando-o e validando as colunas só na primeira vez.
+        """
+        query = self._statements.get(key)
+        if query is None:
+            query = build()
+            if len(self._statements) >= _STATEMENT_CACHE_SIZE:
+                del self._statements[next(iter(self._statements))]
+            self._statements[key] = query
+        return query
+
+    def _build_model(
+        self,
+        column_names: list[str],
+        row: Iterable[Any],
+        model: type[T] | None = None,
+    ) -> T:
+        return (model or self._model_class).model_validate(
             dict(zip(column_names, row, strict=False))
         )
 
+    def _resolve_fields(
+        self, fields: Sequence[str] | None
+    ) -> tuple[str, ...] | None:
+        if not fields:
+            return None
+        unknown = [f for f in fields if f not in self._columns]
+        if unknown:
+            msg = f"Campos inválidos: {', '.join(unknown)}"
+            raise ValueError(msg)
+        # Na ordem do modelo: permutações de ``fields`` compartilham o
+        # mesmo SQL e o mesmo modelo de projeção.
+        requested = {"id", *fields}
+        return tuple(
+            name
+            for name in self._model_class.model_fields
+            if name in requested
+        )
+
+    @staticmethod
+    def _columns_sql(projection: Sequence[str] | None) -> str:
+        return "*" if projection is None else ", ".join(projection)
+
+    def _read_model(self, projection: tuple[str, ...] | None) -> type[T]:
+        if projection is None:
+            return self._model_class
+        return ModelUtil.projection_model(self._model_class, projection)
+
     def _validate_column_names(self, column_names: Iterable[str]) -> None:
         for column in column_names:
-            if not _COLUMN_PATTERN.match(column):
+            if column not in self._columns:
                 msg = f"Nome de coluna inválido: {column}"
                 raise ValueError(msg)
 
     def update(self, entity_id: str, updates: dict[str, Any]) -> T | None:
-        filtered = {k: v for k, v in updates.items() if v is not None}
+        """
+        Atualiza a entidade e a retorna já atualizada com um único
+        ``UPDATE ... RETURNING *``. Retorna ``None`` se nenhuma linha tiver
+        o ``entity_id`` informado.
+
+        :raises ValueError: Se ``updates`` tentar alterar o ``id``.
+        """
+        filtered = self._changes_for(entity_id, updates)
         if not filtered:
             return self.find_by_id(entity_id)
 
-        set_clauses = ", ".join([f"{key} = ?" for key in filtered])
-        values = (*tuple(filtered.values()), entity_id)
-        query = (
+        keys = tuple(filtered)
+        query = self._statement(
+            ("update", keys), lambda: self._build_update(keys)
+        )
+        self._ensure_fresh()
+        self._ensure_materialized()
+        with self._invalid_values_as_value_error():
+            cursor = self._db.execute(query, (*filtered.values(), entity_id))
+        row = cursor.fetchone()
+        if not row or cursor.description is None:
+            return None
+
+        self._mark_changed(entity_id)
+        column_names = [desc[0] for desc in cursor.description]
+        entity = self._build_model(column_names, row)
+        if self._cache is not None:
+            # Chaveado pelo id da linha retornada, não pelo argumento
+            self._cache.put(entity.id, entity)
+        return entity
+
+    @staticmethod
+    def _changes_for(
+        entity_id: str, updates: Mapping[str, Any]
+    ) -> dict[str, Any]:
+        # O id é a chave do delta incremental e do cache: renomear uma
+        # linha deixaria o id antigo como lápide e o novo sem gravação.
+        filtered = {k: v for k, v in updates.items() if v is not None}
+        if str(filtered.pop("id", entity_id)) != entity_id:
+            msg = "O id da entidade não pode ser alterado."
+            raise ValueError(msg)
+        return filtered
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _invalid_values_as_value_error() -> Iterator[None]:
+        # As atualizações chegam ao banco sem passar pelo modelo: valores
+        # que o DuckDB não converte para o tipo da coluna são erro de
+        # entrada, como as demais validações.
+        try:
+            yield
+        except duckdb.DataError as exc:
+            msg = f"Valor inválido: {exc}"
+            raise ValueError(msg) from exc
+
+    def _build_update(self, keys: tuple[str, ...]) -> str:
+        self._validate_column_names(keys)
+        set_clauses = ", ".join([f"{key} = ?" for key in keys])
+        return (
             f"UPDATE {self._table_name} SET {set_clauses} "  # noqa: S608
-            "WHERE id = ?;"
+            "WHERE id = ? RETURNING *;"
         )
-        self._db.execute(query, values)
-        return self.find_by_id(entity_id)
 
     def delete(self, entity_id: str) -> None:
-        query = f"DELETE FROM {self._table_name} WHERE id = ?;"  # noqa: S608
-        self._db.execute(query, (entity_id,))
+        self._ensure_fresh()
+        self._ensure_materialized()
+        query = self._statement(
+            ("delete",),
+            lambda: (
+                f"DELETE FROM {self._table_name} "  # noqa: S608
+                "WHERE id = ? RETURNING id;"
+            ),
+        )
+        if self._db.execute(query, (entity_id,)).fetchone() is not None:
+            # Sem linha removida, a tabela continua igual ao arquivo
+            self._mark_changed(entity_id)
+        if self._cache is not None:
+            self._cache.put(entity_id, None)
 
-    def exists_by_id(self, entity_id: str) -> bool:
+    def _mark_changed(self, *entity_ids: str) -> None:
+        self._touched_ids.update(entity_ids)
+        self._version += 1
+        if self._cache is not None:
+            self._cache.invalidate(*entity_ids)
+
+    def create_many(self, entities: Sequence[T]) -> list[T]:
+        """
+        Insere um lote de entidades em um único INSERT. IDs repetidos no
+        lote ou já existentes na tabela são rejeitados pela chave primária
+        e nada é inserido.
+
+        :raises ValueError: Com os ids em conflito.
+        """
+        if not entities:
+            return []
+
+        self._ensure_fresh()
+        self._ensure_materialized()
+        if not self._keyed or self._in_transaction:
+            # Em uma transação, a violação da chave a abortaria: os
+            # conflitos são verificados antes do INSERT.
+            self._check_conflicts(entities)
+        try:
+            self._insert_rows(entities)
+        except duckdb.ConstraintException as exc:
+            if not self._in_transaction:
+                self._check_conflicts(entities)
+            raise ValueError(str(exc)) from exc
+
+        self._mark_changed(*(entity.id for entity in entities))
+        self._cache_entities(entities)
+        return list(entities)
+
+    def _check_conflicts(self, entities: Sequence[T]) -> None:
+        ids = [entity.id for entity in entities]
+        conflicts = set(self._duplicate_ids(entities))
+        conflicts.update(self._existing_ids(ids))
+        if len(ids) == 1 and conflicts:
+            msg = f"Entidade com id {ids[0]} já existe."
+            raise ValueError(msg)
+        if conflicts:
+            msg = f"Entidades com ids já existentes: {sorted(conflicts)}"
+            raise ValueError(msg)
+
+    def update_many(self, updates: Mapping[str, Mapping[str, Any]]) -> list[T]:
+        """
+        Atualiza várias entidades (``{id: {coluna: valor}}``) com um UPDATE
+        por conjunto de colunas alteradas, e retorna as entidades
+        encontradas já atualizadas.
+
+        :raises ValueError: Se alguma atualização tentar alterar o ``id``.
+        """
+        if not updates:
+            return []
+
+        self._ensure_fresh()
+        groups: dict[tuple[str, ...], list[tuple[str, dict[str, Any]]]] = {}
+        for entity_id, changes in updates.items():
+            if filtered := self._changes_for(entity_id, changes):
+                groups.setdefault(tuple(filtered), []).append(
+                    (entity_id, filtered)
+                )
+
+        if groups:
+            self._ensure_materialized()
+        for columns, items in groups.items():
+            self._validate_column_names(columns)
+            set_clauses = ", ".join(f"{col} = u.{col}" for col in columns)
+            unnested = ", ".join(f"UNNEST(?) AS {col}" for col in columns)
+            values = (
+                [entity_id for entity_id, _ in items],
+                *([changes[col] for _, changes in items] for col in columns),
+            )
+            query = (
+                f"UPDATE {self._table_name} SET {set_clauses} "  # noqa: S608
+                f"FROM (SELECT UNNEST(?) AS id, {unnested}) AS u "
+                f"WHERE {self._table_name}.id = u.id "
+                f"RETURNING {self._table_name}.id;"
+            )
+            with self._invalid_values_as_value_error():
+                cursor = self._db.execute(query, values)
+            if changed := [row[0] for row in cursor.fetchall()]:
+                self._mark_changed(*changed)
+
+        return self._find_by_ids(list(updates))
+
+    def delete_many(self, entity_ids: Sequence[str]) -> None:
+        if not entity_ids:
+            return
+
+        self._ensure_fresh()
+        self._ensure_materialized()
+        query = (
+            f"DELETE FROM {self._table_name} "  # noqa: S608
+            "WHERE id IN (SELECT UNNEST(?::VARCHAR[])) RETURNING id;"
+        )
+        cursor = self._db.execute(query, (list(entity_ids),))
+        if deleted := [row[0] for row in cursor.fetchall()]:
+            self._mark_changed(*deleted)
+
+    def _existing_ids(self, entity_ids: list[str]) -> set[str]:
         query = (
-            "SELECT EXISTS(SELECT 1 FROM "  # noqa: S608
-            f"{self._table_name} WHERE id = ?)"
+            f"SELECT id FROM {self._table_name} "  # noqa: S608
+            "WHERE id IN (SELECT UNNEST(?::VARCHAR[]));"
+        )
+        cursor = self._db.execute(query, (entity_ids,))
+        return {row[0] for row in cursor.fetchall()}
+
+    def _find_by_ids(self, entity_ids: list[str]) -> list[T]:
+        query = (
+            f"SELECT * FROM {self._table_name} "  # noqa: S608
+            "WHERE id IN (SELECT UNNEST(?::VARCHAR[]));"
+        )
+        cursor = self._db.execute(query, (entity_ids,))
+        rows = cursor.fetchall()
+        if cursor.description is None:
+            return []
+
+        column_names = [desc[0] for desc in cursor.description]
+        return [self._build_model(column_names, row) for row in rows]
+
+    def exists_by_id(self, entity_id: str) -> bool:
+        self._ensure_fresh()
+        if self._cache is not None:
+            cached = self._cache.get(entity_id)
+            if cached is not MISSING:
+                return cached is not None
+        query = self._statement(
+            ("exists_by_id",),
+            lambda: (
+                "SELECT EXISTS(SELECT 1 FROM "  # noqa: S608
+                f"{self._table_name} WHERE id = ?)"
+            ),
         )
 
         result = self._db.execute(query, (entity_id,)).fetchone()
-        return bool(result[0])
+        exists = bool(result[0])
+        if self._cache is not None and not exists:
+            self._cache.put(entity_id, None)
+        return exists
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Final
+
+from dojocommons.domain.entities.base_entity import BaseEntity
+
+MISSING: Final = object()
+"""Retornado por ``EntityCache.get`` quando o id não está no cache."""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class EntityCache[T: BaseEntity]:
+    """
+    Identity map LRU limitado a ``max_size`` ids. Guarda tanto entidades
+    encontradas quanto ausências (``None``), para que consultas repetidas
+    ao mesmo id não voltem ao banco nem à validação do pydantic.
+
+    As entidades são guardadas e entregues como cópias (``model_copy``):
+    alterar a instância recebida de ``get`` ou passada a ``put`` não altera
+    o cache. A cópia é rasa, então valores mutáveis aninhados (listas,
+    dicts) continuam compartilhados.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            msg = "O tamanho do cache deve ser maior que zero."
+            raise ValueError(msg)
+        self._max_size = max_size
+        self._entries: OrderedDict[str, T | None] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, entity_id: str) -> T | object | None:
+        """
+        Retorna a entidade (ou ``None`` para uma ausência conhecida), ou
+        ``MISSING`` se o id não estiver no cache.
+        """
+        try:
+            entity = self._entries[entity_id]
+        except KeyError:
+            self._misses += 1
+            return MISSING
+        self._entries.move_to_end(entity_id)
+        self._hits += 1
+        return None if entity is None else entity.model_copy()
+
+    def put(self, entity_id: str, entity: T | None) -> None:
+        self._entries[entity_id] = (
+            None if entity is None else entity.model_copy()
+        )
+        self._entries.move_to_end(entity_id)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, *entity_ids: str) -> None:
+        for entity_id in entity_ids:
+            self._entries.pop(entity_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+        )
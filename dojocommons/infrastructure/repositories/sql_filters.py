@@ -0,0 +1,112 @@
+from collections.abc import Callable, Collection, Mapping
+from typing import Any, ClassVar, get_args
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+
+class SqlFilters:
+    """
+    Gramática de filtros ``coluna__operador=valor`` compilada para SQL
+    parametrizado. Sem operador, o filtro é de igualdade.
+
+    Operadores: ``eq``, ``ne``, ``gt``, ``gte``, ``lt``, ``lte``, ``in``
+    (lista ou texto separado por vírgulas), ``startswith`` (só em colunas
+    de texto) e ``isnull`` (booleano).
+    """
+
+    SEPARATOR: ClassVar[str] = "__"
+    OPERATORS: ClassVar[dict[str, str]] = {
+        "eq": "{column} = ?",
+        "ne": "{column} <> ?",
+        "gt": "{column} > ?",
+        "gte": "{column} >= ?",
+        "lt": "{column} < ?",
+        "lte": "{column} <= ?",
+        "in": "{column} IN (SELECT UNNEST(?))",
+        "startswith": "starts_with({column}, ?)",
+        "isnull": "({column} IS NULL) = ?",
+    }
+    TEXT_OPERATORS: ClassVar[frozenset[str]] = frozenset({"startswith"})
+
+    @classmethod
+    def parse(cls, key: str) -> tuple[str, str]:
+        """
+        Separa a chave do filtro em coluna e operador.
+        :param key: Chave no formato ``coluna`` ou ``coluna__operador``.
+        :return: Tupla ``(coluna, operador)``.
+        """
+        column, separator, operator = key.rpartition(cls.SEPARATOR)
+        if separator and operator in cls.OPERATORS:
+            return column, operator
+        return key, "eq"
+
+    @classmethod
+    def conditions(
+        cls, keys: Collection[str], columns: Mapping[str, FieldInfo]
+    ) -> list[str]:
+        """
+        Compila as chaves de filtro em condições SQL com ``?``.
+        :param keys: Chaves dos filtros, na ordem dos valores.
+        :param columns: Campos do modelo (``model_fields``).
+        :return: Uma condição por chave.
+        :raises ValueError: Se alguma coluna não existir no modelo ou o
+            operador não se aplicar ao tipo dela.
+        """
+        compiled = []
+        for key in keys:
+            column, operator = cls.parse(key)
+            if column not in columns:
+                msg = f"Nome de coluna inválido: {column}"
+                raise ValueError(msg)
+            if operator in cls.TEXT_OPERATORS and not cls._is_text(
+                columns[column].annotation
+            ):
+                msg = (
+                    f"O operador {operator} só se aplica a colunas de "
+                    f"texto: {column}"
+                )
+                raise ValueError(msg)
+            compiled.append(cls.OPERATORS[operator].format(column=column))
+        return compiled
+
+    @classmethod
+    def values(
+        cls,
+        filters: Mapping[str, Any],
+        adapter: Callable[[str], TypeAdapter[Any]],
+    ) -> tuple[Any, ...]:
+        """
+        Converte os valores dos filtros (inclusive textos vindos da query
+        string) para o tipo da coluna, na ordem de ``filters``.
+        :param filters: Filtros ``{chave: valor}``.
+        :param adapter: Retorna o ``TypeAdapter`` do tipo de uma coluna.
+        :raises ValueError: Se algum valor não for compatível com a coluna.
+        """
+        values = []
+        for key, value in filters.items():
+            column, operator = cls.parse(key)
+            try:
+                values.append(cls._coerce(operator, value, adapter(column)))
+            except ValidationError as exc:
+                msg = f"Valor inválido para o filtro {key}: {value!r}"
+                raise ValueError(msg) from exc
+        return tuple(values)
+
+    @staticmethod
+    def _is_text(annotation: Any) -> bool:
+        return any(
+            isinstance(candidate, type) and issubclass(candidate, str)
+            for candidate in (annotation, *get_args(annotation))
+        )
+
+    @staticmethod
+    def _coerce(operator: str, value: Any, adapter: TypeAdapter[Any]) -> Any:
+        if operator == "isnull":
+            return TypeAdapter(bool).validate_python(value)
+        if operator == "startswith":
+            return TypeAdapter(str).validate_python(value)
+        if operator == "in":
+            items = value.split(",") if isinstance(value, str) else value
+            return [adapter.validate_python(item) for item in items]
+        return adapter.validate_python(value)
@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from dojocommons.interface_adapters.dtos.base_event import BaseEvent
 from dojocommons.interface_adapters.dtos.response import Response
@@ -26,3 +26,13 @@ class BaseController:
             response: Response = handler(event)
 
         return response
+
+    def handle(self, event: BaseEvent) -> dict[str, Any]:
+        """
+        Despacha o evento e retorna a resposta pronta para o API Gateway,
+        comprimida conforme o ``Accept-Encoding`` da requisição (ver
+        ``Response.to_api_gateway``).
+        """
+        return self.dispatch(event).to_api_gateway(
+            accept_encoding=event.get_header("Accept-Encoding")
+        )
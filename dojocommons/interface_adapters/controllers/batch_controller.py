@@ -0,0 +1,76 @@
+from http import HTTPMethod, HTTPStatus
+from typing import ClassVar
+
+from pydantic import TypeAdapter, ValidationError
+
+from dojocommons.application.dtos.batch_operation import BatchOperation
+from dojocommons.application.use_cases.execute_batch_use_case import (
+    ExecuteBatchUseCase,
+)
+from dojocommons.interface_adapters.controllers.base_controller import (
+    BaseController,
+)
+from dojocommons.interface_adapters.dtos.base_event import BaseEvent
+from dojocommons.interface_adapters.dtos.response import Response
+from dojocommons.interface_adapters.presenters.base import EntityPresenter
+
+_OPERATIONS_ADAPTER = TypeAdapter(list[BatchOperation])
+
+
+class BatchController(BaseController):
+    """
+    Recebe em um único POST uma lista de operações
+    (``[{"method": "PUT", "id": "...", "body": {...}}, ...]``) e as executa
+    em uma única transação. A resposta traz um resultado por operação, na
+    mesma ordem; se uma falhar, nenhuma é aplicada.
+
+    Costuma ser registrado no ``Router`` em um caminho próprio, como
+    ``/alunos/batch``. Em caminhos aninhados
+    (``/dojos/{dojo_id}/alunos/batch``), os parâmetros do caminho restringem
+    o lote às entidades daquele pai, como no ``EntityController``.
+    """
+
+    MAX_OPERATIONS: ClassVar[int] = 100
+
+    def __init__(
+        self, batch_use_case: ExecuteBatchUseCase, presenter: EntityPresenter
+    ):
+        super().__init__(presenter)
+        self._batch_use_case = batch_use_case
+        self._routes = {
+            HTTPMethod.POST: self._handle_post,
+            HTTPMethod.OPTIONS: self._handle_options,
+        }
+
+    def _handle_post(self, event: BaseEvent) -> Response:
+        if event.body is None:
+            msg = f"Corpo da requisição é obrigatório para {event.resource}."
+            return self._presenter.present_error(
+                code=HTTPStatus.BAD_REQUEST, message=msg
+            )
+        try:
+            operations = _OPERATIONS_ADAPTER.validate_json(event.body)
+        except ValidationError:
+            return self._presenter.present_error(
+                code=HTTPStatus.BAD_REQUEST,
+                message="Lote de operações inválido.",
+            )
+        if not 1 <= len(operations) <= self.MAX_OPERATIONS:
+            msg = f"O lote deve ter entre 1 e {self.MAX_OPERATIONS} operações."
+            return self._presenter.present_error(
+                code=HTTPStatus.BAD_REQUEST, message=msg
+            )
+
+        scope = {
+            name: value
+            for name, value in (event.path_parameters or {}).items()
+            if name != "id"
+        }
+        result = self._batch_use_case.execute(operations, scope=scope)
+        return self._presenter.present(
+            result.items,  # type: ignore[arg-type]
+            code=result.status_code,
+        )
+
+    def _handle_options(self, _event: BaseEvent) -> Response:
+        return self._presenter.present_preflight()
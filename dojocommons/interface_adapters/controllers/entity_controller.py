@@ -1,4 +1,8 @@
-from http import HTTPMethod
+from collections.abc import Callable, Mapping
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+from pydantic import ValidationError
 
 from dojocommons.application.use_cases.create_entity_use_case import (
     CreateEntityUseCase,
@@ -15,11 +19,14 @@ from dojocommons.application.use_cases.list_entities_use_case import (
 from dojocommons.application.use_cases.update_entity_use_case import (
     UpdateEntityUseCase,
 )
+from dojocommons.domain.exceptions.business_exception import BusinessError
 from dojocommons.interface_adapters.controllers.base_controller import (
     BaseController,
 )
 from dojocommons.interface_adapters.dtos.base_event import BaseEvent
+from dojocommons.interface_adapters.dtos.list_query import ListQuery
 from dojocommons.interface_adapters.dtos.response import Response
+from dojocommons.interface_adapters.http.etag_helper import ETagHelper
 from dojocommons.interface_adapters.presenters.base import EntityPresenter
 
 
@@ -32,7 +39,19 @@ class EntityController(BaseController):
         update_use_case: UpdateEntityUseCase,
         create_use_case: CreateEntityUseCase,
         presenter: EntityPresenter,
+        *,
+        cache_control: str | Mapping[str, str] | None = None,
+        data_version: Callable[[], Any] | None = None,
     ):
+        """
+        :param cache_control: Valor do header ``Cache-Control`` das
+            respostas de GET, único ou por recurso (``{"/alunos": ...}``).
+        :param data_version: Retorna a versão atual dos dados (por exemplo
+            ``lambda: repository.state_token``). Quando informado, o ETag é
+            derivado da versão e da requisição, e o ``If-None-Match`` é
+            atendido com 304 antes de consultar o repositório; sem ele, o
+            ETag é o hash do corpo serializado.
+        """
         super().__init__(presenter)
 
         self._list_use_case = list_use_case
@@ -40,6 +59,8 @@ class EntityController(BaseController):
         self._delete_use_case = delete_use_case
         self._update_use_case = update_use_case
         self._create_use_case = create_use_case
+        self._cache_control = cache_control
+        self._data_version = data_version
 
         self._routes = {
             HTTPMethod.GET: self._handle_get,
@@ -50,20 +71,62 @@ class EntityController(BaseController):
         }
 
     def _handle_get(self, event: BaseEvent) -> Response:
+        cache_control = self._cache_control_for(event.resource)
+        if_none_match = event.get_header("If-None-Match")
+        etag = None
+        if self._data_version is not None:
+            etag = ETagHelper.from_parts(
+                self._data_version(),
+                event.resource,
+                event.path_parameters,
+                event.query_parameters,
+            )
+            if ETagHelper.matches(if_none_match, etag):
+                return self._presenter.present_not_modified(
+                    etag, cache_control
+                )
+
         if (
             self._resource_has_id(event)
             and event.path_parameters
             and "id" in event.path_parameters
         ):
-            return self._handle_get_by_id(event)
-        return self._handle_list(event)
+            response = self._handle_get_by_id(event)
+        else:
+            response = self._handle_list(event)
+        if response.status_code != HTTPStatus.OK:
+            return response
+
+        if etag is None:
+            etag = ETagHelper.from_body(response.json_body())
+            if ETagHelper.matches(if_none_match, etag):
+                return self._presenter.present_not_modified(
+                    etag, cache_control
+                )
+        response.headers = {**(response.headers or {}), "ETag": etag}
+        if cache_control is not None:
+            response.headers["Cache-Control"] = cache_control
+        return response
+
+    def _cache_control_for(self, resource: str) -> str | None:
+        if self._cache_control is None or isinstance(self._cache_control, str):
+            return self._cache_control
+        return self._cache_control.get(resource)
 
     def _handle_get_by_id(self, event: BaseEvent) -> Response:
-        if missing := self._require_id(event):
+        if missing := self._require_id(event) or self._out_of_scope(event):
             return missing
 
         entity_id = event.path_parameters["id"]  # type: ignore[arg-type]
-        entity = self._get_use_case.execute(entity_id)
+        try:
+            query = self._parse_list_query(event)
+            entity = self._get_use_case.execute(entity_id, fields=query.fields)
+        except BusinessError as e:
+            return self._presenter.present_error(
+                code=e.status_code, message=e.message
+            )
+        except ValueError as e:
+            return self._presenter.present_error(code=400, message=str(e))
         if entity is None:
             return self._presenter.present_error(
                 code=404, message=f"ID {entity_id} não encontrado."
@@ -72,26 +135,85 @@ class EntityController(BaseController):
         return self._presenter.present(entity)
 
     def _handle_list(self, event: BaseEvent) -> Response:
-        filters = event.query_parameters or {}
-        entities = self._list_use_case.execute(filters)
-        return self._presenter.present(entities)
+        try:
+            query = self._parse_list_query(event)
+            if query.count is not None:
+                result = self._list_use_case.execute_count(
+                    query.filters, group_by=query.group_by
+                )
+                if isinstance(result, int):
+                    result = {"count": result}
+                return self._presenter.present(result)
+            if not query.paginated:
+                entities = self._list_use_case.execute(
+                    query.filters,
+                    fields=query.fields,
+                    order_by=query.order_by,
+                )
+                return self._presenter.present(entities)
+
+            page = self._list_use_case.execute_page(
+                query.limit or ListQuery.MAX_LIMIT,
+                cursor=query.cursor,
+                order_by=query.order_by,
+                filters=query.filters,
+                fields=query.fields,
+            )
+        except BusinessError as e:
+            return self._presenter.present_error(
+                code=e.status_code, message=e.message
+            )
+        except ValueError as e:
+            return self._presenter.present_error(code=400, message=str(e))
+        return self._presenter.present_page(page)
+
+    @staticmethod
+    def _parse_list_query(event: BaseEvent) -> ListQuery:
+        try:
+            return ListQuery.from_query_parameters(event.query_parameters)
+        except ValidationError as e:
+            if e.errors()[0]["loc"][0] == "limit":
+                msg = (
+                    "Parâmetro limit deve ser um inteiro entre 1 e "
+                    f"{ListQuery.MAX_LIMIT}."
+                )
+            else:
+                msg = "Parâmetros de consulta inválidos."
+            raise BusinessError(msg) from e
 
     def _handle_post(self, event: BaseEvent) -> Response:
         if missing := self._require_body(event):
             return missing
+        if self._scope(event) and (
+            conflict := self._scope_conflict(event, self._decoded_body(event))
+        ):
+            return conflict
 
         result = self._create_use_case.execute(event)
         return self._presenter.present(result, code=201)
 
     def _handle_put(self, event: BaseEvent) -> Response:
-        if missing := self._require_id(event):
-            return missing
-        if missing := self._require_body(event):
+        if missing := (
+            self._require_id(event)
+            or self._require_body(event)
+            or self._out_of_scope(event)
+        ):
             return missing
 
         entity_id = event.path_parameters["id"]  # type: ignore[arg-type]
-        dto = event.model_dump()
-        result = self._update_use_case.execute(entity_id, dto)
+        updates = self._decoded_body(event)
+        if rejected := self._invalid_body(updates) or self._scope_conflict(
+            event, updates
+        ):
+            return rejected
+        try:
+            result = self._update_use_case.execute(entity_id, updates)
+        except BusinessError as e:
+            return self._presenter.present_error(
+                code=e.status_code, message=e.message
+            )
+        except ValueError as e:
+            return self._presenter.present_error(code=400, message=str(e))
         if result is None:
             return self._presenter.present_error(
                 code=404, message=f"ID {entity_id} não encontrado."
@@ -99,7 +221,7 @@ class EntityController(BaseController):
         return self._presenter.present(result)
 
     def _handle_delete(self, event: BaseEvent) -> Response:
-        if missing := self._require_id(event):
+        if missing := self._require_id(event) or self._out_of_scope(event):
             return missing
 
         entity_id = event.path_parameters["id"]  # type: ignore[arg-type]
@@ -114,6 +236,64 @@ class EntityController(BaseController):
             )
         return None
 
+    @staticmethod
+    def _decoded_body(event: BaseEvent) -> Any:
+        try:
+            return event.json_body()
+        except ValueError:
+            return None
+
+    def _invalid_body(self, body: Any) -> Response | None:
+        if not isinstance(body, dict):
+            return self._presenter.present_error(
+                code=400, message="Corpo da requisição inválido."
+            )
+        return None
+
+    def _scope_conflict(self, event: BaseEvent, body: Any) -> Response | None:
+        """
+        Em recursos aninhados, responde 400 quando o corpo de um POST ou PUT
+        tentaria colocar a entidade em outro pai: os parâmetros do caminho,
+        além de ``id``, presentes no corpo precisam ter o mesmo valor.
+        """
+        if not isinstance(body, dict):
+            return None
+        for name, value in self._scope(event).items():
+            if name in body and str(body[name]) != str(value):
+                return self._presenter.present_error(
+                    code=400,
+                    message=f"O campo {name} não corresponde ao caminho.",
+                )
+        return None
+
+    @staticmethod
+    def _scope(event: BaseEvent) -> dict[str, Any]:
+        path_parameters = event.path_parameters or {}
+        return {k: v for k, v in path_parameters.items() if k != "id"}
+
+    def _out_of_scope(self, event: BaseEvent) -> Response | None:
+        """
+        Em itens aninhados (``/dojos/{dojo_id}/alunos/{id}``), responde 404
+        quando a entidade não pertence ao pai indicado no caminho, como se
+        ela não existisse. Os demais parâmetros do caminho, além de ``id``,
+        precisam ser campos da entidade com o mesmo valor.
+        """
+        scope = self._scope(event)
+        if not scope:
+            return None
+
+        entity_id = event.path_parameters["id"]  # type: ignore[index]
+        entity = self._get_use_case.execute(entity_id)
+        if entity is not None and all(
+            name in type(entity).model_fields
+            and str(getattr(entity, name)) == str(value)
+            for name, value in scope.items()
+        ):
+            return None
+        return self._presenter.present_error(
+            code=404, message=f"ID {entity_id} não encontrado."
+        )
+
     def _require_body(self, event: BaseEvent) -> Response | None:
         if event.body is None:
             msg = f"Corpo da requisição é obrigatório para {event.resource}."
@@ -121,7 +301,7 @@ class EntityController(BaseController):
         return None
 
     def _resource_has_id(self, event: BaseEvent) -> bool:
-        return "{id}" in event.resource
+        return event.resource.endswith("/{id}")
 
     def _handle_options(self, _event: BaseEvent) -> Response:
-        return self._presenter.present({})
+        return self._presenter.present_preflight()
@@ -0,0 +1,174 @@
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any
+
+from dojocommons.interface_adapters.controllers.base_controller import (
+    BaseController,
+)
+from dojocommons.interface_adapters.dtos.base_event import BaseEvent
+from dojocommons.interface_adapters.dtos.response import Response
+from dojocommons.interface_adapters.presenters.base import EntityPresenter
+
+_PARAMETER = re.compile(r"^\{(\w+)\}$")
+
+
+@dataclass(frozen=True)
+class _Route:
+    template: str
+    parameters: tuple[str, ...]
+    factory: Callable[[], BaseController]
+
+
+class Router(BaseController):
+    """
+    Encaminha os eventos de vários recursos para seus controllers, para
+    que uma única função Lambda (e um único runtime quente) atenda todas
+    as entidades.
+
+    Cada recurso é registrado com uma fábrica do seu controller, chamada só
+    no primeiro evento que o atinge: repositórios e casos de uso de
+    recursos não usados nunca são montados.
+    """
+
+    def __init__(self, presenter: EntityPresenter | None = None):
+        super().__init__(presenter or EntityPresenter())
+        self._controllers: dict[str, BaseController] = {}
+        self._templates: dict[str, tuple[_Route, bool]] = {}
+        self._pattern: re.Pattern[str] | None = None
+        self._groups: dict[str, tuple[_Route, bool, list[str]]] = {}
+
+    def register(
+        self, resource: str, factory: Callable[[], BaseController]
+    ) -> None:
+        """
+        Registra um recurso, que atende também ao item ``{resource}/{id}``.
+
+        :param resource: Caminho do recurso no API Gateway, como
+            ``/alunos`` ou ``/dojos/{dojo_id}/alunos``. Os parâmetros do
+            caminho, além de ``id``, são repassados ao controller como
+            filtros da listagem e, nos itens, continuam em
+            ``path_parameters`` para que o ``EntityController`` recuse
+            entidades de outro pai.
+        :param factory: Cria o controller do recurso; chamada uma única vez,
+            no primeiro evento do recurso.
+        """
+        resource = "/" + resource.strip("/")
+        if resource in self._templates:
+            msg = f"Recurso já registrado: {resource}"
+            raise ValueError(msg)
+
+        parameters = tuple(
+            match.group(1)
+            for segment in resource.split("/")
+            if (match := _PARAMETER.match(segment))
+        )
+        if "id" in parameters:
+            msg = f"O parâmetro {{id}} é reservado para o item: {resource}"
+            raise ValueError(msg)
+
+        route = _Route(resource, parameters, factory)
+        self._templates[resource] = (route, False)
+        self._templates[f"{resource}/{{id}}"] = (route, True)
+        self._pattern = None
+
+    def dispatch(self, event: BaseEvent) -> Response:
+        matched = self._match(event)
+        if matched is None:
+            path = event.path or event.resource
+            return self._presenter.present_error(
+                code=HTTPStatus.NOT_FOUND,
+                message=f"Recurso não encontrado: {path}",
+            )
+
+        route, is_item, path_parameters = matched
+        controller = self._controllers.get(route.template)
+        if controller is None:
+            controller = self._controllers[route.template] = route.factory()
+        return controller.dispatch(
+            self._route_event(event, route, is_item, path_parameters)
+        )
+
+    def _match(
+        self, event: BaseEvent
+    ) -> tuple[_Route, bool, dict[str, Any]] | None:
+        # Integrações que entregam o template do recurso (REST e rotas do
+        # HTTP API) são resolvidas por dicionário; caminhos concretos
+        # (proxy, $default) passam pela tabela compilada.
+        known = self._templates.get(event.resource)
+        if known is not None:
+            return *known, dict(event.path_parameters or {})
+
+        match = self._compiled().match(event.path or event.resource)
+        if match is None or match.lastgroup is None:
+            return None
+        route, is_item, groups = self._groups[match.lastgroup]
+        names = (*route.parameters, "id") if is_item else route.parameters
+        values = [match.group(name) for name in groups]
+        return route, is_item, dict(zip(names, values, strict=True))
+
+    def _compiled(self) -> re.Pattern[str]:
+        if self._pattern is not None:
+            return self._pattern
+
+        # Recursos com mais segmentos fixos vêm primeiro, para que
+        # ``/alunos/ranking`` tenha prioridade sobre ``/alunos/{id}``.
+        templates = sorted(
+            self._templates.items(),
+            key=lambda item: -self._fixed_segments(item[0]),
+        )
+        alternatives = []
+        self._groups = {}
+        for index, (template, (route, is_item)) in enumerate(templates):
+            group = f"r{index}"
+            regex, parameter_groups = self._template_regex(template, group)
+            self._groups[group] = (route, is_item, parameter_groups)
+            alternatives.append(regex)
+        self._pattern = re.compile(rf"(?:{'|'.join(alternatives)})/?\Z")
+        return self._pattern
+
+    @staticmethod
+    def _fixed_segments(template: str) -> int:
+        return sum(
+            not _PARAMETER.match(segment) for segment in template.split("/")
+        )
+
+    @staticmethod
+    def _template_regex(template: str, group: str) -> tuple[str, list[str]]:
+        segments, parameter_groups = [], []
+        for segment in template.split("/"):
+            if _PARAMETER.match(segment):
+                parameter_groups.append(f"{group}_{len(parameter_groups)}")
+                segments.append(f"(?P<{parameter_groups[-1]}>[^/]+)")
+            else:
+                segments.append(re.escape(segment))
+        return f"(?P<{group}>{'/'.join(segments)})", parameter_groups
+
+    @staticmethod
+    def _route_event(
+        event: BaseEvent,
+        route: _Route,
+        is_item: bool,  # noqa: FBT001
+        path_parameters: dict[str, Any],
+    ) -> BaseEvent:
+        resource = f"{route.template}/{{id}}" if is_item else route.template
+        query_parameters = event.query_parameters
+        if route.parameters:
+            query_parameters = {
+                **(query_parameters or {}),
+                **{name: path_parameters[name] for name in route.parameters},
+            }
+        if (
+            resource == event.resource
+            and path_parameters == (event.path_parameters or {})
+            and query_parameters is event.query_parameters
+        ):
+            return event
+        return event.model_copy(
+            update={
+                "resource": resource,
+                "path_parameters": path_parameters or None,
+                "query_parameters": query_parameters,
+            }
+        )
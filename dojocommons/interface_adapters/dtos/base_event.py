@@ -1,7 +1,12 @@
+import base64
 import http
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic_core import from_json
+
+_HTTP_METHODS = {method.value: method for method in http.HTTPMethod}
 
 
 class BaseEvent(BaseModel):
@@ -15,8 +20,127 @@ class BaseEvent(BaseModel):
         alias="pathParameters", default=None
     )
     body: str | None = None
+    path: str | None = None
+
+    _body_decoded: bool = PrivateAttr(default=False)
+    _json_body: Any = PrivateAttr(default=None)
 
     model_config = {
         "populate_by_name": True,
         "extra": "ignore",
     }
+
+    @classmethod
+    def from_api_gateway(cls, event: Mapping[str, Any]) -> Self:
+        """
+        Monta o evento a partir do payload do API Gateway, tanto REST
+        (formato 1.0) quanto HTTP API (formato 2.0). Lê apenas os campos
+        usados e não valida o restante (``requestContext``, headers
+        multivalorados etc.); corpos em base64 são decodificados.
+
+        Subclasses que declaram campos próprios são validadas normalmente,
+        com esses campos lidos do evento pelo alias (ou nome) e os padrões
+        aplicados pelo pydantic.
+
+        :param event: Evento recebido pelo handler do Lambda.
+        :raises ValueError: Se o método HTTP não for reconhecido ou, em
+            subclasses, se o evento for inválido (``ValidationError``).
+        """
+        if event.get("version") == "2.0":
+            context = event["requestContext"]["http"]
+            method = context["method"]
+            route = event.get("routeKey", "$default")
+            _, _, resource = route.partition(" ")
+            path = event.get("rawPath", context["path"])
+            resource = resource or path
+        else:
+            method = event["httpMethod"]
+            resource = event["resource"]
+            path = event.get("path")
+
+        http_method = _HTTP_METHODS.get(method.upper())
+        if http_method is None:
+            msg = f"Método HTTP inválido: {method}"
+            raise ValueError(msg)
+
+        body = event.get("body")
+        if body is not None and event.get("isBase64Encoded"):
+            body = base64.b64decode(body).decode()
+
+        fields = {
+            "resource": resource,
+            "http_method": http_method,
+            "headers": event.get("headers"),
+            "query_parameters": event.get("queryStringParameters"),
+            "path_parameters": event.get("pathParameters"),
+            "body": body,
+            "path": path,
+        }
+        if cls.model_fields.keys() != BaseEvent.model_fields.keys():
+            own = {
+                name: event[key]
+                for name, field in cls.model_fields.items()
+                if name not in fields and (key := field.alias or name) in event
+            }
+            return cls.model_validate({**own, **fields})
+
+        # Os valores já vêm tipados do API Gateway. Montar a instância
+        # direto evita tanto a validação quanto o model_construct, que é
+        # mais lento que a própria validação por tratar aliases campo a
+        # campo.
+        instance = cls.__new__(cls)
+        _set = object.__setattr__
+        _set(instance, "__dict__", fields)
+        _set(instance, "__pydantic_fields_set__", set(cls.model_fields))
+        _set(instance, "__pydantic_extra__", None)
+        _set(
+            instance,
+            "__pydantic_private__",
+            {"_body_decoded": False, "_json_body": None},
+        )
+        return instance
+
+    def json_body(self) -> Any:
+        """
+        Corpo decodificado como JSON. A decodificação só acontece na
+        primeira chamada e é reaproveitada nas seguintes, então o corpo não
+        deve ser alterado depois dela.
+
+        :return: O JSON decodificado, ou ``None`` se não houver corpo.
+        :raises ValueError: Se o corpo não for um JSON válido.
+        """
+        if not self._body_decoded:
+            self._json_body = (
+                None if self.body is None else from_json(self.body)
+            )
+            self._body_decoded = True
+        return self._json_body
+
+    def parse_body[M: BaseModel](self, model: type[M]) -> M:
+        """
+        Valida o corpo direto no modelo com ``model_validate_json``, em uma
+        única passada, sem decodificar o JSON para um dict antes.
+
+        :raises ValueError: Se não houver corpo ou ele for inválido para o
+            modelo (``ValidationError``).
+        """
+        if self.body is None:
+            msg = "Corpo da requisição ausente."
+            raise ValueError(msg)
+        return model.model_validate_json(self.body)
+
+    def get_header(self, name: str) -> str | None:
+        """
+        Retorna o valor do header ``name``, sem diferenciar maiúsculas de
+        minúsculas (o API Gateway v2 entrega os nomes em minúsculas).
+        """
+        if not self.headers:
+            return None
+        value = self.headers.get(name)
+        if value is not None:
+            return value
+        name = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return None
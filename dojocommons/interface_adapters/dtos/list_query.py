@@ -0,0 +1,51 @@
+from typing import Any, ClassVar, Literal, Self
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class ListQuery(BaseModel):
+    """
+    Parâmetros de uma listagem. ``limit``, ``cursor`` e ``order_by`` são
+    reservados para paginação e ``fields`` (lista separada por vírgulas)
+    para a projeção; os demais parâmetros da query string são filtros por
+    coluna, como ``status=ativo``, ``created_at__gte=2024-01-01`` ou
+    ``status__in=a,b`` (ver ``SqlFilters``).
+
+    ``count=only`` troca a listagem pela contagem das entidades filtradas,
+    agrupada pelas colunas de ``group_by`` (lista separada por vírgulas)
+    quando informado.
+    """
+
+    RESERVED: ClassVar[frozenset[str]] = frozenset(
+        {"limit", "cursor", "order_by", "fields", "count", "group_by"}
+    )
+    MAX_LIMIT: ClassVar[int] = 1000
+
+    limit: int | None = Field(default=None, ge=1, le=MAX_LIMIT)
+    cursor: str | None = None
+    order_by: str | None = None
+    fields: list[str] | None = None
+    count: Literal["only"] | None = None
+    group_by: list[str] | None = None
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+    @field_validator("fields", "group_by", mode="before")
+    @classmethod
+    def _split_names(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            value = [name.strip() for name in value.split(",")]
+        if isinstance(value, list):
+            value = [name for name in value if name] or None
+        return value
+
+    @property
+    def paginated(self) -> bool:
+        return self.limit is not None or self.cursor is not None
+
+    @classmethod
+    def from_query_parameters(cls, params: dict[str, Any] | None) -> Self:
+        params = params or {}
+        return cls(
+            **{k: v for k, v in params.items() if k in cls.RESERVED},
+            filters={k: v for k, v in params.items() if k not in cls.RESERVED},
+        )
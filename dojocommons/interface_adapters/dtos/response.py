@@ -1,7 +1,23 @@
+import base64
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from pydantic.alias_generators import to_camel
+from pydantic_core import to_json
+
+from dojocommons.interface_adapters.http.compression_helper import (
+    CompressionHelper,
+)
+
+
+def _serialize_unknown(value: Any) -> Any:
+    # Resultados colunares (``ColumnarResult``) não são listas: são
+    # serializados pelas linhas, sem construir as entidades.
+    to_pylist = getattr(value, "to_pylist", None)
+    if to_pylist is None:
+        msg = f"Tipo não serializável para JSON: {type(value).__name__}"
+        raise TypeError(msg)
+    return to_pylist()
 
 
 class Response(BaseModel):
@@ -9,7 +25,72 @@ class Response(BaseModel):
     headers: dict[str, str] | None = None
     body: Any | None = None
 
+    _json_body: bytes | None = PrivateAttr(default=None)
+
     model_config = ConfigDict(
         populate_by_name=True,
         alias_generator=to_camel,
     )
+
+    def json_body(self) -> bytes:
+        """
+        Corpo serializado para JSON pelo pydantic-core. A serialização é
+        feita uma única vez e reaproveitada (ETag e ``to_api_gateway``),
+        então o corpo não deve ser alterado depois da primeira chamada.
+        Valores com ``to_pylist`` (como ``ColumnarResult``) são serializados
+        pelas suas linhas.
+        """
+        if self._json_body is None:
+            self._json_body = (
+                b""
+                if self.body is None
+                else to_json(self.body, fallback=_serialize_unknown)
+            )
+        return self._json_body
+
+    def to_api_gateway(
+        self,
+        accept_encoding: str | None = None,
+        min_size: int = CompressionHelper.MIN_SIZE,
+    ) -> dict[str, Any]:
+        """
+        Converte a resposta no formato de retorno do API Gateway (integração
+        proxy do Lambda). O corpo é serializado para JSON uma única vez pelo
+        pydantic-core, direto das entidades, sem ``model_dump`` nem
+        ``json.dumps``.
+
+        :param accept_encoding: Header ``Accept-Encoding`` da requisição.
+            Corpos com pelo menos ``min_size`` bytes são comprimidos com a
+            codificação negociada e entregues em base64. Havendo
+            codificação negociada, o ``ETag`` (inclusive o de um 304) vira
+            fraco.
+        :param min_size: Tamanho mínimo, em bytes, para comprimir o corpo.
+        """
+        # Cópia própria: quem recebe o dict pode alterá-lo (ex.: incluir
+        # Set-Cookie) sem afetar a resposta nem outras invocações.
+        headers = dict(self.headers or {})
+        body = self.json_body()
+        encoding = CompressionHelper.negotiate(accept_encoding)
+        etag = headers.get("ETag")
+        if etag is not None:
+            # O ETag forte identifica os bytes sem compressão. O 304 não
+            # conhece o tamanho do corpo, então o ETag final depende só da
+            # codificação negociada, e é o mesmo no 200 e no 304.
+            headers["Vary"] = "Accept-Encoding"
+            if encoding is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+        encoded = False
+        if len(body) >= min_size:
+            headers["Vary"] = "Accept-Encoding"
+            if encoding is not None:
+                headers["Content-Encoding"] = encoding
+                compressed = CompressionHelper.compress(body, encoding)
+                body = base64.b64encode(compressed)
+                encoded = True
+
+        return {
+            "statusCode": self.status_code,
+            "headers": headers,
+            "body": body.decode(),
+            "isBase64Encoded": encoded,
+        }
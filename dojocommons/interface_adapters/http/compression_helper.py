@@ -0,0 +1,76 @@
+import gzip
+from types import ModuleType
+from typing import ClassVar
+
+try:
+    import brotli
+except ModuleNotFoundError:  # pragma: no cover - depende do extra instalado
+    brotli: ModuleType | None = None
+
+
+class CompressionHelper:
+    """
+    Helper para negociar e aplicar a compressão do corpo das respostas a
+    partir do header ``Accept-Encoding``. O brotli só é oferecido quando o
+    extra opcional ``brotli`` está instalado.
+    """
+
+    MIN_SIZE: ClassVar[int] = 1024
+    """Corpos menores que isso (em bytes) não compensam a compressão."""
+
+    GZIP_LEVEL: ClassVar[int] = 6
+    BROTLI_QUALITY: ClassVar[int] = 5
+
+    @staticmethod
+    def supported_encodings() -> tuple[str, ...]:
+        """
+        Codificações disponíveis, em ordem de preferência
+        """
+        return ("br", "gzip") if brotli is not None else ("gzip",)
+
+    @staticmethod
+    def negotiate(accept_encoding: str | None) -> str | None:
+        """
+        Escolhe a codificação a partir do header ``Accept-Encoding``.
+        :param accept_encoding: Valor do header, ex.: ``gzip, br;q=0.8``.
+        :return: ``br``, ``gzip`` ou ``None`` se nenhuma for aceita.
+        """
+        if not accept_encoding:
+            return None
+
+        weights: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            name, _, params = item.strip().partition(";")
+            weight = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    weight = float(params.strip()[2:])
+                except ValueError:
+                    weight = 0.0
+            weights[name.strip().lower()] = weight
+
+        wildcard = weights.get("*", 0.0)
+        candidates = [
+            (weights.get(encoding, wildcard), -position, encoding)
+            for position, encoding in enumerate(
+                CompressionHelper.supported_encodings()
+            )
+        ]
+        weight, _, encoding = max(candidates)
+        return encoding if weight > 0 else None
+
+    @staticmethod
+    def compress(data: bytes, encoding: str) -> bytes:
+        """
+        Comprime ``data`` com a codificação negociada
+        """
+        if encoding == "br" and brotli is not None:
+            return brotli.compress(
+                data, quality=CompressionHelper.BROTLI_QUALITY
+            )
+        if encoding == "gzip":
+            return gzip.compress(
+                data, compresslevel=CompressionHelper.GZIP_LEVEL, mtime=0
+            )
+        msg = f"Codificação não suportada: {encoding}"
+        raise ValueError(msg)
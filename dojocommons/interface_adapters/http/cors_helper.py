@@ -1,3 +1,7 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import ClassVar
+
 from dojocommons.interface_adapters.dtos.response import Response
 
 
@@ -6,22 +10,31 @@ class CORSHelper:
     Helper para adicionar headers CORS às respostas
     """
 
-    @staticmethod
-    def get_cors_headers(
-        additional_headers: dict[str, str] | None = None, origin: str = "*"
-    ) -> dict[str, str]:
-        """
-        Retorna headers CORS padrão
-        """
-        headers = {
+    DEFAULT_HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
             "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": origin,
+            "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
             "Access-Control-Allow-Headers": (
                 "Content-Type, Authorization,X-Amz-Date, X-Api-Key"
             ),
             "Access-Control-Max-Age": "300",
         }
+    )
+    """
+    Headers CORS padrão, somente leitura. Cada resposta recebe uma cópia
+    própria; use ``get_cors_headers`` para obter uma cópia personalizável.
+    """
+
+    @staticmethod
+    def get_cors_headers(
+        additional_headers: dict[str, str] | None = None, origin: str = "*"
+    ) -> dict[str, str]:
+        """
+        Retorna uma cópia dos headers CORS padrão
+        """
+        headers = dict(CORSHelper.DEFAULT_HEADERS)
+        headers["Access-Control-Allow-Origin"] = origin
 
         if additional_headers:
             headers.update(additional_headers)
@@ -33,13 +46,10 @@ class CORSHelper:
         """
         Adiciona headers CORS a um objeto Response
         """
-        cors_headers = CORSHelper.get_cors_headers()
-
-        if response.headers:
-            response.headers.update(cors_headers)
-        else:
-            response.headers = cors_headers
-
+        response.headers = {
+            **(response.headers or {}),
+            **CORSHelper.DEFAULT_HEADERS,
+        }
         return response
 
     @staticmethod
@@ -0,0 +1,42 @@
+import hashlib
+from typing import Any
+
+from pydantic_core import to_json
+
+
+class ETagHelper:
+    """
+    Helper para gerar ETags fortes e avaliar o header ``If-None-Match``
+    """
+
+    @staticmethod
+    def from_body(body: bytes) -> str:
+        """
+        ETag forte a partir do corpo já serializado
+        """
+        return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    @staticmethod
+    def from_parts(*parts: Any) -> str:
+        """
+        ETag forte a partir de valores que determinam a resposta (versão
+        dos dados, recurso, parâmetros), sem precisar montar o corpo
+        """
+        return ETagHelper.from_body(to_json(parts))
+
+    @staticmethod
+    def matches(if_none_match: str | None, etag: str) -> bool:
+        """
+        Indica se ``etag`` atende ao ``If-None-Match``. Usa a comparação
+        fraca da RFC 9110, pois o ETag vira fraco quando há compressão
+        negociada (ver ``Response.to_api_gateway``).
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        opaque = etag.removeprefix("W/")
+        return any(
+            candidate.strip().removeprefix("W/") == opaque
+            for candidate in if_none_match.split(",")
+        )
@@ -1,7 +1,10 @@
 import datetime
+import functools
 from typing import get_args, get_origin
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, create_model
+
+from dojocommons.domain.entities.base_entity import Indexed
 
 
 class ModelUtil:
@@ -47,3 +50,55 @@ class ModelUtil:
                 fields.append(f"    {field_name} {sql_type} {nullable}")
         fields_sql = ",\n".join(fields)
         return f"CREATE TABLE {table_name} (\n{fields_sql}\n);"
+
+    @staticmethod
+    def indexed_fields(model: type[BaseModel]) -> list[str]:
+        """
+        Lista os campos do modelo marcados com ``Indexed``.
+        :param model: Modelo Pydantic.
+        :return: Nomes dos campos indexados, na ordem de declaração.
+        """
+        return [
+            name
+            for name, field in model.model_fields.items()
+            if any(isinstance(meta, Indexed) for meta in field.metadata)
+        ]
+
+    @staticmethod
+    def generate_create_index_sql(
+        model: type[BaseModel], table_name: str | None = None
+    ) -> list[str]:
+        """
+        Gera um ``CREATE INDEX`` para cada campo marcado com ``Indexed``.
+        :param model: Modelo Pydantic.
+        :param table_name: Nome da tabela (padrão: nome do modelo).
+        :return: Comandos SQL, um por índice.
+        """
+        table_name = table_name or model.__name__.lower()
+        return [
+            f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{field} "
+            f"ON {table_name} ({field});"
+            for field in ModelUtil.indexed_fields(model)
+        ]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def projection_model[M: BaseModel](
+        model: type[M], fields: tuple[str, ...]
+    ) -> type[M]:
+        """
+        Gera (e mantém em um cache limitado) uma subclasse de ``model`` em
+        que os campos fora de ``fields`` são opcionais e omitidos na
+        serialização. Serve para validar linhas de consultas projetadas.
+        :param model: Modelo Pydantic de origem.
+        :param fields: Campos projetados.
+        :return: Modelo parcial, subclasse de ``model``.
+        """
+        omitted = {
+            name: (field.annotation | None, Field(default=None, exclude=True))
+            for name, field in model.model_fields.items()
+            if name not in fields
+        }
+        return create_model(  # type: ignore[call-overload]
+            f"{model.__name__}Projection", __base__=model, **omitted
+        )
@@ -1,5 +1,7 @@
+from http import HTTPStatus
 from typing import Any
 
+from dojocommons.domain.value_objects.page import Page
 from dojocommons.interface_adapters.dtos.response import Response
 from dojocommons.interface_adapters.http.cors_helper import CORSHelper
 
@@ -13,14 +15,34 @@ class EntityPresenter:
         response_body = None if body is None else {"data": body}
         return self._build_response(code, response_body)
 
+    def present_page(self, page: Page[Any], code: int = 200) -> Response:
+        return self._build_response(
+            code, {"data": page.items, "next_cursor": page.next_cursor}
+        )
+
     def present_error(self, code: int, message: str) -> Response:
         return self._build_response(
             code, {"error": {"message": message, "code": code}}
         )
 
+    def present_preflight(self) -> Response:
+        return self._build_response(HTTPStatus.NO_CONTENT, None)
+
+    def present_not_modified(
+        self, etag: str, cache_control: str | None = None
+    ) -> Response:
+        headers = {**CORSHelper.DEFAULT_HEADERS, "ETag": etag}
+        if cache_control is not None:
+            headers["Cache-Control"] = cache_control
+        return Response.model_construct(
+            status_code=HTTPStatus.NOT_MODIFIED, headers=headers, body=None
+        )
+
     def _build_response(self, status_code: int, body: Any) -> Response:
-        return Response(
+        # Sem validação: os headers são uma cópia dos padrões de CORS, e o
+        # corpo só é serializado em to_api_gateway.
+        return Response.model_construct(
             status_code=status_code,
-            headers=CORSHelper.get_cors_headers(),
+            headers=dict(CORSHelper.DEFAULT_HEADERS),
             body=body,
         )
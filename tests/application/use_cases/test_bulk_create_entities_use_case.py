@@ -0,0 +1,18 @@
+from dojocommons.application.use_cases.bulk_create_entities_use_case import (
+    BulkCreateEntitiesUseCase,
+)
+from tests.fakes import FakeEntity
+
+
+def test_bulk_create_entities_use_case(mocker):
+    repository_mock = mocker.Mock()
+    entities = [FakeEntity(name="Entity One"), FakeEntity(name="Entity Two")]
+
+    repository_mock.create_many.return_value = entities
+
+    use_case = BulkCreateEntitiesUseCase(repository=repository_mock)
+
+    result = use_case.execute(entities)
+
+    repository_mock.create_many.assert_called_once_with(entities)
+    assert result is entities
@@ -0,0 +1,14 @@
+from dojocommons.application.use_cases.bulk_delete_entities_use_case import (
+    BulkDeleteEntitiesUseCase,
+)
+
+
+def test_bulk_delete_entities_use_case(mocker):
+    repository_mock = mocker.Mock()
+    entity_ids = ["1", "2"]
+
+    use_case = BulkDeleteEntitiesUseCase(repository=repository_mock)
+
+    use_case.execute(entity_ids)
+
+    repository_mock.delete_many.assert_called_once_with(entity_ids)
@@ -0,0 +1,19 @@
+from dojocommons.application.use_cases.bulk_update_entities_use_case import (
+    BulkUpdateEntitiesUseCase,
+)
+from tests.fakes import FakeEntity
+
+
+def test_bulk_update_entities_use_case(mocker):
+    repository_mock = mocker.Mock()
+    updates = {"1": {"name": "Um"}, "2": {"name": "Dois"}}
+    updated = [FakeEntity(id="1", name="Um"), FakeEntity(id="2", name="Dois")]
+
+    repository_mock.update_many.return_value = updated
+
+    use_case = BulkUpdateEntitiesUseCase(repository=repository_mock)
+
+    result = use_case.execute(updates)
+
+    repository_mock.update_many.assert_called_once_with(updates)
+    assert result is updated
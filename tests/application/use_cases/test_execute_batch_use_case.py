@@ -0,0 +1,117 @@
+import contextlib
+from http import HTTPStatus
+
+import pytest
+
+from dojocommons.application.dtos.batch_operation import (
+    BatchItemResult,
+    BatchOperation,
+)
+from dojocommons.application.use_cases.execute_batch_use_case import (
+    ExecuteBatchUseCase,
+)
+from dojocommons.domain.exceptions.business_exception import BusinessError
+from tests.fakes import FakeEntity
+
+
+@pytest.fixture
+def repository_mock(mocker):
+    repository = mocker.Mock()
+    repository.transaction.return_value = contextlib.nullcontext()
+    return repository
+
+
+@pytest.fixture
+def batch(repository_mock, use_cases):
+    return ExecuteBatchUseCase(
+        repository_mock,
+        FakeEntity,
+        use_cases["create"],
+        use_cases["update"],
+        use_cases["delete"],
+    )
+
+
+def test_batch_runs_operations_in_order_and_saves_once(
+    batch, repository_mock, use_cases
+):
+    created = FakeEntity(id="1", name="Ana")
+    updated = FakeEntity(id="2", name="Nova")
+    use_cases["create"].execute.return_value = created
+    use_cases["update"].execute.return_value = updated
+
+    result = batch.execute(
+        [
+            BatchOperation("POST", body={"id": "1", "name": "Ana"}),
+            BatchOperation("PUT", id="2", body={"name": "Nova"}),
+            BatchOperation("DELETE", id="3"),
+        ]
+    )
+
+    assert result.committed is True
+    assert result.status_code == HTTPStatus.OK
+    assert result.items == [
+        BatchItemResult(HTTPStatus.CREATED, data=created),
+        BatchItemResult(HTTPStatus.OK, data=updated),
+        BatchItemResult(HTTPStatus.NO_CONTENT),
+    ]
+    use_cases["create"].execute.assert_called_once_with(created)
+    use_cases["update"].execute.assert_called_once_with("2", {"name": "Nova"})
+    use_cases["delete"].execute.assert_called_once_with("3")
+    repository_mock.transaction.assert_called_once_with()
+    repository_mock.save_to_parquet.assert_called_once_with()
+
+
+def test_batch_failure_rolls_back_and_reports_every_item(
+    batch, repository_mock, use_cases
+):
+    use_cases["update"].execute.side_effect = BusinessError(
+        "Entidade com ID 9 não encontrada.", status_code=404
+    )
+
+    result = batch.execute(
+        [
+            BatchOperation("DELETE", id="1"),
+            BatchOperation("PUT", id="9", body={"name": "Nova"}),
+            BatchOperation("DELETE", id="2"),
+        ]
+    )
+
+    assert result.committed is False
+    assert result.failed_index == 1
+    assert result.status_code == HTTPStatus.NOT_FOUND
+    assert [item.status for item in result.items] == [
+        HTTPStatus.FAILED_DEPENDENCY,
+        HTTPStatus.NOT_FOUND,
+        HTTPStatus.FAILED_DEPENDENCY,
+    ]
+    assert result.items[0].error == "Desfeita: a operação 1 falhou."
+    assert result.items[1].error == "Entidade com ID 9 não encontrada."
+    assert result.items[2].error == "Não executada: a operação 1 falhou."
+    use_cases["delete"].execute.assert_called_once_with("1")
+    repository_mock.save_to_parquet.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("operation", "message"),
+    [
+        (BatchOperation("POST"), "Operação POST requer body."),
+        (BatchOperation("PUT", body={}), "Operação PUT requer id."),
+        (BatchOperation("PUT", id="1"), "Operação PUT requer body."),
+        (BatchOperation("DELETE"), "Operação DELETE requer id."),
+    ],
+)
+def test_batch_rejects_incomplete_operations(batch, operation, message):
+    result = batch.execute([operation])
+
+    assert result.items == [
+        BatchItemResult(HTTPStatus.BAD_REQUEST, error=message)
+    ]
+
+
+def test_batch_reports_invalid_entity_as_bad_request(batch, use_cases):
+    result = batch.execute([BatchOperation("POST", body={"id": "1"})])
+
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+    assert "name" in result.items[0].error
+    use_cases["create"].execute.assert_not_called()
@@ -15,7 +15,7 @@ def test_get_entity_use_case(mocker):
 
     result = use_case.execute(entity_id)
 
-    repository_mock.find_by_id.assert_called_once_with(entity_id)
+    repository_mock.find_by_id.assert_called_once_with(entity_id, fields=None)
     assert result == entity
     assert result is entity
 
@@ -30,5 +30,5 @@ def test_get_entity_use_case_not_found(mocker):
 
     result = use_case.execute(entity_id)
 
-    repository_mock.find_by_id.assert_called_once_with(entity_id)
+    repository_mock.find_by_id.assert_called_once_with(entity_id, fields=None)
     assert result is None
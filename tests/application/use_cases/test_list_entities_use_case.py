@@ -1,6 +1,7 @@
 from dojocommons.application.use_cases.list_entities_use_case import (
     ListEntitiesUseCase,
 )
+from dojocommons.domain.value_objects.page import Page
 from tests.fakes import FakeEntity
 
 
@@ -39,6 +40,44 @@ def test_list_entities_use_case_with_filters(mocker):
     filters = {"name": "Filtered Entity"}
     result = use_case.execute(filters=filters)
 
-    repository_mock.find_all.assert_called_once_with(**filters)
+    repository_mock.find_all.assert_called_once_with(
+        order_by=None, fields=None, **filters
+    )
     assert result == entities
     assert result is entities
+
+
+def test_list_entities_use_case_page(mocker):
+    repository_mock = mocker.Mock()
+    page = Page(items=[FakeEntity(id="1", name="Entity")], next_cursor="c2")
+    repository_mock.find_page.return_value = page
+
+    use_case = ListEntitiesUseCase(repository=repository_mock)
+
+    result = use_case.execute_page(
+        10,
+        cursor="c1",
+        order_by="name",
+        filters={"name": "Entity"},
+        fields=["name"],
+    )
+
+    repository_mock.find_page.assert_called_once_with(
+        10, cursor="c1", order_by="name", fields=["name"], name="Entity"
+    )
+    assert result is page
+
+
+def test_list_entities_use_case_count(mocker):
+    repository_mock = mocker.Mock()
+    repository_mock.count.return_value = 3
+    repository_mock.aggregate.return_value = [{"name": "A", "count": 3}]
+
+    use_case = ListEntitiesUseCase(repository=repository_mock)
+
+    assert use_case.execute_count({"name__startswith": "A"}) == 3  # noqa: PLR2004
+    assert use_case.execute_count(group_by=["name"]) == [
+        {"name": "A", "count": 3}
+    ]
+    repository_mock.count.assert_called_once_with(name__startswith="A")
+    repository_mock.aggregate.assert_called_once_with(group_by=["name"])
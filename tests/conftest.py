@@ -18,6 +18,10 @@ from dojocommons.application.use_cases.list_entities_use_case import (
 from dojocommons.application.use_cases.update_entity_use_case import (
     UpdateEntityUseCase,
 )
+from dojocommons.infrastructure.config.app_configuration import (
+    AppConfiguration,
+)
+from dojocommons.infrastructure.persistence.duckdb_service import DuckDbService
 from dojocommons.infrastructure.repositories.duckdb_repository import (
     DuckDBRepository,
 )
@@ -50,6 +54,34 @@ def db_mock(mocker):
     return mocker.Mock()
 
 
+@pytest.fixture
+def local_db():
+    service = DuckDbService(AppConfiguration(duckdb_lazy_httpfs=True))
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def make_repo(request, tmp_path):
+    """
+    Fábrica de repositórios sobre ``tmp_path``; por padrão, a tabela
+    ``fake_table`` de ``FakeEntity`` no ``local_db``, que só é aberto
+    quando nenhum ``db`` é informado. As demais opções são repassadas ao
+    construtor.
+    """
+
+    def make(db=None, **options):
+        options.setdefault("model_class", FakeEntity)
+        options.setdefault("table_name", "fake_table")
+        return DuckDBRepository(
+            db=request.getfixturevalue("local_db") if db is None else db,
+            parquet_path=str(tmp_path),
+            **options,
+        )
+
+    return make
+
+
 @pytest.fixture
 def repo(db_mock, tmp_path):
     return DuckDBRepository(
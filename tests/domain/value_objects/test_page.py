@@ -0,0 +1,33 @@
+import datetime
+
+import pytest
+
+from dojocommons.domain.exceptions.business_exception import BusinessError
+from dojocommons.domain.value_objects.page import PageCursor
+
+
+def test_cursor_round_trip():
+    cursor = PageCursor(
+        order_by="criado_em",
+        order_value=datetime.datetime(
+            2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC
+        ),
+        last_id="abc",
+    )
+
+    encoded = cursor.encode()
+
+    assert "=" not in encoded
+    assert PageCursor.decode(encoded) == PageCursor(
+        order_by="criado_em",
+        order_value="2024-01-02T03:04:05Z",
+        last_id="abc",
+    )
+
+
+@pytest.mark.parametrize("cursor", ["???", "bm90LWpzb24", "WzEsMl0", "e30"])
+def test_decode_rejects_malformed_cursor(cursor):
+    with pytest.raises(BusinessError) as exc_info:
+        PageCursor.decode(cursor)
+
+    assert exc_info.value.status_code == 400  # noqa: PLR2004
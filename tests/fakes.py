@@ -1,9 +1,10 @@
 import datetime
 from http import HTTPMethod
+from typing import Annotated
 
 from pydantic import BaseModel
 
-from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.domain.entities.base_entity import BaseEntity, Indexed
 from dojocommons.interface_adapters.controllers.base_controller import (
     BaseController,
 )
@@ -15,6 +16,18 @@ class FakeEntity(BaseEntity):
     name: str
 
 
+class FakeDojoEntity(BaseEntity):
+    dojo_id: Annotated[str, Indexed()]
+    name: str
+
+
+class FakeStudentEntity(BaseEntity):
+    name: str
+    age: int
+    belt: str | None = None
+    enrolled_at: datetime.datetime
+
+
 class FakeModel(BaseModel):
     id: str
     nome: str
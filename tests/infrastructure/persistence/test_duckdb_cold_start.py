@@ -0,0 +1,127 @@
+import time
+
+import duckdb
+import pytest
+
+from dojocommons.infrastructure.config.app_configuration import (
+    AppConfiguration,
+)
+from dojocommons.infrastructure.persistence.duckdb_service import DuckDbService
+from dojocommons.infrastructure.repositories.duckdb_repository import (
+    DuckDBRepository,
+)
+from tests.fakes import FakeEntity
+
+_RUNS = 3
+
+
+@pytest.fixture
+def parquet_dir(tmp_path):
+    conn = duckdb.connect()
+    conn.execute(
+        "COPY (SELECT range::VARCHAR AS id, 'nome ' || range AS name "
+        f"FROM range(1000)) TO '{tmp_path}/fake_table.parquet' "
+        "(FORMAT PARQUET)"
+    )
+    conn.close()
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def bundled_extension_dir(tmp_path_factory):
+    """Diretório com o httpfs pré-instalado, como numa imagem Lambda."""
+    directory = str(tmp_path_factory.mktemp("extensions"))
+    conn = duckdb.connect()
+    try:
+        conn.execute("SET extension_directory=?", (directory,))
+        conn.execute("INSTALL httpfs")
+    except duckdb.Error as exc:
+        pytest.skip(f"httpfs indisponível neste ambiente: {exc}")
+    finally:
+        conn.close()
+    return directory
+
+
+def _cold_start(cfg: AppConfiguration, parquet_dir: str) -> float:
+    start = time.perf_counter()
+    service = DuckDbService(cfg)
+    repository = DuckDBRepository(
+        db=service,
+        model_class=FakeEntity,
+        table_name="fake_table",
+        parquet_path=parquet_dir,
+    )
+    repository.find_by_id("42")
+    elapsed = time.perf_counter() - start
+    service.close()
+    return elapsed
+
+
+def _httpfs_loaded(service: DuckDbService) -> bool:
+    row = service.execute(
+        "SELECT loaded FROM duckdb_extensions() "
+        "WHERE extension_name = 'httpfs'"
+    ).fetchone()
+    return bool(row and row[0])
+
+
+def test_lazy_mode_serves_local_files_without_httpfs(parquet_dir):
+    cfg = AppConfiguration(duckdb_lazy_httpfs=True)
+    service = DuckDbService(cfg)
+
+    repository = DuckDBRepository(
+        db=service,
+        model_class=FakeEntity,
+        table_name="fake_table",
+        parquet_path=parquet_dir,
+    )
+
+    assert repository.find_by_id("42") == FakeEntity(id="42", name="nome 42")
+    assert service.httpfs_loaded is False
+    assert _httpfs_loaded(service) is False
+
+
+def test_lazy_mode_cold_start_is_faster_than_eager(parquet_dir):
+    eager_cfg = AppConfiguration()
+    lazy_cfg = AppConfiguration(duckdb_lazy_httpfs=True)
+
+    try:
+        eager = min(_cold_start(eager_cfg, parquet_dir) for _ in range(_RUNS))
+    except duckdb.Error as exc:
+        pytest.skip(f"httpfs indisponível neste ambiente: {exc}")
+    lazy = min(_cold_start(lazy_cfg, parquet_dir) for _ in range(_RUNS))
+
+    assert lazy < eager
+
+
+def test_lazy_mode_cold_start_is_faster_than_bundled_eager(
+    parquet_dir, bundled_extension_dir
+):
+    eager_cfg = AppConfiguration(
+        duckdb_extension_directory=bundled_extension_dir
+    )
+    lazy_cfg = AppConfiguration(
+        duckdb_extension_directory=bundled_extension_dir,
+        duckdb_lazy_httpfs=True,
+    )
+
+    eager = min(_cold_start(eager_cfg, parquet_dir) for _ in range(_RUNS))
+    lazy = min(_cold_start(lazy_cfg, parquet_dir) for _ in range(_RUNS))
+
+    assert lazy < eager
+
+
+def test_bundled_lazy_mode_loads_httpfs_on_first_s3_path(
+    bundled_extension_dir,
+):
+    cfg = AppConfiguration(
+        duckdb_extension_directory=bundled_extension_dir,
+        duckdb_lazy_httpfs=True,
+    )
+    service = DuckDbService(cfg)
+
+    assert _httpfs_loaded(service) is False
+    service.ensure_path_support("s3://bucket/fake_table.parquet")
+
+    assert _httpfs_loaded(service) is True
+    service.close()
@@ -0,0 +1,139 @@
+import pytest
+
+from dojocommons.infrastructure.config.app_configuration import (
+    AppConfiguration,
+)
+from dojocommons.infrastructure.persistence.duckdb_registry import (
+    DuckDbRegistry,
+)
+from tests.fakes import FakeEntity
+
+_REGISTRY = "dojocommons.infrastructure.persistence.duckdb_registry"
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    DuckDbRegistry.reset()
+    yield
+    DuckDbRegistry.reset()
+
+
+@pytest.fixture
+def service_cls(mocker):
+    return mocker.patch(f"{_REGISTRY}.DuckDbService")
+
+
+@pytest.fixture
+def repository_cls(mocker):
+    repository_cls = mocker.patch(f"{_REGISTRY}.DuckDBRepository")
+    repository_cls.return_value.model_class = FakeEntity
+    return repository_cls
+
+
+def test_get_service_reuses_instance_for_same_configuration(service_cls):
+    service_cls.return_value.closed = False
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y")
+
+    first = DuckDbRegistry.get_service(cfg)
+    second = DuckDbRegistry.get_service(
+        AppConfiguration(s3_bucket="x", s3_path="y")
+    )
+
+    assert first is second
+    service_cls.assert_called_once_with(cfg)
+
+
+def test_get_service_creates_one_instance_per_configuration(service_cls):
+    DuckDbRegistry.get_service(AppConfiguration(s3_bucket="a", s3_path="y"))
+    DuckDbRegistry.get_service(AppConfiguration(s3_bucket="b", s3_path="y"))
+
+    assert service_cls.call_count == 2  # noqa: PLR2004
+
+
+def test_get_service_recreates_closed_service(service_cls, mocker):
+    closed = mocker.Mock(closed=True)
+    fresh = mocker.Mock(closed=False)
+    service_cls.side_effect = [closed, fresh]
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y")
+
+    DuckDbRegistry.get_service(cfg)
+
+    assert DuckDbRegistry.get_service(cfg) is fresh
+
+
+def test_get_repository_keeps_hydrated_repository(service_cls, repository_cls):
+    service_cls.return_value.closed = False
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y")
+
+    first = DuckDbRegistry.get_repository(
+        cfg, FakeEntity, "fake_table", "/data"
+    )
+    second = DuckDbRegistry.get_repository(
+        cfg, FakeEntity, "fake_table", "/data"
+    )
+
+    assert first is second
+    repository_cls.assert_called_once_with(
+        db=service_cls.return_value,
+        model_class=FakeEntity,
+        table_name="fake_table",
+        parquet_path="/data",
+    )
+
+
+@pytest.mark.usefixtures("repository_cls")
+def test_get_repository_rejects_other_model_for_same_table(service_cls):
+    service_cls.return_value.closed = False
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y")
+    DuckDbRegistry.get_repository(cfg, FakeEntity, "fake_table", "/data")
+
+    class OtherEntity(FakeEntity):
+        pass
+
+    with pytest.raises(ValueError):
+        DuckDbRegistry.get_repository(cfg, OtherEntity, "fake_table", "/data")
+
+
+@pytest.mark.usefixtures("repository_cls")
+def test_get_repository_rejects_other_path_or_options(service_cls):
+    service_cls.return_value.closed = False
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y")
+    DuckDbRegistry.get_repository(cfg, FakeEntity, "fake_table", "/data")
+
+    with pytest.raises(ValueError, match="outro parquet_path"):
+        DuckDbRegistry.get_repository(cfg, FakeEntity, "fake_table", "/other")
+    with pytest.raises(ValueError, match="outras opções"):
+        DuckDbRegistry.get_repository(
+            cfg, FakeEntity, "fake_table", "/data", lazy_load=True
+        )
+
+
+def test_reset_closes_service_and_discards_repositories(
+    service_cls, repository_cls
+):
+    service_cls.return_value.closed = False
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y")
+    DuckDbRegistry.get_repository(cfg, FakeEntity, "fake_table", "/data")
+
+    DuckDbRegistry.reset(cfg)
+    DuckDbRegistry.get_repository(cfg, FakeEntity, "fake_table", "/data")
+
+    service_cls.return_value.close.assert_called_once()
+    assert service_cls.call_count == 2  # noqa: PLR2004
+    assert repository_cls.call_count == 2  # noqa: PLR2004
+
+
+def test_reset_only_affects_given_configuration(service_cls, mocker):
+    first = mocker.Mock(closed=False)
+    second = mocker.Mock(closed=False)
+    service_cls.side_effect = [first, second]
+    cfg_a = AppConfiguration(s3_bucket="a", s3_path="y")
+    cfg_b = AppConfiguration(s3_bucket="b", s3_path="y")
+    DuckDbRegistry.get_service(cfg_a)
+    DuckDbRegistry.get_service(cfg_b)
+
+    DuckDbRegistry.reset(cfg_a)
+
+    first.close.assert_called_once()
+    second.close.assert_not_called()
+    assert DuckDbRegistry.get_service(cfg_b) is second
@@ -1,5 +1,7 @@
 from unittest.mock import Mock
 
+import pytest
+
 from dojocommons.infrastructure.config.app_configuration import (
     AppConfiguration,
 )
@@ -81,3 +83,111 @@ def test_close_calls_duckdb_close(mocker):
     service.close()
 
     mock_conn.close.assert_called_once()
+
+
+def test_closed_reflects_close(mocker):
+    mocker.patch("duckdb.connect", return_value=Mock())
+
+    service = DuckDbService(AppConfiguration(s3_bucket="x", s3_path="y"))
+    assert service.closed is False
+
+    service.close()
+
+    assert service.closed is True
+
+
+def test_extension_directory_loads_httpfs_without_install(mocker):
+    mock_conn = Mock()
+    mocker.patch("duckdb.connect", return_value=mock_conn)
+
+    cfg = AppConfiguration(
+        s3_bucket="x", s3_path="y", duckdb_extension_directory="/opt/ext"
+    )
+    _ = DuckDbService(cfg)
+
+    mock_conn.execute.assert_any_call(
+        "SET extension_directory=?", ("/opt/ext",)
+    )
+    mock_conn.execute.assert_any_call("SET autoinstall_known_extensions=false")
+    mock_conn.execute.assert_any_call("LOAD httpfs;")
+    executed = [c.args[0] for c in mock_conn.execute.call_args_list]
+    assert not any("INSTALL" in query for query in executed)
+
+
+def test_lazy_httpfs_skips_s3_setup_on_construction(mocker):
+    mock_conn = Mock()
+    mocker.patch("duckdb.connect", return_value=mock_conn)
+
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y", duckdb_lazy_httpfs=True)
+    service = DuckDbService(cfg)
+
+    mock_conn.execute.assert_called_once_with("SET home_directory='/tmp'")
+    assert service.httpfs_loaded is False
+
+
+def test_lazy_httpfs_ignores_local_paths(mocker):
+    mock_conn = Mock()
+    mocker.patch("duckdb.connect", return_value=mock_conn)
+
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y", duckdb_lazy_httpfs=True)
+    service = DuckDbService(cfg)
+    service.ensure_path_support("/data/table.parquet")
+
+    assert mock_conn.execute.call_count == 1
+    assert service.httpfs_loaded is False
+
+
+def test_lazy_httpfs_loads_once_on_first_s3_path(mocker):
+    mock_conn = Mock()
+    mocker.patch("duckdb.connect", return_value=mock_conn)
+
+    cfg = AppConfiguration(
+        s3_bucket="x",
+        s3_path="y",
+        duckdb_lazy_httpfs=True,
+        duckdb_extension_directory="/opt/ext",
+    )
+    service = DuckDbService(cfg)
+    service.ensure_path_support("s3://x/y/table.parquet")
+    service.ensure_path_support("s3://x/y/other.parquet")
+
+    executed = [c.args[0] for c in mock_conn.execute.call_args_list]
+    assert executed.count("LOAD httpfs;") == 1
+    assert "SET s3_region=?" in executed
+    assert service.httpfs_loaded is True
+
+
+def test_lazy_httpfs_never_installs_on_first_s3_path(mocker):
+    mock_conn = Mock()
+    mocker.patch("duckdb.connect", return_value=mock_conn)
+
+    cfg = AppConfiguration(s3_bucket="x", s3_path="y", duckdb_lazy_httpfs=True)
+    service = DuckDbService(cfg)
+    service.ensure_path_support("s3://x/y/table.parquet")
+
+    executed = [c.args[0] for c in mock_conn.execute.call_args_list]
+    assert "LOAD httpfs;" in executed
+    assert not any("INSTALL" in query for query in executed)
+
+
+def test_cursor_opens_duplicate_connection(mocker):
+    mock_conn = Mock()
+    mocker.patch("duckdb.connect", return_value=mock_conn)
+
+    service = DuckDbService(AppConfiguration(s3_bucket="x", s3_path="y"))
+
+    assert service.cursor() is mock_conn.cursor.return_value
+
+
+def test_transaction_commits_or_rolls_back(mocker):
+    mock_conn = Mock()
+    mocker.patch("duckdb.connect", return_value=mock_conn)
+    service = DuckDbService(AppConfiguration(s3_bucket="x", s3_path="y"))
+
+    with service.transaction():
+        service.execute("DELETE FROM t")
+    mock_conn.execute.assert_called_with("COMMIT")
+
+    with pytest.raises(RuntimeError), service.transaction():
+        raise RuntimeError
+    mock_conn.execute.assert_called_with("ROLLBACK")
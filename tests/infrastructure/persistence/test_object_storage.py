@@ -0,0 +1,99 @@
+from dojocommons.infrastructure.config.app_configuration import (
+    AppConfiguration,
+)
+from dojocommons.infrastructure.persistence.object_storage import (
+    ObjectStorage,
+)
+
+
+def test_delete_removes_local_file(tmp_path):
+    file_path = tmp_path / "table.parquet"
+    file_path.write_bytes(b"data")
+
+    ObjectStorage(AppConfiguration()).delete(str(file_path))
+
+    assert not file_path.exists()
+
+
+def test_delete_ignores_missing_local_file(tmp_path):
+    ObjectStorage(AppConfiguration()).delete(str(tmp_path / "missing"))
+
+
+def test_delete_removes_s3_object(mocker):
+    client = mocker.patch("boto3.client").return_value
+    storage = ObjectStorage(AppConfiguration(aws_region="sa-east-1"))
+
+    storage.delete("s3://bucket/data/table.delta-1.parquet")
+
+    client.delete_object.assert_called_once_with(
+        Bucket="bucket", Key="data/table.delta-1.parquet"
+    )
+
+
+def test_s3_client_targets_localstack_endpoint(mocker):
+    boto_client = mocker.patch("boto3.client")
+    storage = ObjectStorage(
+        AppConfiguration(aws_endpoint="http://localhost:4566")
+    )
+
+    storage.delete("s3://bucket/key")
+
+    boto_client.assert_called_once_with(
+        "s3",
+        endpoint_url="http://localhost:4566",
+        region_name="us-east-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",  # noqa: S106
+    )
+
+
+def test_list_versions_of_local_prefix(tmp_path):
+    (tmp_path / "table.parquet").write_bytes(b"base")
+    (tmp_path / "table.delta-1.parquet").write_bytes(b"delta")
+    (tmp_path / "table").mkdir()
+    (tmp_path / "table" / "part.parquet").write_bytes(b"part")
+    (tmp_path / "other.parquet").write_bytes(b"other")
+
+    versions = ObjectStorage(AppConfiguration()).list_versions(
+        str(tmp_path / "table")
+    )
+
+    assert set(versions) == {
+        str(tmp_path / "table" / "part.parquet"),
+        str(tmp_path / "table.delta-1.parquet"),
+        str(tmp_path / "table.parquet"),
+    }
+
+
+def test_list_versions_changes_when_local_file_changes(tmp_path):
+    file_path = tmp_path / "table.parquet"
+    file_path.write_bytes(b"v1")
+    storage = ObjectStorage(AppConfiguration())
+    before = storage.list_versions(str(tmp_path / "table"))
+
+    file_path.write_bytes(b"version 2")
+
+    assert storage.list_versions(str(tmp_path / "table")) != before
+
+
+def test_list_versions_of_missing_local_directory(tmp_path):
+    storage = ObjectStorage(AppConfiguration())
+
+    assert storage.list_versions(str(tmp_path / "missing" / "table")) == {}
+
+
+def test_list_versions_uses_s3_etags(mocker):
+    client = mocker.patch("boto3.client").return_value
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "data/table.parquet", "ETag": '"abc"'}]},
+        {},
+    ]
+    storage = ObjectStorage(AppConfiguration())
+
+    versions = storage.list_versions("s3://bucket/data/table")
+
+    client.get_paginator.assert_called_once_with("list_objects_v2")
+    client.get_paginator.return_value.paginate.assert_called_once_with(
+        Bucket="bucket", Prefix="data/table"
+    )
+    assert versions == {"s3://bucket/data/table.parquet": '"abc"'}
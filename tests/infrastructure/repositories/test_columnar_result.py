@@ -0,0 +1,58 @@
+import pytest
+
+from dojocommons.infrastructure.repositories.columnar_result import (
+    ColumnarResult,
+)
+from tests.fakes import FakeEntity
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def table():
+    return pa.table({"id": ["1", "2", "3"], "name": ["A", "B", "C"]})
+
+
+def test_len_does_not_materialize_entities(table, mocker):
+    validate = mocker.spy(FakeEntity, "model_validate")
+
+    result = ColumnarResult(table, FakeEntity)
+
+    assert len(result) == 3  # noqa: PLR2004
+    validate.assert_not_called()
+
+
+def test_getitem_materializes_only_accessed_entity(table, mocker):
+    validate = mocker.spy(FakeEntity, "model_validate")
+    result = ColumnarResult(table, FakeEntity)
+
+    assert result[1] == FakeEntity(id="2", name="B")
+    assert result[-1] == FakeEntity(id="3", name="C")
+    assert result[1] is result[1]
+    assert validate.call_count == 2  # noqa: PLR2004
+
+
+def test_getitem_out_of_range(table):
+    with pytest.raises(IndexError):
+        ColumnarResult(table, FakeEntity)[3]
+
+
+def test_slice_and_iteration(table):
+    result = ColumnarResult(table, FakeEntity)
+
+    assert result[:2] == [
+        FakeEntity(id="1", name="A"),
+        FakeEntity(id="2", name="B"),
+    ]
+    assert [entity.id for entity in result] == ["1", "2", "3"]
+
+
+def test_columns_are_consumed_without_models(table, mocker):
+    validate = mocker.spy(FakeEntity, "model_validate")
+    result = ColumnarResult(table, FakeEntity)
+
+    assert result.column_names == ["id", "name"]
+    assert result.column("name") == ["A", "B", "C"]
+    assert result.to_pylist()[0] == {"id": "1", "name": "A"}
+    assert result.to_arrow() is table
+    validate.assert_not_called()
@@ -1,20 +1,20 @@
+import datetime
+from unittest import mock
+
 import duckdb
 import pytest
 
-from dojocommons.infrastructure.repositories.duckdb_repository import (
-    DuckDBRepository,
+from dojocommons.domain.exceptions.business_exception import BusinessError
+from dojocommons.infrastructure.config.app_configuration import (
+    AppConfiguration,
 )
-from tests.fakes import FakeEntity
+from dojocommons.infrastructure.persistence.duckdb_service import DuckDbService
+from tests.fakes import FakeDojoEntity, FakeEntity, FakeStudentEntity
 
 
-def test_invalid_table_name_raises(db_mock, tmp_path):
+def test_invalid_table_name_raises(make_repo, db_mock):
     with pytest.raises(ValueError):
-        DuckDBRepository(
-            db=db_mock,
-            model_class=FakeEntity,
-            table_name="123-invalid",
-            parquet_path=str(tmp_path),
-        )
+        make_repo(db=db_mock, table_name="123-invalid")
 
 
 def test_create_table_from_parquet(repo, db_mock):
@@ -28,7 +28,7 @@ def test_create_table_from_parquet(repo, db_mock):
     db_mock.execute.assert_called_with(expected_query)
 
 
-def test_ensure_table_falls_back_to_model(mocker, db_mock, tmp_path):
+def test_ensure_table_falls_back_to_model(make_repo, mocker, db_mock):
     mocker.patch.object(
         db_mock, "execute", side_effect=[duckdb.IOException("fail"), None]
     )
@@ -38,18 +38,14 @@ def test_ensure_table_falls_back_to_model(mocker, db_mock, tmp_path):
         return_value="CREATE TABLE fake_table (id VARCHAR)",
     )
 
-    _ = DuckDBRepository(
-        db=db_mock,
-        model_class=FakeEntity,
-        table_name="fake_table",
-        parquet_path=str(tmp_path),
-    )
+    _ = make_repo(db=db_mock)
 
     # primeira chamada falha (parquet), segunda é create_table_from_model
     assert db_mock.execute.call_count == 2  # noqa: PLR2004
 
 
 def test_save_to_parquet(repo, db_mock):
+    repo.delete("1")
     repo.save_to_parquet()
 
     expected_query = (
@@ -60,29 +56,82 @@ def test_save_to_parquet(repo, db_mock):
     db_mock.execute.assert_called_with(expected_query)
 
 
+def test_save_to_parquet_skips_clean_table(repo, db_mock):
+    db_mock.execute.reset_mock()
+
+    repo.save_to_parquet()
+
+    db_mock.execute.assert_not_called()
+    assert repo.dirty is False
+
+
+def test_mutations_mark_repository_dirty_until_saved(repo, db_mock):
+    db_mock.execute.return_value.fetchall.return_value = [("1",)]
+    db_mock.execute.return_value.fetchone.return_value = ("1", "Novo")
+    db_mock.execute.return_value.description = [("id",), ("name",)]
+
+    repo.create(FakeEntity(id="1", name="Rodrigo"))
+    repo.update("1", {"name": "Novo"})
+    repo.delete("1")
+
+    assert repo.version == 3  # noqa: PLR2004
+    assert repo.flushed_version == 0
+    assert repo.dirty is True
+
+    repo.save_to_parquet()
+
+    assert repo.flushed_version == 3  # noqa: PLR2004
+    assert repo.dirty is False
+
+
+def test_failed_save_keeps_repository_dirty(repo, db_mock):
+    repo.delete("1")
+    db_mock.execute.side_effect = duckdb.IOException("fail")
+
+    with pytest.raises(duckdb.IOException):
+        repo.save_to_parquet()
+
+    assert repo.dirty is True
+    assert repo.flushed_version == 0
+
+
+def _reject_inserts(db_mock, existing_ids):
+    """Simula a chave primária recusando o INSERT."""
+
+    def execute(query, *_args):
+        if query.startswith("INSERT"):
+            msg = "PRIMARY KEY or UNIQUE constraint violation"
+            raise duckdb.ConstraintException(msg)
+        result = mock.Mock()
+        result.fetchall.return_value = [(i,) for i in existing_ids]
+        return result
+
+    db_mock.execute.side_effect = execute
+
+
 def test_create_inserts_entity(repo, db_mock):
     entity = FakeEntity(id="1", name="Rodrigo")
-
-    # exists_by_id deve retornar False
-    db_mock.execute.return_value.fetchone.return_value = (0,)
+    db_mock.execute.reset_mock()
+    db_mock.execute.return_value.fetchall.return_value = [("1",)]
 
     result = repo.create(entity)
 
     assert result == entity
-
-    db_mock.execute.assert_called_with(
-        "INSERT INTO fake_table (id, name) VALUES (?, ?);", ("1", "Rodrigo")
+    # Sem SELECT EXISTS prévio: a chave primária garante a unicidade
+    db_mock.execute.assert_called_once_with(
+        "INSERT INTO fake_table (id, name) SELECT UNNEST(?), UNNEST(?) "
+        "RETURNING id;",
+        (["1"], ["Rodrigo"]),
     )
 
 
 def test_create_raises_if_exists(repo, db_mock):
-    entity = FakeEntity(id="1", name="Rodrigo")
+    _reject_inserts(db_mock, existing_ids=["1"])
 
-    # exists_by_id retorna True
-    db_mock.execute.return_value.fetchone.return_value = (1,)
+    with pytest.raises(ValueError, match="Entidade com id 1 já existe"):
+        repo.create(FakeEntity(id="1", name="Rodrigo"))
 
-    with pytest.raises(ValueError):
-        repo.create(entity)
+    assert repo.dirty is False
 
 
 def test_find_by_id_returns_entity(repo, db_mock):
@@ -173,8 +222,9 @@ def test_update(repo, db_mock):
 
     result = repo.update("1", {"name": "Novo Nome"})
 
-    db_mock.execute.assert_any_call(
-        "UPDATE fake_table SET name = ? WHERE id = ?;", ("Novo Nome", "1")
+    db_mock.execute.assert_called_with(
+        "UPDATE fake_table SET name = ? WHERE id = ? RETURNING *;",
+        ("Novo Nome", "1"),
     )
 
     assert result.name == "Novo Nome"
@@ -192,13 +242,1032 @@ def test_update_no_fields_calls_find_by_id(repo, mocker):
 def test_delete(repo, db_mock):
     repo.delete("1")
     db_mock.execute.assert_called_with(
-        "DELETE FROM fake_table WHERE id = ?;", ("1",)
+        "DELETE FROM fake_table WHERE id = ? RETURNING id;", ("1",)
+    )
+
+
+def test_field_permutations_share_statement_and_model(make_repo):
+    projected_repo = make_repo(model_class=FakeStudentEntity, table_name="s")
+    projected_repo.create(
+        FakeStudentEntity(
+            id="1",
+            name="Ana",
+            age=12,
+            enrolled_at=datetime.datetime(2024, 1, 1),  # noqa: DTZ001
+        )
+    )
+
+    first = projected_repo.find_all(fields=["name", "age"])
+    second = projected_repo.find_all(fields=["age", "name", "id"])
+
+    assert type(first[0]) is type(second[0])
+    assert first[0].model_dump() == {"id": "1", "name": "Ana", "age": 12}
+    assert [
+        key for key in projected_repo._statements if key[0] == "select"
+    ] == [("select", ("id", "name", "age"), (), None)]
+
+
+def test_order_by_must_be_a_model_column(make_repo, local_db):
+    ordered_repo = make_repo()
+    ordered_repo.create(FakeEntity(id="1", name="Ana"))
+
+    for order_by in ("id; DROP TABLE fake_table", "name DESC", "email"):
+        with pytest.raises(ValueError, match="Nome de coluna inválido"):
+            ordered_repo.find_all(order_by=order_by)
+        with pytest.raises(ValueError, match="Nome de coluna inválido"):
+            ordered_repo.iter_batches(order_by=order_by)
+
+    assert local_db.execute("SELECT count(*) FROM fake_table").fetchone() == (
+        1,
     )
 
 
+def test_updates_with_unconvertible_values_raise_value_error(students_repo):
+    with pytest.raises(ValueError, match="Valor inválido"):
+        students_repo.update("1", {"age": "abc"})
+    with pytest.raises(ValueError, match="Valor inválido"):
+        students_repo.update_many({"1": {"age": "abc"}})
+
+    assert students_repo.find_by_id("1").age == 12  # noqa: PLR2004
+
+
+def test_updates_cannot_change_the_id(make_repo, other_db):
+    id_repo = make_repo()
+    id_repo.create(FakeEntity(id="1", name="Ana"))
+    id_repo.save_to_parquet()
+
+    with pytest.raises(ValueError, match="id da entidade"):
+        id_repo.update("1", {"id": "2"})
+    with pytest.raises(ValueError, match="id da entidade"):
+        id_repo.update_many({"1": {"id": "2", "name": "Bia"}})
+    assert id_repo.update("1", {"id": "1", "name": "Bia"}) == FakeEntity(
+        id="1", name="Bia"
+    )
+    id_repo.save_to_parquet()
+
+    assert make_repo(db=other_db).find_all() == [
+        FakeEntity(id="1", name="Bia")
+    ]
+
+
+def test_writes_matching_no_rows_leave_repository_clean(make_repo):
+    clean_repo = make_repo()
+    clean_repo.create(FakeEntity(id="1", name="Ana"))
+    clean_repo.save_to_parquet()
+    version = clean_repo.version
+
+    clean_repo.delete("404")
+    clean_repo.delete_many(["404", "405"])
+    clean_repo.update_many({"404": {"name": "Novo"}})
+
+    assert clean_repo.dirty is False
+    assert clean_repo.version == version
+
+    clean_repo.delete_many(["1", "404"])
+    assert clean_repo.dirty is True
+
+
 def test_exists_by_id(repo, db_mock):
     db_mock.execute.return_value.fetchone.return_value = (1,)
     assert repo.exists_by_id("1") is True
 
     db_mock.execute.return_value.fetchone.return_value = (0,)
     assert repo.exists_by_id("1") is False
+
+
+def test_lazy_load_creates_view_over_parquet(make_repo, db_mock, tmp_path):
+    lazy_repo = make_repo(db=db_mock, lazy_load=True)
+
+    db_mock.execute.assert_called_once_with(
+        "CREATE VIEW IF NOT EXISTS fake_table AS SELECT * "
+        f"FROM read_parquet('{tmp_path}/fake_table.parquet');"
+    )
+    assert lazy_repo.materialized is False
+
+
+def test_lazy_load_save_is_noop_before_first_write(make_repo, db_mock):
+    lazy_repo = make_repo(db=db_mock, lazy_load=True)
+    db_mock.execute.reset_mock()
+
+    lazy_repo.save_to_parquet()
+
+    db_mock.execute.assert_not_called()
+
+
+def test_lazy_load_materializes_on_first_write(make_repo, local_db, tmp_path):
+    local_db.execute(
+        "COPY (SELECT '1' AS id, 'Rodrigo' AS name) "
+        f"TO '{tmp_path}/fake_table.parquet' (FORMAT PARQUET)"
+    )
+    lazy_repo = make_repo(lazy_load=True)
+
+    assert lazy_repo.find_by_id("1") == FakeEntity(id="1", name="Rodrigo")
+    assert lazy_repo.materialized is False
+
+    lazy_repo.create(FakeEntity(id="2", name="Maria"))
+
+    assert lazy_repo.materialized is True
+    assert len(lazy_repo.find_all()) == 2  # noqa: PLR2004
+    table_type = local_db.execute(
+        "SELECT table_type FROM information_schema.tables "
+        "WHERE table_name = 'fake_table'"
+    ).fetchone()
+    assert table_type == ("BASE TABLE",)
+
+
+def test_lazy_load_without_parquet_creates_table(make_repo):
+    lazy_repo = make_repo(lazy_load=True)
+
+    assert lazy_repo.materialized is True
+    assert lazy_repo.find_all() == []
+
+
+def test_incremental_save_writes_only_changed_rows(
+    make_repo, local_db, tmp_path
+):
+    local_db.execute(
+        "COPY (SELECT range::VARCHAR AS id, 'nome' AS name FROM range(100)) "
+        f"TO '{tmp_path}/fake_table.parquet' (FORMAT PARQUET)"
+    )
+    incremental_repo = make_repo(incremental=True)
+
+    incremental_repo.update("1", {"name": "Alterado"})
+    incremental_repo.delete("2")
+    incremental_repo.create(FakeEntity(id="novo", name="Novo"))
+    incremental_repo.save_to_parquet()
+
+    deltas = sorted(tmp_path.glob("fake_table.delta-*.parquet"))
+    assert len(deltas) == 1
+    rows = local_db.execute(
+        f"SELECT id, name, _delta_op FROM read_parquet('{deltas[0]}') "
+        "ORDER BY id"
+    ).fetchall()
+    assert rows == [
+        ("1", "Alterado", "upsert"),
+        ("2", None, "delete"),
+        ("novo", "Novo", "upsert"),
+    ]
+
+
+def test_incremental_save_without_changes_writes_nothing(make_repo, tmp_path):
+    incremental_repo = make_repo(incremental=True)
+
+    incremental_repo.save_to_parquet()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_incremental_load_merges_base_and_deltas(make_repo, local_db, mocker):
+    mocker.patch("time.time_ns", side_effect=[1, 2])
+    writer = make_repo(incremental=True)
+    writer.create(FakeEntity(id="1", name="Rodrigo"))
+    writer.create(FakeEntity(id="2", name="Maria"))
+    writer.save_to_parquet()
+    writer.update("1", {"name": "Rodrigo Alterado"})
+    writer.delete("2")
+    writer.save_to_parquet()
+    local_db.execute("DROP TABLE fake_table")
+
+    reader = make_repo(incremental=True)
+
+    assert reader.find_all() == [FakeEntity(id="1", name="Rodrigo Alterado")]
+
+
+def test_incremental_compacts_when_threshold_is_reached(
+    make_repo, local_db, tmp_path
+):
+    incremental_repo = make_repo(incremental=True, compaction_threshold=2)
+
+    incremental_repo.create(FakeEntity(id="1", name="Rodrigo"))
+    incremental_repo.save_to_parquet()
+    assert len(list(tmp_path.glob("fake_table.delta-*.parquet"))) == 1
+
+    incremental_repo.create(FakeEntity(id="2", name="Maria"))
+    incremental_repo.delete("1")
+    incremental_repo.save_to_parquet()
+
+    assert list(tmp_path.glob("fake_table.delta-*.parquet")) == []
+    rows = local_db.execute(
+        f"SELECT id, name FROM read_parquet('{tmp_path}/fake_table.parquet')"
+    ).fetchall()
+    assert rows == [("2", "Maria")]
+
+
+def test_compact_folds_deltas_into_existing_base(
+    make_repo, local_db, tmp_path
+):
+    local_db.execute(
+        "COPY (SELECT '1' AS id, 'Rodrigo' AS name) "
+        f"TO '{tmp_path}/fake_table.parquet' (FORMAT PARQUET)"
+    )
+    incremental_repo = make_repo(incremental=True)
+    incremental_repo.create(FakeEntity(id="2", name="Maria"))
+    incremental_repo.save_to_parquet()
+
+    incremental_repo.compact()
+
+    assert list(tmp_path.glob("fake_table.delta-*.parquet")) == []
+    rows = local_db.execute(
+        f"SELECT id, name FROM read_parquet('{tmp_path}/fake_table.parquet') "
+        "ORDER BY id"
+    ).fetchall()
+    assert rows == [("1", "Rodrigo"), ("2", "Maria")]
+
+
+def test_invalid_compaction_threshold_raises(make_repo, db_mock):
+    with pytest.raises(ValueError):
+        make_repo(db=db_mock, incremental=True, compaction_threshold=0)
+
+
+_PARTITIONED = {
+    "model_class": FakeDojoEntity,
+    "table_name": "attendance",
+    "partition_by": "dojo_id",
+}
+
+
+def test_partitioned_save_writes_hive_layout(make_repo, tmp_path):
+    partitioned_repo = make_repo(**_PARTITIONED)
+    partitioned_repo.create(FakeDojoEntity(id="1", dojo_id="d1", name="A"))
+    partitioned_repo.create(FakeDojoEntity(id="2", dojo_id="d2", name="B"))
+
+    partitioned_repo.save_to_parquet()
+
+    files = sorted(
+        str(p.relative_to(tmp_path)) for p in tmp_path.rglob("*.parquet")
+    )
+    assert files == [
+        "attendance/dojo_id=d1/data_0.parquet",
+        "attendance/dojo_id=d2/data_0.parquet",
+    ]
+
+
+def test_partitioned_save_removes_emptied_partitions(make_repo, local_db):
+    writer = make_repo(**_PARTITIONED)
+    writer.create(FakeDojoEntity(id="1", dojo_id="d1", name="A"))
+    writer.create(FakeDojoEntity(id="2", dojo_id="d2", name="B"))
+    writer.save_to_parquet()
+
+    writer.delete("2")
+    writer.save_to_parquet()
+    local_db.execute("DROP TABLE attendance")
+    reader = make_repo(**_PARTITIONED)
+
+    assert reader.find_all() == [
+        FakeDojoEntity(id="1", dojo_id="d1", name="A")
+    ]
+
+
+def test_partitioned_lazy_filter_reads_only_matching_partition(
+    make_repo, local_db
+):
+    writer = make_repo(**_PARTITIONED)
+    for index, dojo_id in enumerate(["d1", "d2", "d3"]):
+        writer.create(FakeDojoEntity(id=str(index), dojo_id=dojo_id, name="A"))
+    writer.save_to_parquet()
+    local_db.execute("DROP TABLE attendance")
+
+    reader = make_repo(**_PARTITIONED, lazy_load=True)
+    plan = local_db.execute(
+        "EXPLAIN ANALYZE SELECT * FROM attendance WHERE dojo_id = 'd2'"
+    ).fetchone()[1]
+
+    assert reader.find_all(dojo_id="d2") == [
+        FakeDojoEntity(id="1", dojo_id="d2", name="A")
+    ]
+    assert "Scanning Files: 1/3" in plan
+
+
+def test_partition_column_must_be_a_model_field(make_repo, db_mock):
+    with pytest.raises(ValueError):
+        make_repo(db=db_mock, partition_by="dojo_id")
+
+
+def test_partitioning_is_not_combined_with_incremental(make_repo, db_mock):
+    with pytest.raises(ValueError):
+        make_repo(db=db_mock, **_PARTITIONED, incremental=True)
+
+
+@pytest.fixture
+def other_db():
+    service = DuckDbService(AppConfiguration(duckdb_lazy_httpfs=True))
+    yield service
+    service.close()
+
+
+def test_freshness_reloads_when_source_changes(make_repo, other_db):
+    writer = make_repo()
+    writer.create(FakeEntity(id="1", name="Rodrigo"))
+    writer.save_to_parquet()
+    reader = make_repo(db=other_db, freshness_interval=0)
+    assert reader.find_by_id("2") is None
+
+    writer.create(FakeEntity(id="2", name="Maria"))
+    writer.save_to_parquet()
+
+    assert reader.find_by_id("2") == FakeEntity(id="2", name="Maria")
+
+
+def test_freshness_respects_recheck_interval(make_repo, other_db):
+    writer = make_repo()
+    writer.create(FakeEntity(id="1", name="Rodrigo"))
+    writer.save_to_parquet()
+    reader = make_repo(db=other_db, freshness_interval=3600)
+
+    writer.create(FakeEntity(id="2", name="Maria"))
+    writer.save_to_parquet()
+
+    assert reader.find_by_id("2") is None
+
+
+def test_freshness_defers_reload_with_pending_changes(make_repo, other_db):
+    writer = make_repo()
+    writer.create(FakeEntity(id="1", name="Rodrigo"))
+    writer.save_to_parquet()
+    reader = make_repo(db=other_db, freshness_interval=0)
+    reader.create(FakeEntity(id="local", name="Pendente"))
+
+    writer.create(FakeEntity(id="2", name="Maria"))
+    writer.save_to_parquet()
+
+    assert reader.find_by_id("local") is not None
+    assert reader.find_by_id("2") is None
+
+
+def test_freshness_ignores_own_flush(make_repo, mocker):
+    fresh_repo = make_repo(freshness_interval=0)
+    reload_spy = mocker.spy(fresh_repo, "reload")
+
+    fresh_repo.create(FakeEntity(id="1", name="Rodrigo"))
+    fresh_repo.save_to_parquet()
+    fresh_repo.find_all()
+
+    reload_spy.assert_not_called()
+
+
+def test_create_many_inserts_batch_in_one_statement(repo, db_mock):
+    db_mock.execute.return_value.fetchall.return_value = []
+    entities = [
+        FakeEntity(id="1", name="Rodrigo"),
+        FakeEntity(id="2", name="Maria"),
+    ]
+
+    result = repo.create_many(entities)
+
+    assert result == entities
+    db_mock.execute.assert_called_with(
+        "INSERT INTO fake_table (id, name) SELECT UNNEST(?), UNNEST(?) "
+        "RETURNING id;",
+        (["1", "2"], ["Rodrigo", "Maria"]),
+    )
+    assert repo.version == 1
+
+
+def test_create_many_rejects_duplicates_in_batch(repo, db_mock):
+    _reject_inserts(db_mock, existing_ids=[])
+
+    with pytest.raises(ValueError, match="'1'"):
+        repo.create_many(
+            [FakeEntity(id="1", name="A"), FakeEntity(id="1", name="B")]
+        )
+
+
+def test_create_many_rejects_existing_ids(make_repo):
+    bulk_repo = make_repo()
+    bulk_repo.create(FakeEntity(id="1", name="Rodrigo"))
+
+    with pytest.raises(ValueError, match="'1'"):
+        bulk_repo.create_many(
+            [FakeEntity(id="1", name="A"), FakeEntity(id="2", name="B")]
+        )
+    assert bulk_repo.find_by_id("2") is None
+
+
+def test_bulk_operations_round_trip(make_repo):
+    bulk_repo = make_repo()
+    bulk_repo.create_many(
+        [FakeEntity(id=str(i), name=f"nome {i}") for i in range(500)]
+    )
+
+    updated = bulk_repo.update_many(
+        {"1": {"name": "Um"}, "2": {"name": "Dois"}, "3": {"name": None}}
+    )
+    bulk_repo.delete_many([str(i) for i in range(10, 500)])
+
+    assert sorted(updated, key=lambda e: e.id) == [
+        FakeEntity(id="1", name="Um"),
+        FakeEntity(id="2", name="Dois"),
+        FakeEntity(id="3", name="nome 3"),
+    ]
+    assert len(bulk_repo.find_all()) == 10  # noqa: PLR2004
+
+
+def test_update_many_invalid_column(repo):
+    with pytest.raises(ValueError):
+        repo.update_many({"1": {"invalid-column!": "x"}})
+
+
+def test_bulk_operations_with_empty_batches(repo, db_mock):
+    db_mock.execute.reset_mock()
+
+    assert repo.create_many([]) == []
+    assert repo.update_many({}) == []
+    repo.delete_many([])
+
+    db_mock.execute.assert_not_called()
+
+
+def test_find_all_columnar(make_repo):
+    pytest.importorskip("pyarrow")
+    columnar_repo = make_repo()
+    columnar_repo.create_many(
+        [FakeEntity(id="1", name="Rodrigo"), FakeEntity(id="2", name="Maria")]
+    )
+
+    result = columnar_repo.find_all_columnar(order_by="id", name="Maria")
+
+    assert len(result) == 1
+    assert result.column("name") == ["Maria"]
+    assert list(result) == [FakeEntity(id="2", name="Maria")]
+
+
+def test_find_all_columnar_without_pyarrow(repo, db_mock):
+    db_mock.execute.return_value.arrow.side_effect = ModuleNotFoundError(
+        "pyarrow"
+    )
+
+    with pytest.raises(ImportError, match="pyarrow"):
+        repo.find_all_columnar()
+
+
+def _with_names(paged_repo):
+    paged_repo.create_many(
+        [
+            FakeEntity(id="1", name="Carla"),
+            FakeEntity(id="2", name="Ana"),
+            FakeEntity(id="3", name="Bruno"),
+            FakeEntity(id="4", name="Ana"),
+            FakeEntity(id="5", name="Ana"),
+        ]
+    )
+    return paged_repo
+
+
+def test_find_page_walks_keyset_by_id(make_repo):
+    paged_repo = _with_names(make_repo())
+
+    first = paged_repo.find_page(2)
+    second = paged_repo.find_page(2, cursor=first.next_cursor)
+    last = paged_repo.find_page(2, cursor=second.next_cursor)
+
+    assert [e.id for e in first.items] == ["1", "2"]
+    assert [e.id for e in second.items] == ["3", "4"]
+    assert [e.id for e in last.items] == ["5"]
+    assert last.next_cursor is None
+
+
+def test_find_page_orders_by_column_with_id_tiebreak(make_repo):
+    paged_repo = _with_names(make_repo())
+
+    ids = []
+    cursor = None
+    while True:
+        page = paged_repo.find_page(2, cursor=cursor, order_by="name")
+        ids.extend(e.id for e in page.items)
+        if (cursor := page.next_cursor) is None:
+            break
+
+    assert ids == ["2", "4", "5", "3", "1"]
+
+
+def test_find_page_applies_filters(make_repo):
+    paged_repo = _with_names(make_repo())
+
+    page = paged_repo.find_page(2, name="Ana")
+    rest = paged_repo.find_page(2, cursor=page.next_cursor, name="Ana")
+
+    assert [e.id for e in page.items] == ["2", "4"]
+    assert [e.id for e in rest.items] == ["5"]
+
+
+def test_find_page_rejects_cursor_from_other_ordering(make_repo):
+    paged_repo = _with_names(make_repo())
+    page = paged_repo.find_page(1, order_by="name")
+
+    with pytest.raises(BusinessError):
+        paged_repo.find_page(1, cursor=page.next_cursor)
+
+
+@pytest.mark.parametrize(
+    ("limit", "order_by"), [(0, None), (1, "unknown"), (1, "name; DROP")]
+)
+def test_find_page_validates_arguments(repo, limit, order_by):
+    with pytest.raises(ValueError):
+        repo.find_page(limit, order_by=order_by)
+
+
+def test_find_by_id_with_fields(make_repo):
+    projected_repo = _with_names(make_repo())
+
+    entity = projected_repo.find_by_id("1", fields=["name"])
+
+    assert isinstance(entity, FakeEntity)
+    assert entity.model_dump() == {"id": "1", "name": "Carla"}
+
+
+def test_find_all_with_fields_selects_only_projected_columns(make_repo):
+    projected_repo = _with_names(make_repo())
+
+    entities = projected_repo.find_all(
+        order_by="id", fields=["id"], name="Ana"
+    )
+
+    assert [e.model_dump() for e in entities] == [
+        {"id": "2"},
+        {"id": "4"},
+        {"id": "5"},
+    ]
+
+
+def test_find_page_with_fields_keeps_cursor_on_order_column(make_repo):
+    projected_repo = _with_names(make_repo())
+
+    first = projected_repo.find_page(3, order_by="name", fields=["id"])
+    rest = projected_repo.find_page(
+        3, cursor=first.next_cursor, order_by="name", fields=["id"]
+    )
+
+    assert [e.model_dump() for e in first.items] == [
+        {"id": "2"},
+        {"id": "4"},
+        {"id": "5"},
+    ]
+    assert [e.id for e in rest.items] == ["3", "1"]
+
+
+def test_find_all_rejects_unknown_fields(repo):
+    with pytest.raises(ValueError, match="Campos inválidos"):
+        repo.find_all(fields=["name", "password"])
+
+
+def test_iter_batches_reads_in_chunks(make_repo):
+    streamed_repo = _with_names(make_repo())
+
+    batches = list(streamed_repo.iter_batches(2, order_by="id", fields=["id"]))
+
+    assert [[e.id for e in batch] for batch in batches] == [
+        ["1", "2"],
+        ["3", "4"],
+        ["5"],
+    ]
+
+
+def test_iter_all_survives_writes_while_streaming(make_repo):
+    streamed_repo = _with_names(make_repo())
+
+    seen = []
+    for entity in streamed_repo.iter_all(batch_size=1, order_by="id"):
+        seen.append(entity.id)
+        streamed_repo.update(entity.id, {"name": "Visto"})
+
+    assert seen == ["1", "2", "3", "4", "5"]
+    assert {e.name for e in streamed_repo.find_all()} == {"Visto"}
+
+
+def test_iter_all_uses_fetchmany(repo, db_mock):
+    cursor = db_mock.cursor.return_value
+    cursor.description = [("id",), ("name",)]
+    cursor.fetchmany.side_effect = [[("1", "A")], []]
+
+    entities = list(repo.iter_all(batch_size=50, name="A"))
+
+    assert entities == [FakeEntity(id="1", name="A")]
+    cursor.execute.assert_called_once_with(
+        "SELECT * FROM fake_table WHERE name = ?", ("A",)
+    )
+    cursor.fetchmany.assert_called_with(50)
+    cursor.close.assert_called_once()
+
+
+def test_iter_all_validates_batch_size_eagerly(repo):
+    with pytest.raises(ValueError, match="batch_size"):
+        repo.iter_all(batch_size=0)
+
+
+def test_statements_are_cached_per_operation_and_filter_keys(repo, db_mock):
+    db_mock.execute.return_value.fetchall.return_value = []
+    db_mock.execute.return_value.description = [("id",), ("name",)]
+
+    repo.find_all(name="A")
+    first = db_mock.execute.call_args.args[0]
+    repo.find_all(name="B")
+    second = db_mock.execute.call_args.args[0]
+    repo.find_all(id="1")
+
+    assert first is second
+    assert db_mock.execute.call_args.args == (
+        "SELECT * FROM fake_table WHERE id = ?",
+        ("1",),
+    )
+
+
+def test_columns_are_validated_against_model_fields(repo):
+    with pytest.raises(ValueError, match="Nome de coluna inválido"):
+        repo.find_all(email="x")
+    with pytest.raises(ValueError, match="Nome de coluna inválido"):
+        repo.update("1", {"email": "x"})
+
+
+def test_identity_cache_serves_repeated_lookups(make_repo, local_db, mocker):
+    cached_repo = make_repo(identity_cache_size=10)
+    local_db.execute("INSERT INTO fake_table VALUES ('1', 'Rodrigo')")
+    execute = mocker.spy(local_db, "execute")
+
+    first = cached_repo.find_by_id("1")
+    second = cached_repo.find_by_id("1")
+    missing = [cached_repo.find_by_id("2"), cached_repo.find_by_id("2")]
+
+    assert second == first
+    assert second is not first
+    assert missing == [None, None]
+    assert cached_repo.exists_by_id("1") is True
+    assert cached_repo.exists_by_id("2") is False
+    assert execute.call_count == 2  # noqa: PLR2004
+    assert cached_repo.cache_stats.hits == 4  # noqa: PLR2004
+    assert cached_repo.cache_stats.misses == 2  # noqa: PLR2004
+
+
+def test_identity_cache_stays_coherent_with_writes(make_repo):
+    cached_repo = make_repo(identity_cache_size=10)
+    assert cached_repo.find_by_id("1") is None
+
+    created = cached_repo.create(FakeEntity(id="1", name="Rodrigo"))
+    assert cached_repo.find_by_id("1") == created
+    created.name = "Alterado sem salvar"
+    found = cached_repo.find_by_id("1")
+    found.name = "Alterado sem salvar"
+    assert cached_repo.find_by_id("1").name == "Rodrigo"
+
+    cached_repo.update("1", {"name": "Novo"})
+    assert cached_repo.find_by_id("1").name == "Novo"
+
+    cached_repo.update_many({"1": {"name": "Lote"}})
+    assert cached_repo.find_by_id("1").name == "Lote"
+
+    cached_repo.delete("1")
+    assert cached_repo.find_by_id("1") is None
+    assert cached_repo.exists_by_id("1") is False
+
+
+def test_identity_cache_keeps_ids_after_rejected_rename(make_repo):
+    cached_repo = make_repo(identity_cache_size=10)
+    cached_repo.create(FakeEntity(id="5", name="Rodrigo"))
+    assert cached_repo.find_by_id("500") is None
+
+    with pytest.raises(ValueError, match="id da entidade"):
+        cached_repo.update("5", {"id": "500", "name": "Novo"})
+    cached_repo.update("5", {"id": "5", "name": "Novo"})
+
+    assert cached_repo.find_by_id("5") == FakeEntity(id="5", name="Novo")
+    assert cached_repo.find_by_id("500") is None
+
+
+def test_identity_cache_is_cleared_on_reload(make_repo):
+    cached_repo = make_repo(identity_cache_size=10)
+    cached_repo.create(FakeEntity(id="1", name="Rodrigo"))
+
+    cached_repo.reload()
+
+    assert cached_repo.find_by_id("1") is None
+    assert cached_repo.cache_stats.size == 1
+
+
+def test_identity_cache_is_disabled_by_default(repo):
+    assert repo.cache_stats is None
+
+
+def test_update_returns_row_in_single_statement(make_repo, local_db, mocker):
+    returning_repo = make_repo()
+    returning_repo.create(FakeEntity(id="1", name="Rodrigo"))
+    execute = mocker.spy(local_db, "execute")
+
+    result = returning_repo.update("1", {"name": "Novo"})
+
+    assert result == FakeEntity(id="1", name="Novo")
+    assert execute.call_count == 1
+    assert returning_repo.find_by_id("1") == result
+
+
+def test_update_not_found_leaves_repository_clean(make_repo):
+    returning_repo = make_repo()
+
+    assert returning_repo.update("404", {"name": "Novo"}) is None
+    assert returning_repo.dirty is False
+
+
+def test_upsert_reports_created_and_updated(make_repo):
+    upsert_repo = make_repo()
+    upsert_repo.create(FakeEntity(id="1", name="Rodrigo"))
+
+    result = upsert_repo.upsert_many(
+        [FakeEntity(id="1", name="Novo"), FakeEntity(id="2", name="Maria")]
+    )
+    single = upsert_repo.upsert(FakeEntity(id="3", name="Ana"))
+
+    assert [e.id for e in result.created] == ["2"]
+    assert [e.id for e in result.updated] == ["1"]
+    assert [e.id for e in single.created] == ["3"]
+    assert upsert_repo.find_all(order_by="id") == [
+        FakeEntity(id="1", name="Novo"),
+        FakeEntity(id="2", name="Maria"),
+        FakeEntity(id="3", name="Ana"),
+    ]
+
+
+def test_upsert_rejects_repeated_ids_in_batch(make_repo):
+    upsert_repo = make_repo()
+
+    with pytest.raises(ValueError, match="Ids repetidos"):
+        upsert_repo.upsert_many(
+            [FakeEntity(id="1", name="A"), FakeEntity(id="1", name="B")]
+        )
+
+
+def test_table_loaded_from_parquet_gets_primary_key(
+    make_repo, local_db, tmp_path
+):
+    local_db.execute(
+        "COPY (SELECT '1' AS id, 'Rodrigo' AS name) "
+        f"TO '{tmp_path}/fake_table.parquet' (FORMAT PARQUET)"
+    )
+    keyed_repo = make_repo()
+
+    with pytest.raises(ValueError, match="Entidade com id 1 já existe"):
+        keyed_repo.create(FakeEntity(id="1", name="Outro"))
+    assert keyed_repo.upsert(FakeEntity(id="1", name="Outro")).updated
+
+
+def test_duplicate_source_ids_fall_back_to_checked_inserts(
+    make_repo, local_db, tmp_path
+):
+    local_db.execute(
+        "COPY (SELECT '1' AS id, 'A' AS name UNION ALL SELECT '1', 'B') "
+        f"TO '{tmp_path}/fake_table.parquet' (FORMAT PARQUET)"
+    )
+    unkeyed_repo = make_repo()
+
+    with pytest.raises(ValueError, match="já existe"):
+        unkeyed_repo.create(FakeEntity(id="1", name="C"))
+    with pytest.raises(ValueError, match="sem chave primária"):
+        unkeyed_repo.upsert(FakeEntity(id="1", name="C"))
+    assert unkeyed_repo.create(FakeEntity(id="2", name="D"))
+
+
+def _index_names(db):
+    rows = db.execute(
+        "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'students'"
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def test_indexes_created_for_table_built_from_model(make_repo, local_db):
+    make_repo(model_class=FakeDojoEntity, table_name="students")
+
+    assert _index_names(local_db) == ["idx_students_dojo_id"]
+
+
+def test_indexes_created_for_table_loaded_from_parquet(
+    make_repo, local_db, tmp_path
+):
+    local_db.execute(
+        "COPY (SELECT range::VARCHAR AS id, "
+        "(range % 100)::VARCHAR AS dojo_id, 'aluno' AS name FROM range(5000)) "
+        f"TO '{tmp_path}/students.parquet' (FORMAT PARQUET)"
+    )
+    indexed_repo = make_repo(model_class=FakeDojoEntity, table_name="students")
+
+    assert _index_names(local_db) == ["idx_students_dojo_id"]
+    plan = local_db.execute(
+        "EXPLAIN ANALYZE SELECT * FROM students WHERE dojo_id = '7'"
+    ).fetchall()[0][1]
+    assert "Index Scan" in plan
+    assert len(indexed_repo.find_all(dojo_id="7")) == 50  # noqa: PLR2004
+
+
+@pytest.fixture
+def students_repo(make_repo):
+    students = make_repo(model_class=FakeStudentEntity, table_name="students")
+    students.create_many(
+        [
+            FakeStudentEntity(
+                id=str(i),
+                name=name,
+                age=age,
+                belt=belt,
+                enrolled_at=datetime.datetime(2024, i, 1),  # noqa: DTZ001
+            )
+            for i, (name, age, belt) in enumerate(
+                [
+                    ("Ana", 12, "branca"),
+                    ("Andre", 17, "azul"),
+                    ("Bruno", 25, "roxa"),
+                    ("Carla", 31, None),
+                ],
+                start=1,
+            )
+        ]
+    )
+    return students
+
+
+def _ids(entities):
+    return sorted(entity.id for entity in entities)
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({"age__gte": 17}, ["2", "3", "4"]),
+        ({"age__gt": "17", "age__lte": "25"}, ["3"]),
+        ({"age__lt": 17}, ["1"]),
+        ({"name__ne": "Ana"}, ["2", "3", "4"]),
+        ({"enrolled_at__gte": "2024-03-01"}, ["3", "4"]),
+        ({"belt__in": "branca,roxa"}, ["1", "3"]),
+        ({"belt__in": ["azul"]}, ["2"]),
+        ({"name__startswith": "An"}, ["1", "2"]),
+        ({"belt__isnull": "true"}, ["4"]),
+        ({"belt__isnull": False, "name__startswith": "B"}, ["3"]),
+        ({"name__eq": "Carla"}, ["4"]),
+    ],
+)
+def test_find_all_filter_operators(students_repo, filters, expected):
+    assert _ids(students_repo.find_all(**filters)) == expected
+
+
+def test_startswith_accepts_optional_text_columns(students_repo):
+    assert _ids(students_repo.find_all(belt__startswith="r")) == ["3"]
+    assert students_repo.count(belt__startswith="r") == 1
+
+
+def test_filter_operators_apply_to_pages_and_streams(students_repo):
+    page = students_repo.find_page(limit=1, order_by="age", age__gte=17)
+    assert [student.id for student in page.items] == ["2"]
+
+    rest = students_repo.find_page(
+        limit=5, cursor=page.next_cursor, order_by="age", age__gte=17
+    )
+    assert [student.id for student in rest.items] == ["3", "4"]
+    assert _ids(students_repo.iter_all(belt__in="azul,roxa")) == ["2", "3"]
+
+
+def test_filter_operators_compile_to_parameterized_sql(repo, db_mock):
+    db_mock.execute.return_value.description = None
+
+    repo.find_all(name__startswith="Ro", id__in="1,2")
+
+    db_mock.execute.assert_called_with(
+        "SELECT * FROM fake_table "
+        "WHERE starts_with(name, ?) AND id IN (SELECT UNNEST(?))",
+        ("Ro", ["1", "2"]),
+    )
+
+
+@pytest.mark.parametrize(
+    ("filters", "message"),
+    [
+        ({"idade__gte": 1}, "Nome de coluna inválido: idade"),
+        ({"name__like": "x"}, "Nome de coluna inválido: name__like"),
+        ({"age__gte": "muitos"}, "Valor inválido para o filtro age__gte"),
+        ({"age__startswith": "1"}, "startswith só se aplica .* texto: age"),
+        ({"enrolled_at__startswith": "2024"}, "texto: enrolled_at"),
+    ],
+)
+def test_find_all_rejects_invalid_filters(students_repo, filters, message):
+    with pytest.raises(ValueError, match=message):
+        students_repo.find_all(**filters)
+
+
+def test_count_runs_sql_aggregate(students_repo, mocker):
+    build = mocker.spy(students_repo, "_build_model")
+
+    assert students_repo.count() == 4  # noqa: PLR2004
+    assert students_repo.count(age__gte="17", belt__isnull=False) == 2  # noqa: PLR2004
+    build.assert_not_called()
+
+
+def test_aggregate_groups_and_metrics(students_repo):
+    students_repo.create(
+        FakeStudentEntity(
+            id="5",
+            name="Davi",
+            age=40,
+            belt="azul",
+            enrolled_at=datetime.datetime(2024, 5, 1),  # noqa: DTZ001
+        )
+    )
+
+    rows = students_repo.aggregate(
+        group_by=["belt"],
+        metrics=["count", "age__avg", "age__max"],
+        name__ne="Ana",
+    )
+
+    assert rows == [
+        {"belt": "azul", "count": 2, "age__avg": 28.5, "age__max": 40},
+        {"belt": "roxa", "count": 1, "age__avg": 25.0, "age__max": 25},
+        {"belt": None, "count": 1, "age__avg": 31.0, "age__max": 31},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("arguments", "message"),
+    [
+        ({"metrics": ["age__median"]}, "Métrica inválida: age__median"),
+        ({"metrics": ["idade__sum"]}, "Métrica inválida: idade__sum"),
+        ({"metrics": []}, "Informe ao menos uma métrica"),
+        ({"group_by": ["faixa"]}, "Nome de coluna inválido: faixa"),
+    ],
+)
+def test_aggregate_rejects_invalid_arguments(
+    students_repo, arguments, message
+):
+    with pytest.raises(ValueError, match=message):
+        students_repo.aggregate(**arguments)
+
+
+def test_state_token_changes_on_writes_and_reloads(make_repo, other_db):
+    first = make_repo()
+    token = first.state_token
+
+    assert first.state_token == token
+    first.create(FakeEntity(id="1", name="Ana"))
+    after_write = first.state_token
+    first.reload()
+
+    assert len({token, after_write, first.state_token}) == 3  # noqa: PLR2004
+    other = make_repo(db=other_db)
+    assert other.state_token != first.state_token
+
+
+def test_transaction_commits_all_operations(make_repo):
+    cached_repo = make_repo(identity_cache_size=10)
+    cached_repo.create(FakeEntity(id="1", name="Ana"))
+
+    with cached_repo.transaction():
+        cached_repo.update("1", {"name": "Nova"})
+        cached_repo.create(FakeEntity(id="2", name="Maria"))
+        cached_repo.delete("1")
+
+    assert cached_repo.find_all(order_by="id") == [
+        FakeEntity(id="2", name="Maria")
+    ]
+    assert cached_repo.dirty is True
+
+
+def test_transaction_rolls_back_rows_cache_and_version(make_repo):
+    cached_repo = make_repo(identity_cache_size=10)
+    cached_repo.create(FakeEntity(id="1", name="Ana"))
+    cached_repo.save_to_parquet()
+    version = cached_repo.version
+
+    with pytest.raises(BusinessError), cached_repo.transaction():
+        cached_repo.update("1", {"name": "Nova"})
+        assert cached_repo.find_by_id("1").name == "Nova"
+        cached_repo.create(FakeEntity(id="2", name="Maria"))
+        raise BusinessError("falhou")  # noqa: EM101
+
+    assert cached_repo.find_all(order_by="id") == [
+        FakeEntity(id="1", name="Ana")
+    ]
+    assert cached_repo.find_by_id("1").name == "Ana"
+    assert cached_repo.version == version
+    assert cached_repo.dirty is False
+
+
+def test_transaction_rolls_back_on_duplicate_id(make_repo):
+    tx_repo = make_repo()
+    tx_repo.create(FakeEntity(id="1", name="Ana"))
+
+    with (
+        pytest.raises(ValueError, match="Entidade com id 1 já existe"),
+        tx_repo.transaction(),
+    ):
+        tx_repo.create(FakeEntity(id="2", name="Maria"))
+        tx_repo.create(FakeEntity(id="1", name="Outra"))
+
+    assert tx_repo.find_all() == [FakeEntity(id="1", name="Ana")]
+
+
+def test_transaction_cannot_be_nested(make_repo):
+    tx_repo = make_repo()
+
+    with (
+        tx_repo.transaction(),
+        pytest.raises(RuntimeError, match="transação em andamento"),
+        tx_repo.transaction(),
+    ):
+        pass
+
+    with tx_repo.transaction():
+        tx_repo.create(FakeEntity(id="1", name="Ana"))
+    assert tx_repo.exists_by_id("1") is True
@@ -0,0 +1,64 @@
+import pytest
+
+from dojocommons.infrastructure.repositories.entity_cache import (
+    MISSING,
+    CacheStats,
+    EntityCache,
+)
+from tests.fakes import FakeEntity
+
+
+def test_get_counts_hits_and_misses():
+    cache = EntityCache(2)
+    entity = FakeEntity(id="1", name="A")
+
+    assert cache.get("1") is MISSING
+    cache.put("1", entity)
+    cache.put("2", None)
+
+    assert cache.get("1") == entity
+    assert cache.get("2") is None
+    assert cache.stats == CacheStats(hits=2, misses=1, evictions=0, size=2)
+
+
+def test_entities_are_copied_in_and_out():
+    cache = EntityCache(2)
+    entity = FakeEntity(id="1", name="A")
+    cache.put("1", entity)
+
+    entity.name = "alterado pelo chamador"
+    cached = cache.get("1")
+    cached.name = "alterado pelo leitor"
+
+    assert cached is not entity
+    assert cache.get("1") == FakeEntity(id="1", name="A")
+
+
+def test_put_evicts_least_recently_used():
+    cache = EntityCache(2)
+    cache.put("1", FakeEntity(id="1", name="A"))
+    cache.put("2", FakeEntity(id="2", name="B"))
+    cache.get("1")
+
+    cache.put("3", None)
+
+    assert cache.get("2") is MISSING
+    assert cache.get("1") is not MISSING
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_and_clear():
+    cache = EntityCache(3)
+    cache.put("1", None)
+    cache.put("2", None)
+
+    cache.invalidate("1", "unknown")
+    assert cache.get("1") is MISSING
+    cache.clear()
+
+    assert cache.stats.size == 0
+
+
+def test_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        EntityCache(0)
@@ -36,3 +36,47 @@ def test_base_controller_with_registered_route():
     assert isinstance(response, Response)
     assert response.status_code == HTTPStatus.OK
     assert response.body == "GET request handled"
+
+
+def test_base_controller_handle_returns_api_gateway_response():
+    controller = FakeTestController()
+    event = BaseEvent(
+        resource="/test",
+        http_method="GET",  # type: ignore[call-arg]
+    )
+
+    result = controller.handle(event)
+
+    assert result == {
+        "statusCode": HTTPStatus.OK,
+        "headers": {},
+        "body": '"GET request handled"',
+        "isBase64Encoded": False,
+    }
+
+
+def test_base_controller_handle_negotiates_compression(mocker):
+    controller = FakeTestController()
+    event = BaseEvent(
+        resource="/test",
+        http_method="GET",  # type: ignore[call-arg]
+        headers={"accept-encoding": "gzip"},
+    )
+    to_api_gateway = mocker.spy(Response, "to_api_gateway")
+
+    controller.handle(event)
+
+    to_api_gateway.assert_called_once_with(mocker.ANY, accept_encoding="gzip")
+
+
+def test_base_event_get_header_ignores_case():
+    event = BaseEvent(
+        resource="/test",
+        http_method="GET",  # type: ignore[call-arg]
+        headers={"Accept-Encoding": "br", "if-none-match": '"abc"'},
+    )
+
+    assert event.get_header("Accept-Encoding") == "br"
+    assert event.get_header("If-None-Match") == '"abc"'
+    assert event.get_header("Authorization") is None
+    assert BaseEvent(resource="/", httpMethod="GET").get_header("X") is None
@@ -0,0 +1,224 @@
+import datetime
+import json
+from http import HTTPMethod, HTTPStatus
+
+import pytest
+
+from dojocommons.application.dtos.batch_operation import (
+    BatchItemResult,
+    BatchOperation,
+    BatchResult,
+)
+from dojocommons.application.use_cases.create_entity_use_case import (
+    CreateEntityUseCase,
+)
+from dojocommons.application.use_cases.delete_entity_use_case import (
+    DeleteEntityUseCase,
+)
+from dojocommons.application.use_cases.execute_batch_use_case import (
+    ExecuteBatchUseCase,
+)
+from dojocommons.application.use_cases.update_entity_use_case import (
+    UpdateEntityUseCase,
+)
+from dojocommons.interface_adapters.controllers.batch_controller import (
+    BatchController,
+)
+from dojocommons.interface_adapters.dtos.base_event import BaseEvent
+from dojocommons.interface_adapters.presenters.base import EntityPresenter
+from tests.fakes import FakeDojoEntity, FakeEntity, FakeStudentEntity
+
+
+@pytest.fixture
+def batch_use_case(mocker):
+    return mocker.Mock(spec=ExecuteBatchUseCase)
+
+
+@pytest.fixture
+def batch_controller(batch_use_case, presenter):
+    return BatchController(batch_use_case, presenter)
+
+
+def _post(body):
+    return BaseEvent(
+        resource="/alunos/batch",
+        http_method=HTTPMethod.POST,  # type: ignore[call-arg]
+        body=body,
+    )
+
+
+def test_post_executes_batch(batch_controller, batch_use_case, presenter):
+    items = [BatchItemResult(HTTPStatus.NO_CONTENT)]
+    batch_use_case.execute.return_value = BatchResult(
+        committed=True, items=items
+    )
+
+    response = batch_controller.dispatch(
+        _post('[{"method": "DELETE", "id": "1"}]')
+    )
+
+    batch_use_case.execute.assert_called_once_with(
+        [BatchOperation("DELETE", id="1")], scope={}
+    )
+    presenter.present.assert_called_once_with(items, code=HTTPStatus.OK)
+    assert response == presenter.present.return_value
+
+
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        (None, "Corpo da requisição é obrigatório para /alunos/batch."),
+        ("{}", "Lote de operações inválido."),
+        ('[{"method": "GET"}]', "Lote de operações inválido."),
+        ("[", "Lote de operações inválido."),
+        ("[]", "O lote deve ter entre 1 e 100 operações."),
+        (
+            json.dumps([{"method": "DELETE", "id": "1"}] * 101),
+            "O lote deve ter entre 1 e 100 operações.",
+        ),
+    ],
+)
+def test_post_rejects_invalid_batch(
+    batch_controller, batch_use_case, presenter, body, message
+):
+    batch_controller.dispatch(_post(body))
+
+    presenter.present_error.assert_called_once_with(
+        code=HTTPStatus.BAD_REQUEST, message=message
+    )
+    batch_use_case.execute.assert_not_called()
+
+
+def test_options_returns_preflight(batch_controller, presenter):
+    event = _post(None)
+    event.http_method = HTTPMethod.OPTIONS
+
+    response = batch_controller.dispatch(event)
+
+    assert response == presenter.present_preflight.return_value
+
+
+def test_batch_is_atomic_end_to_end(make_repo):
+    repository = make_repo()
+    repository.create(FakeEntity(id="1", name="Ana"))
+    controller = BatchController(
+        ExecuteBatchUseCase(
+            repository,
+            FakeEntity,
+            CreateEntityUseCase(repository),
+            UpdateEntityUseCase(repository),
+            DeleteEntityUseCase(repository),
+        ),
+        EntityPresenter(),
+    )
+    operations = [
+        {"method": "PUT", "id": "1", "body": {"name": "Nova"}},
+        {"method": "POST", "body": {"id": "2", "name": "Maria"}},
+    ]
+
+    failed = controller.handle(
+        _post(
+            json.dumps([*operations, {"method": "PUT", "id": "9", "body": {}}])
+        )
+    )
+    assert failed["statusCode"] == HTTPStatus.NOT_FOUND
+    assert repository.find_all() == [FakeEntity(id="1", name="Ana")]
+
+    committed = controller.handle(_post(json.dumps(operations)))
+    assert committed["statusCode"] == HTTPStatus.OK
+    assert [
+        item["status"] for item in json.loads(committed["body"])["data"]
+    ] == [
+        HTTPStatus.OK,
+        HTTPStatus.CREATED,
+    ]
+    assert repository.find_all(order_by="id") == [
+        FakeEntity(id="1", name="Nova"),
+        FakeEntity(id="2", name="Maria"),
+    ]
+    assert repository.dirty is False
+
+
+def test_batch_with_unconvertible_value_rolls_back(make_repo):
+    repository = make_repo(model_class=FakeStudentEntity, table_name="alunos")
+    repository.create(
+        FakeStudentEntity(
+            id="1",
+            name="Ana",
+            age=12,
+            enrolled_at=datetime.datetime(2024, 1, 1),  # noqa: DTZ001
+        )
+    )
+    controller = BatchController(
+        ExecuteBatchUseCase(
+            repository,
+            FakeStudentEntity,
+            CreateEntityUseCase(repository),
+            UpdateEntityUseCase(repository),
+            DeleteEntityUseCase(repository),
+        ),
+        EntityPresenter(),
+    )
+    operations = [
+        {"method": "PUT", "id": "1", "body": {"name": "Nova"}},
+        {"method": "PUT", "id": "1", "body": {"age": "abc"}},
+    ]
+
+    response = controller.handle(_post(json.dumps(operations)))
+
+    items = json.loads(response["body"])["data"]
+    assert response["statusCode"] == HTTPStatus.BAD_REQUEST
+    assert [item["status"] for item in items] == [
+        HTTPStatus.FAILED_DEPENDENCY,
+        HTTPStatus.BAD_REQUEST,
+    ]
+    assert items[1]["error"].startswith("Valor inválido")
+    assert repository.find_by_id("1").name == "Ana"
+
+
+def test_nested_batch_is_restricted_to_the_path_parent(make_repo):
+    repository = make_repo(model_class=FakeDojoEntity, table_name="alunos")
+    repository.create_many(
+        [
+            FakeDojoEntity(id="a1", dojo_id="A", name="Ana"),
+            FakeDojoEntity(id="b1", dojo_id="B", name="Bruno"),
+        ]
+    )
+    controller = BatchController(
+        ExecuteBatchUseCase(
+            repository,
+            FakeDojoEntity,
+            CreateEntityUseCase(repository),
+            UpdateEntityUseCase(repository),
+            DeleteEntityUseCase(repository),
+        ),
+        EntityPresenter(),
+    )
+
+    def post(operations):
+        event = _post(json.dumps(operations))
+        event.resource = "/dojos/{dojo_id}/alunos/batch"
+        event.path_parameters = {"dojo_id": "A"}
+        response = controller.handle(event)
+        return response["statusCode"], json.loads(response["body"])["data"]
+
+    moved = post([{"method": "PUT", "id": "a1", "body": {"dojo_id": "B"}}])
+    created = post(
+        [{"method": "POST", "body": {"id": "b2", "dojo_id": "B", "name": "X"}}]
+    )
+    foreign = post([{"method": "DELETE", "id": "b1"}])
+
+    assert moved[0] == HTTPStatus.BAD_REQUEST
+    assert (
+        moved[1][0]["error"] == "O campo dojo_id não corresponde ao caminho."
+    )
+    assert created[0] == HTTPStatus.BAD_REQUEST
+    assert foreign[0] == HTTPStatus.NOT_FOUND
+    assert repository.find_all(order_by="id") == [
+        FakeDojoEntity(id="a1", dojo_id="A", name="Ana"),
+        FakeDojoEntity(id="b1", dojo_id="B", name="Bruno"),
+    ]
+    assert (
+        post([{"method": "PUT", "id": "a1", "body": {"name": "Nova"}}])[0]
+        == HTTPStatus.OK
+    )
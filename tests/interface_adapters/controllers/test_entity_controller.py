@@ -1,6 +1,15 @@
-from http import HTTPMethod
+from http import HTTPMethod, HTTPStatus
+
+import pytest
 
 from dojocommons.domain.entities.base_entity import BaseEntity
+from dojocommons.domain.exceptions.business_exception import BusinessError
+from dojocommons.domain.value_objects.page import Page
+from dojocommons.interface_adapters.controllers.entity_controller import (
+    EntityController,
+)
+from dojocommons.interface_adapters.http.etag_helper import ETagHelper
+from dojocommons.interface_adapters.presenters.base import EntityPresenter
 
 
 def test_get_list(controller, use_cases, event, presenter):
@@ -12,7 +21,9 @@ def test_get_list(controller, use_cases, event, presenter):
 
     response = controller.dispatch(event)
 
-    use_cases["list"].execute.assert_called_once_with({"nome": "Rodrigo"})
+    use_cases["list"].execute.assert_called_once_with(
+        {"nome": "Rodrigo"}, fields=None, order_by=None
+    )
     presenter.present.assert_called_once_with(["ent1", "ent2"])
     assert response == presenter.present.return_value
 
@@ -26,7 +37,7 @@ def test_get_by_id(controller, use_cases, event, presenter):
 
     response = controller.dispatch(event)
 
-    use_cases["get"].execute.assert_called_once_with("123")
+    use_cases["get"].execute.assert_called_once_with("123", fields=None)
 
     presenter.present.assert_called_once_with(entity)
     assert response == presenter.present.return_value
@@ -83,11 +94,41 @@ def test_put_update(controller, use_cases, event, presenter):
 
     response = controller.dispatch(event)
 
-    use_cases["update"].execute.assert_called_once()
+    use_cases["update"].execute.assert_called_once_with(
+        "123", {"nome": "Novo"}
+    )
     presenter.present.assert_called_once_with({"id": "123", "nome": "Novo"})
     assert response == presenter.present.return_value
 
 
+@pytest.mark.parametrize("body", ["{nome", '["Novo"]'])
+def test_put_invalid_body(controller, use_cases, event, presenter, body):
+    event.http_method = HTTPMethod.PUT
+    event.path_parameters = {"id": "123"}
+    event.body = body
+
+    controller.dispatch(event)
+
+    use_cases["update"].execute.assert_not_called()
+    presenter.present_error.assert_called_once_with(
+        code=400, message="Corpo da requisição inválido."
+    )
+
+
+def test_put_invalid_value(controller, use_cases, event, presenter):
+    event.http_method = HTTPMethod.PUT
+    event.path_parameters = {"id": "123"}
+    event.body = '{"idade": "abc"}'
+    use_cases["update"].execute.side_effect = ValueError("Valor inválido")
+
+    response = controller.dispatch(event)
+
+    presenter.present_error.assert_called_once_with(
+        code=400, message="Valor inválido"
+    )
+    assert response == presenter.present_error.return_value
+
+
 def test_put_not_found(controller, use_cases, event, presenter):
     event.http_method = HTTPMethod.PUT
     event.path_parameters = {"id": "999"}
@@ -149,3 +190,259 @@ def test_unknown_http_method(controller, event, presenter):
         code=405, message="Método não permitido"
     )
     assert response == presenter.present_error.return_value
+
+
+def test_get_list_count_only(controller, use_cases, event, presenter):
+    event.http_method = HTTPMethod.GET
+    event.resource = "/entities"
+    event.query_parameters = {"count": "only", "ativo": "true"}
+    use_cases["list"].execute_count.return_value = 2
+
+    response = controller.dispatch(event)
+
+    use_cases["list"].execute_count.assert_called_once_with(
+        {"ativo": "true"}, group_by=None
+    )
+    use_cases["list"].execute.assert_not_called()
+    presenter.present.assert_called_once_with({"count": 2})
+    assert response == presenter.present.return_value
+
+
+def test_get_list_count_grouped(controller, use_cases, event, presenter):
+    event.http_method = HTTPMethod.GET
+    event.resource = "/entities"
+    event.query_parameters = {"count": "only", "group_by": "faixa"}
+    counts = [{"faixa": "azul", "count": 2}]
+    use_cases["list"].execute_count.return_value = counts
+
+    controller.dispatch(event)
+
+    use_cases["list"].execute_count.assert_called_once_with(
+        {}, group_by=["faixa"]
+    )
+    presenter.present.assert_called_once_with(counts)
+
+
+def test_options_returns_preflight(controller, event, presenter):
+    event.http_method = HTTPMethod.OPTIONS
+
+    response = controller.dispatch(event)
+
+    presenter.present_preflight.assert_called_once_with()
+    assert response == presenter.present_preflight.return_value
+
+
+def test_get_list_paginated(controller, use_cases, event, presenter):
+    event.http_method = HTTPMethod.GET
+    event.resource = "/entities"
+    event.query_parameters = {
+        "nome": "Rodrigo",
+        "limit": "2",
+        "cursor": "abc",
+        "order_by": "nome",
+    }
+    page = Page(items=["ent1", "ent2"], next_cursor="def")
+    use_cases["list"].execute_page.return_value = page
+
+    response = controller.dispatch(event)
+
+    use_cases["list"].execute_page.assert_called_once_with(
+        2,
+        cursor="abc",
+        order_by="nome",
+        filters={"nome": "Rodrigo"},
+        fields=None,
+    )
+    presenter.present_page.assert_called_once_with(page)
+    assert response == presenter.present_page.return_value
+
+
+def test_get_list_unpaginated_keeps_order_by(controller, use_cases, event):
+    event.http_method = HTTPMethod.GET
+    event.resource = "/entities"
+    event.query_parameters = {"order_by": "nome"}
+
+    controller.dispatch(event)
+
+    use_cases["list"].execute.assert_called_once_with(
+        {}, fields=None, order_by="nome"
+    )
+    use_cases["list"].execute_page.assert_not_called()
+
+
+@pytest.mark.parametrize("limit", ["0", "abc", "1001"])
+def test_get_list_invalid_limit(
+    controller, use_cases, event, presenter, limit
+):
+    event.http_method = HTTPMethod.GET
+    event.resource = "/entities"
+    event.query_parameters = {"limit": limit}
+
+    response = controller.dispatch(event)
+
+    use_cases["list"].execute_page.assert_not_called()
+    presenter.present_error.assert_called_once_with(
+        code=400,
+        message="Parâmetro limit deve ser um inteiro entre 1 e 1000.",
+    )
+    assert response == presenter.present_error.return_value
+
+
+def test_get_list_invalid_cursor(controller, use_cases, event, presenter):
+    event.http_method = HTTPMethod.GET
+    event.resource = "/entities"
+    event.query_parameters = {"cursor": "???"}
+    use_cases["list"].execute_page.side_effect = BusinessError(
+        "Cursor de paginação inválido."
+    )
+
+    controller.dispatch(event)
+
+    use_cases["list"].execute_page.assert_called_once_with(
+        1000, cursor="???", order_by=None, filters={}, fields=None
+    )
+    presenter.present_error.assert_called_once_with(
+        code=400, message="Cursor de paginação inválido."
+    )
+
+
+def test_get_list_with_fields(controller, use_cases, event):
+    event.http_method = HTTPMethod.GET
+    event.resource = "/entities"
+    event.query_parameters = {"fields": "nome, idade,", "ativo": "true"}
+
+    controller.dispatch(event)
+
+    use_cases["list"].execute.assert_called_once_with(
+        {"ativo": "true"}, fields=["nome", "idade"], order_by=None
+    )
+
+
+def test_get_list_with_filter_operators(
+    controller, use_cases, event, presenter
+):
+    event.http_method = HTTPMethod.GET
+    event.resource = "/entities"
+    event.query_parameters = {"idade__gte": "abc", "nome__in": "Ana,Bia"}
+    use_cases["list"].execute.side_effect = ValueError(
+        "Valor inválido para o filtro idade__gte: 'abc'"
+    )
+
+    controller.dispatch(event)
+
+    use_cases["list"].execute.assert_called_once_with(
+        {"idade__gte": "abc", "nome__in": "Ana,Bia"},
+        fields=None,
+        order_by=None,
+    )
+    presenter.present_error.assert_called_once_with(
+        code=400, message="Valor inválido para o filtro idade__gte: 'abc'"
+    )
+
+
+def test_get_by_id_with_fields(controller, use_cases, event):
+    event.http_method = HTTPMethod.GET
+    event.path_parameters = {"id": "123"}
+    event.query_parameters = {"fields": "nome"}
+
+    controller.dispatch(event)
+
+    use_cases["get"].execute.assert_called_once_with("123", fields=["nome"])
+
+
+def test_get_by_id_with_unknown_field(controller, use_cases, event, presenter):
+    event.http_method = HTTPMethod.GET
+    event.path_parameters = {"id": "123"}
+    event.query_parameters = {"fields": "senha"}
+    use_cases["get"].execute.side_effect = ValueError(
+        "Campos inválidos: senha"
+    )
+
+    response = controller.dispatch(event)
+
+    presenter.present_error.assert_called_once_with(
+        code=400, message="Campos inválidos: senha"
+    )
+    assert response == presenter.present_error.return_value
+
+
+def _caching_controller(use_cases, **options):
+    return EntityController(
+        list_use_case=use_cases["list"],
+        get_use_case=use_cases["get"],
+        delete_use_case=use_cases["delete"],
+        update_use_case=use_cases["update"],
+        create_use_case=use_cases["create"],
+        presenter=EntityPresenter(),
+        **options,
+    )
+
+
+def test_get_sets_etag_from_body_and_answers_304(use_cases, event):
+    controller = _caching_controller(use_cases, cache_control="max-age=30")
+    event.path_parameters = {"id": "123"}
+    use_cases["get"].execute.return_value = BaseEntity(id="123")
+
+    response = controller.dispatch(event)
+    etag = response.headers["ETag"]
+
+    assert response.status_code == HTTPStatus.OK
+    assert etag == ETagHelper.from_body(response.json_body())
+    assert response.headers["Cache-Control"] == "max-age=30"
+
+    event.headers = {"if-none-match": etag}
+    not_modified = controller.dispatch(event)
+
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert not_modified.body is None
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.headers["Cache-Control"] == "max-age=30"
+
+
+def test_get_with_data_version_skips_query_on_match(use_cases, event):
+    versions = iter(["v1", "v1", "v2"])
+    controller = _caching_controller(
+        use_cases,
+        cache_control={"/entities": "no-cache"},
+        data_version=lambda: next(versions),
+    )
+    event.resource = "/entities"
+    use_cases["list"].execute.return_value = []
+
+    first = controller.dispatch(event)
+    event.headers = {"If-None-Match": first.headers["ETag"]}
+    second = controller.dispatch(event)
+    third = controller.dispatch(event)
+
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert second.status_code == HTTPStatus.NOT_MODIFIED
+    assert third.status_code == HTTPStatus.OK
+    assert third.headers["ETag"] != first.headers["ETag"]
+    assert use_cases["list"].execute.call_count == 2  # noqa: PLR2004
+
+
+def test_get_etag_depends_on_query(use_cases, event):
+    controller = _caching_controller(use_cases, data_version=lambda: "v1")
+    event.resource = "/entities"
+    use_cases["list"].execute.return_value = []
+
+    event.query_parameters = {"nome": "Ana"}
+    first = controller.dispatch(event)
+    event.query_parameters = {"nome": "Bia"}
+    event.headers = {"If-None-Match": first.headers["ETag"]}
+    second = controller.dispatch(event)
+
+    assert second.status_code == HTTPStatus.OK
+    assert second.headers["ETag"] != first.headers["ETag"]
+
+
+def test_get_errors_have_no_etag(use_cases, event):
+    controller = _caching_controller(use_cases, cache_control="max-age=30")
+    event.path_parameters = {"id": "999"}
+    use_cases["get"].execute.return_value = None
+
+    response = controller.dispatch(event)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert "ETag" not in response.headers
+    assert "Cache-Control" not in response.headers
@@ -0,0 +1,257 @@
+from http import HTTPMethod, HTTPStatus
+
+import pytest
+
+from dojocommons.application.use_cases.create_entity_use_case import (
+    CreateEntityUseCase,
+)
+from dojocommons.application.use_cases.delete_entity_use_case import (
+    DeleteEntityUseCase,
+)
+from dojocommons.application.use_cases.get_entity_use_case import (
+    GetEntityUseCase,
+)
+from dojocommons.application.use_cases.list_entities_use_case import (
+    ListEntitiesUseCase,
+)
+from dojocommons.application.use_cases.update_entity_use_case import (
+    UpdateEntityUseCase,
+)
+from dojocommons.interface_adapters.controllers.base_controller import (
+    BaseController,
+)
+from dojocommons.interface_adapters.controllers.entity_controller import (
+    EntityController,
+)
+from dojocommons.interface_adapters.controllers.router import Router
+from dojocommons.interface_adapters.dtos.base_event import BaseEvent
+from dojocommons.interface_adapters.presenters.base import EntityPresenter
+from tests.fakes import FakeDojoEntity
+
+
+@pytest.fixture
+def controllers(mocker):
+    return {
+        name: mocker.Mock(spec=BaseController)
+        for name in ("alunos", "ranking", "dojo_alunos")
+    }
+
+
+@pytest.fixture
+def factories(mocker, controllers):
+    return {
+        name: mocker.Mock(return_value=controller)
+        for name, controller in controllers.items()
+    }
+
+
+@pytest.fixture
+def router(presenter, factories):
+    router = Router(presenter)
+    router.register("/alunos", factories["alunos"])
+    router.register("/dojos/{dojo_id}/alunos", factories["dojo_alunos"])
+    router.register("/alunos/ranking", factories["ranking"])
+    return router
+
+
+def _event(resource, path=None, **fields):
+    return BaseEvent(
+        resource=resource,
+        http_method=HTTPMethod.GET,  # type: ignore[call-arg]
+        path=path,
+        **fields,
+    )
+
+
+def test_controllers_are_built_lazily_once(router, factories, controllers):
+    assert not any(factory.called for factory in factories.values())
+
+    router.dispatch(_event("/alunos"))
+    router.dispatch(_event("/alunos/{id}", path_parameters={"id": "1"}))
+
+    factories["alunos"].assert_called_once_with()
+    factories["ranking"].assert_not_called()
+    factories["dojo_alunos"].assert_not_called()
+    assert controllers["alunos"].dispatch.call_count == 2  # noqa: PLR2004
+
+
+def test_resource_template_is_passed_through(router, controllers):
+    event = _event("/alunos/{id}", path_parameters={"id": "1"})
+
+    response = router.dispatch(event)
+
+    controllers["alunos"].dispatch.assert_called_once_with(event)
+    assert response == controllers["alunos"].dispatch.return_value
+
+
+@pytest.mark.parametrize(
+    ("path", "name", "expected"),
+    [
+        ("/alunos", "alunos", ("/alunos", None)),
+        ("/alunos/", "alunos", ("/alunos", None)),
+        ("/alunos/42", "alunos", ("/alunos/{id}", {"id": "42"})),
+        ("/alunos/ranking", "ranking", ("/alunos/ranking", None)),
+        (
+            "/alunos/ranking/3",
+            "ranking",
+            ("/alunos/ranking/{id}", {"id": "3"}),
+        ),
+    ],
+)
+def test_concrete_paths_use_route_table(
+    router, controllers, path, name, expected
+):
+    router.dispatch(_event("/{proxy+}", path=path))
+
+    routed = controllers[name].dispatch.call_args.args[0]
+    assert (routed.resource, routed.path_parameters) == expected
+
+
+def test_nested_path_parameters_become_filters(router, controllers):
+    router.dispatch(
+        _event(
+            "/{proxy+}",
+            path="/dojos/7/alunos/3",
+            query_parameters={"fields": "name"},
+        )
+    )
+
+    routed = controllers["dojo_alunos"].dispatch.call_args.args[0]
+    assert routed.resource == "/dojos/{dojo_id}/alunos/{id}"
+    assert routed.path_parameters == {"dojo_id": "7", "id": "3"}
+    assert routed.query_parameters == {"fields": "name", "dojo_id": "7"}
+
+
+@pytest.mark.parametrize("path", ["/professores", "/dojos/7", "/alunos/1/2"])
+def test_unknown_resource_returns_404(router, presenter, path):
+    response = router.dispatch(_event("/{proxy+}", path=path))
+
+    presenter.present_error.assert_called_once_with(
+        code=HTTPStatus.NOT_FOUND, message=f"Recurso não encontrado: {path}"
+    )
+    assert response == presenter.present_error.return_value
+
+
+def test_register_rejects_duplicates_and_reserved_id(router, mocker):
+    with pytest.raises(ValueError, match="Recurso já registrado: /alunos"):
+        router.register("alunos/", mocker.Mock())
+    with pytest.raises(ValueError, match="reservado para o item"):
+        router.register("/turmas/{id}/alunos", mocker.Mock())
+
+
+def test_routes_nested_list_into_entity_controller(use_cases, presenter):
+    router = Router(presenter)
+    router.register(
+        "/dojos/{dojo_id}/alunos",
+        lambda: EntityController(
+            list_use_case=use_cases["list"],
+            get_use_case=use_cases["get"],
+            delete_use_case=use_cases["delete"],
+            update_use_case=use_cases["update"],
+            create_use_case=use_cases["create"],
+            presenter=presenter,
+        ),
+    )
+
+    router.dispatch(
+        _event("/dojos/{dojo_id}/alunos", path_parameters={"dojo_id": "7"})
+    )
+
+    use_cases["list"].execute.assert_called_once_with(
+        {"dojo_id": "7"}, fields=None, order_by=None
+    )
+    use_cases["get"].execute.assert_not_called()
+
+
+@pytest.fixture
+def dojo_router(make_repo):
+    repository = make_repo(model_class=FakeDojoEntity, table_name="alunos")
+    repository.create_many(
+        [
+            FakeDojoEntity(id="a1", dojo_id="A", name="Ana"),
+            FakeDojoEntity(id="b1", dojo_id="B", name="Bruno"),
+        ]
+    )
+    router = Router()
+    router.register(
+        "/dojos/{dojo_id}/alunos",
+        lambda: EntityController(
+            list_use_case=ListEntitiesUseCase(repository),
+            get_use_case=GetEntityUseCase(repository),
+            delete_use_case=DeleteEntityUseCase(repository),
+            update_use_case=UpdateEntityUseCase(repository),
+            create_use_case=CreateEntityUseCase(repository),
+            presenter=EntityPresenter(),
+        ),
+    )
+    return router, repository
+
+
+@pytest.mark.parametrize(
+    ("method", "body"),
+    [
+        (HTTPMethod.GET, None),
+        (HTTPMethod.PUT, '{"name": "Invasor"}'),
+        (HTTPMethod.DELETE, None),
+    ],
+)
+def test_nested_item_of_other_parent_is_not_found(dojo_router, method, body):
+    router, repository = dojo_router
+    event = _event(
+        "/dojos/{dojo_id}/alunos/{id}",
+        path="/dojos/A/alunos/b1",
+        path_parameters={"dojo_id": "A", "id": "b1"},
+    )
+    event.http_method = method
+    event.body = body
+
+    response = router.dispatch(event)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert repository.find_by_id("b1") == FakeDojoEntity(
+        id="b1", dojo_id="B", name="Bruno"
+    )
+
+
+def test_nested_item_of_same_parent_is_served(dojo_router):
+    router, repository = dojo_router
+
+    found = router.dispatch(_event("/", path="/dojos/B/alunos/b1"))
+    deleted = _event("/", path="/dojos/B/alunos/b1/")
+    deleted.http_method = HTTPMethod.DELETE
+
+    assert found.status_code == HTTPStatus.OK
+    assert found.body == {"data": repository.find_by_id("b1")}
+    assert router.dispatch(deleted).status_code == HTTPStatus.NO_CONTENT
+    assert repository.find_by_id("b1") is None
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "path_parameters"),
+    [
+        (HTTPMethod.PUT, "/dojos/A/alunos/a1", {"dojo_id": "A", "id": "a1"}),
+        (HTTPMethod.POST, "/dojos/A/alunos", {"dojo_id": "A"}),
+    ],
+)
+def test_nested_write_cannot_move_entity_to_other_parent(
+    dojo_router, method, path, path_parameters
+):
+    router, repository = dojo_router
+    resource = "/dojos/{dojo_id}/alunos"
+    event = _event(
+        f"{resource}/{{id}}" if "id" in path_parameters else resource,
+        path=path,
+        path_parameters=path_parameters,
+    )
+    event.http_method = method
+    event.body = '{"id": "a1", "dojo_id": "B", "name": "Ana"}'
+
+    response = router.dispatch(event)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.body["error"]["message"] == (
+        "O campo dojo_id não corresponde ao caminho."
+    )
+    assert repository.find_by_id("a1") == FakeDojoEntity(
+        id="a1", dojo_id="A", name="Ana"
+    )
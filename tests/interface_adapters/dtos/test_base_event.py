@@ -0,0 +1,134 @@
+import base64
+from http import HTTPMethod
+
+import pytest
+from pydantic import Field, ValidationError
+
+from dojocommons.interface_adapters.dtos.base_event import BaseEvent
+from tests.fakes import FakeEntity
+
+REST_EVENT = {
+    "resource": "/alunos/{id}",
+    "path": "/alunos/1",
+    "httpMethod": "PUT",
+    "headers": {"Content-Type": "application/json"},
+    "multiValueHeaders": {"Content-Type": ["application/json"]},
+    "queryStringParameters": {"fields": "name"},
+    "multiValueQueryStringParameters": {"fields": ["name"]},
+    "pathParameters": {"id": "1"},
+    "requestContext": {"requestId": "abc", "identity": {"sourceIp": "::1"}},
+    "body": '{"id": "1", "name": "Ana"}',
+    "isBase64Encoded": False,
+}
+
+HTTP_API_EVENT = {
+    "version": "2.0",
+    "routeKey": "GET /alunos/{id}",
+    "rawPath": "/alunos/1",
+    "rawQueryString": "fields=name",
+    "cookies": ["session=1"],
+    "headers": {"accept-encoding": "gzip"},
+    "queryStringParameters": {"fields": "name"},
+    "pathParameters": {"id": "1"},
+    "requestContext": {
+        "http": {"method": "GET", "path": "/alunos/1"},
+        "requestId": "abc",
+    },
+    "isBase64Encoded": False,
+}
+
+
+def test_from_api_gateway_rest_payload():
+    event = BaseEvent.from_api_gateway(REST_EVENT)
+
+    assert event == BaseEvent.model_validate(REST_EVENT)
+    assert event.http_method is HTTPMethod.PUT
+    assert event.path_parameters == {"id": "1"}
+
+
+def test_from_api_gateway_http_api_payload():
+    event = BaseEvent.from_api_gateway(HTTP_API_EVENT)
+
+    assert event.resource == "/alunos/{id}"
+    assert event.path == "/alunos/1"
+    assert event.http_method is HTTPMethod.GET
+    assert event.query_parameters == {"fields": "name"}
+    assert event.path_parameters == {"id": "1"}
+    assert event.body is None
+    assert event.get_header("Accept-Encoding") == "gzip"
+
+
+class TenantEvent(BaseEvent):
+    tenant: str | None = None
+    request_context: dict = Field(alias="requestContext", default_factory=dict)
+
+
+def test_from_api_gateway_fills_subclass_fields():
+    event = TenantEvent.from_api_gateway(REST_EVENT)
+
+    assert isinstance(event, TenantEvent)
+    assert event.tenant is None
+    assert event.request_context["requestId"] == "abc"
+    assert event.resource == "/alunos/{id}"
+    assert event.json_body() == {"id": "1", "name": "Ana"}
+    assert TenantEvent.from_api_gateway(HTTP_API_EVENT).path == "/alunos/1"
+
+
+def test_from_api_gateway_default_route_uses_path():
+    event = BaseEvent.from_api_gateway(
+        {**HTTP_API_EVENT, "routeKey": "$default"}
+    )
+
+    assert event.resource == "/alunos/1"
+
+
+def test_from_api_gateway_decodes_base64_body():
+    body = base64.b64encode('{"name": "Zé"}'.encode()).decode()
+
+    event = BaseEvent.from_api_gateway(
+        {**REST_EVENT, "body": body, "isBase64Encoded": True}
+    )
+
+    assert event.json_body() == {"name": "Zé"}
+
+
+def test_json_body_is_decoded_once(mocker):
+    event = BaseEvent.from_api_gateway(REST_EVENT)
+    from_json = mocker.patch(
+        "dojocommons.interface_adapters.dtos.base_event.from_json",
+        return_value={"id": "1"},
+    )
+
+    assert event.json_body() is event.json_body()
+    from_json.assert_called_once_with(REST_EVENT["body"])
+
+
+def test_json_body_without_body():
+    assert BaseEvent.from_api_gateway(HTTP_API_EVENT).json_body() is None
+
+
+def test_json_body_invalid():
+    event = BaseEvent.from_api_gateway({**REST_EVENT, "body": "{id"})
+
+    with pytest.raises(ValueError, match="key must be a string"):
+        event.json_body()
+
+
+def test_parse_body_validates_into_model():
+    event = BaseEvent.from_api_gateway(REST_EVENT)
+
+    assert event.parse_body(FakeEntity) == FakeEntity(id="1", name="Ana")
+
+
+def test_parse_body_errors():
+    invalid = BaseEvent.from_api_gateway({**REST_EVENT, "body": '{"id": 1}'})
+
+    with pytest.raises(ValidationError):
+        invalid.parse_body(FakeEntity)
+    with pytest.raises(ValueError, match="Corpo da requisição ausente"):
+        BaseEvent.from_api_gateway(HTTP_API_EVENT).parse_body(FakeEntity)
+
+
+def test_from_api_gateway_rejects_unknown_method():
+    with pytest.raises(ValueError, match="Método HTTP inválido: FETCH"):
+        BaseEvent.from_api_gateway({**REST_EVENT, "httpMethod": "FETCH"})
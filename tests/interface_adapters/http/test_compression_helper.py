@@ -0,0 +1,77 @@
+import gzip
+
+import pytest
+
+from dojocommons.interface_adapters.http import compression_helper
+from dojocommons.interface_adapters.http.compression_helper import (
+    CompressionHelper,
+)
+
+
+@pytest.fixture
+def without_brotli(mocker):
+    mocker.patch.object(compression_helper, "brotli", None)
+
+
+@pytest.fixture
+def with_brotli(mocker):
+    fake = mocker.Mock()
+    fake.compress.side_effect = lambda data, **_options: b"br:" + data
+    mocker.patch.object(compression_helper, "brotli", fake)
+    return fake
+
+
+@pytest.mark.usefixtures("without_brotli")
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, GZIP", "gzip"),
+        ("br", None),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("*, gzip;q=0", None),
+        ("gzip;q=abc", None),
+    ],
+)
+def test_negotiate_without_brotli(accept_encoding, expected):
+    assert CompressionHelper.negotiate(accept_encoding) == expected
+
+
+@pytest.mark.usefixtures("with_brotli")
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("gzip", "gzip"),
+        ("*", "br"),
+    ],
+)
+def test_negotiate_with_brotli(accept_encoding, expected):
+    assert CompressionHelper.negotiate(accept_encoding) == expected
+
+
+def test_compress_gzip_is_deterministic():
+    data = b'{"data": []}' * 100
+
+    compressed = CompressionHelper.compress(data, "gzip")
+
+    assert gzip.decompress(compressed) == data
+    assert compressed == CompressionHelper.compress(data, "gzip")
+
+
+def test_compress_brotli(with_brotli):
+    assert CompressionHelper.compress(b"abc", "br") == b"br:abc"
+    with_brotli.compress.assert_called_once_with(
+        b"abc", quality=CompressionHelper.BROTLI_QUALITY
+    )
+
+
+@pytest.mark.usefixtures("without_brotli")
+def test_compress_unsupported_encoding():
+    with pytest.raises(ValueError, match="Codificação não suportada: br"):
+        CompressionHelper.compress(b"abc", "br")
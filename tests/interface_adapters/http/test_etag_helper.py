@@ -0,0 +1,37 @@
+import pytest
+
+from dojocommons.interface_adapters.http.etag_helper import ETagHelper
+
+
+def test_from_body_is_strong_and_stable():
+    etag = ETagHelper.from_body(b'{"data":[]}')
+
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+    assert etag == ETagHelper.from_body(b'{"data":[]}')
+    assert etag != ETagHelper.from_body(b'{"data":[1]}')
+
+
+def test_from_parts_depends_on_every_part():
+    etag = ETagHelper.from_parts("v1", "/alunos", {"faixa": "azul"})
+
+    assert etag == ETagHelper.from_parts("v1", "/alunos", {"faixa": "azul"})
+    assert etag != ETagHelper.from_parts("v2", "/alunos", {"faixa": "azul"})
+    assert etag != ETagHelper.from_parts("v1", "/alunos", {"faixa": "roxa"})
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ('"xyz"', False),
+        ("*", True),
+    ],
+)
+def test_matches(if_none_match, expected):
+    assert ETagHelper.matches(if_none_match, '"abc"') is expected
+    assert ETagHelper.matches(if_none_match, 'W/"abc"') is expected
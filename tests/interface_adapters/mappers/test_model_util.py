@@ -3,7 +3,7 @@ import datetime
 from typing import Optional
 
 from dojocommons.interface_adapters.mappers.model_util import ModelUtil
-from tests.fakes import FakeModel
+from tests.fakes import FakeDojoEntity, FakeModel
 
 
 def test_pydantic_type_to_sql_basic_types():
@@ -77,3 +77,24 @@ def test_nullable_fields():
     sql = ModelUtil.generate_create_table_sql(FakeModel)
 
     assert "idade INTEGER NULL" in sql  # idade é Optional[int]
+
+
+def test_projection_model_serializes_only_projected_fields():
+    projection = ModelUtil.projection_model(FakeModel, ("id", "nome"))
+
+    model = projection.model_validate({"id": "1", "nome": "Rodrigo"})
+
+    assert isinstance(model, FakeModel)
+    assert model.model_dump() == {"id": "1", "nome": "Rodrigo"}
+    assert ModelUtil.projection_model(FakeModel, ("id", "nome")) is projection
+
+
+def test_indexed_fields():
+    assert ModelUtil.indexed_fields(FakeDojoEntity) == ["dojo_id"]
+    assert ModelUtil.indexed_fields(FakeModel) == []
+
+
+def test_generate_create_index_sql():
+    assert ModelUtil.generate_create_index_sql(FakeDojoEntity, "alunos") == [
+        "CREATE INDEX IF NOT EXISTS idx_alunos_dojo_id ON alunos (dojo_id);"
+    ]
@@ -1,8 +1,20 @@
+import base64
+import datetime
+import gzip
+import json
+
 import pytest
+from pydantic_core import PydanticSerializationError
 
+from dojocommons.domain.value_objects.page import Page
+from dojocommons.infrastructure.repositories.columnar_result import (
+    ColumnarResult,
+)
 from dojocommons.interface_adapters.dtos.response import Response
+from dojocommons.interface_adapters.http import compression_helper
 from dojocommons.interface_adapters.http.cors_helper import CORSHelper
 from dojocommons.interface_adapters.presenters.base import EntityPresenter
+from tests.fakes import FakeEntity, FakeModel
 
 
 @pytest.mark.parametrize(
@@ -69,3 +81,175 @@ def test_present_error():
     )
 
     assert response == expected
+
+
+def test_present_page():
+    presenter = EntityPresenter()
+
+    result = presenter.present_page(
+        Page(items=[{"id": "1"}], next_cursor="abc")
+    )
+
+    assert result == Response(
+        status_code=200,
+        headers=CORSHelper.get_cors_headers(),
+        body={"data": [{"id": "1"}], "next_cursor": "abc"},
+    )
+
+
+def test_responses_do_not_share_cors_headers():
+    presenter = EntityPresenter()
+    first = presenter.present({"id": "1"})
+    output = first.to_api_gateway()
+
+    output["headers"]["Set-Cookie"] = "sessao=1"
+    first.headers["X-Id"] = "1"
+
+    second = presenter.present_error(404, "não encontrado")
+    assert second.headers == CORSHelper.get_cors_headers()
+    assert second.to_api_gateway()["headers"] == CORSHelper.get_cors_headers()
+    assert "Set-Cookie" not in first.headers
+    with pytest.raises(TypeError):
+        CORSHelper.DEFAULT_HEADERS["X-Id"] = "1"  # type: ignore[index]
+
+
+def test_present_preflight():
+    presenter = EntityPresenter()
+
+    response = presenter.present_preflight()
+
+    assert response.to_api_gateway() == {
+        "statusCode": 204,
+        "headers": CORSHelper.get_cors_headers(),
+        "body": "",
+        "isBase64Encoded": False,
+    }
+
+
+def test_to_api_gateway_serializes_entities_once(mocker):
+    entity = FakeModel(
+        id="1",
+        nome="Rodrigo",
+        ativo=True,
+        criado_em=datetime.datetime(2024, 1, 2, 3, 4, 5),  # noqa: DTZ001
+    )
+    dumps = mocker.patch("json.dumps")
+    model_dump = mocker.spy(FakeModel, "model_dump")
+
+    result = (
+        EntityPresenter().present_page(Page(items=[entity])).to_api_gateway()
+    )
+
+    assert result["statusCode"] == 200  # noqa: PLR2004
+    assert result["headers"] == CORSHelper.get_cors_headers()
+    assert result["body"] == (
+        '{"data":[{"id":"1","nome":"Rodrigo","idade":null,"ativo":true,'
+        '"criado_em":"2024-01-02T03:04:05"}],"next_cursor":null}'
+    )
+    dumps.assert_not_called()
+    model_dump.assert_not_called()
+
+
+def test_add_cors_headers_keeps_defaults_untouched():
+    response = Response(status_code=200, headers={"X-Id": "1"})
+
+    CORSHelper.add_cors_headers(response)
+
+    assert response.headers == {"X-Id": "1", **CORSHelper.get_cors_headers()}
+    assert "X-Id" not in CORSHelper.DEFAULT_HEADERS
+
+
+def test_to_api_gateway_compresses_large_bodies(mocker):
+    mocker.patch.object(compression_helper, "brotli", None)
+    items = [{"id": str(i), "nome": "Aluno"} for i in range(100)]
+    response = EntityPresenter().present(items)
+
+    result = response.to_api_gateway(accept_encoding="gzip, deflate")
+
+    assert result["isBase64Encoded"] is True
+    assert result["headers"]["Content-Encoding"] == "gzip"
+    assert result["headers"]["Vary"] == "Accept-Encoding"
+    body = gzip.decompress(base64.b64decode(result["body"]))
+    assert json.loads(body) == {"data": items}
+    assert "Content-Encoding" not in CORSHelper.DEFAULT_HEADERS
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "min_size", "vary"),
+    [
+        ("gzip", 10_000, False),
+        (None, 10, True),
+        ("identity", 10, True),
+    ],
+)
+def test_to_api_gateway_keeps_plain_body(accept_encoding, min_size, vary):
+    response = EntityPresenter().present({"id": "1"})
+
+    result = response.to_api_gateway(
+        accept_encoding=accept_encoding, min_size=min_size
+    )
+
+    assert result["isBase64Encoded"] is False
+    assert result["body"] == '{"data":{"id":"1"}}'
+    assert "Content-Encoding" not in result["headers"]
+    assert ("Vary" in result["headers"]) is vary
+
+
+def test_present_not_modified():
+    response = EntityPresenter().present_not_modified('"abc"', "max-age=60")
+
+    assert response.to_api_gateway() == {
+        "statusCode": 304,
+        "headers": {
+            **CORSHelper.get_cors_headers(),
+            "ETag": '"abc"',
+            "Cache-Control": "max-age=60",
+            "Vary": "Accept-Encoding",
+        },
+        "body": "",
+        "isBase64Encoded": False,
+    }
+
+
+def test_to_api_gateway_weakens_etag_when_compressing():
+    response = EntityPresenter().present([{"id": str(i)} for i in range(100)])
+    response.headers = {**response.headers, "ETag": '"abc"'}
+
+    compressed = response.to_api_gateway(accept_encoding="gzip")
+    plain = response.to_api_gateway()
+
+    assert compressed["headers"]["ETag"] == 'W/"abc"'
+    assert plain["headers"]["ETag"] == '"abc"'
+
+
+def test_not_modified_sends_the_etag_of_the_compressed_ok():
+    ok = EntityPresenter().present([{"id": str(i)} for i in range(100)])
+    ok.headers = {**ok.headers, "ETag": '"abc"'}
+    not_modified = EntityPresenter().present_not_modified('"abc"')
+
+    compressed = ok.to_api_gateway(accept_encoding="gzip")
+    revalidated = not_modified.to_api_gateway(accept_encoding="gzip")
+
+    assert compressed["headers"]["Content-Encoding"] == "gzip"
+    assert revalidated["headers"]["ETag"] == compressed["headers"]["ETag"]
+    assert revalidated["headers"]["Vary"] == "Accept-Encoding"
+    assert not_modified.to_api_gateway()["headers"]["ETag"] == '"abc"'
+
+
+def test_present_serializes_columnar_result_by_rows():
+    pa = pytest.importorskip("pyarrow")
+    result = ColumnarResult(
+        pa.table({"id": ["1", "2"], "name": ["Ana", "Bia"]}), FakeEntity
+    )
+
+    response = EntityPresenter().present(result).to_api_gateway()
+
+    assert response["statusCode"] == 200  # noqa: PLR2004
+    assert json.loads(response["body"]) == {
+        "data": [{"id": "1", "name": "Ana"}, {"id": "2", "name": "Bia"}]
+    }
+
+
+def test_json_body_rejects_other_unknown_types():
+    with pytest.raises(PydanticSerializationError, match="object"):
+        Response(status_code=200, body={"data": object()}).json_body()